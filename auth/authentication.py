@@ -1,5 +1,6 @@
 # auth/authentication.py
 from typing import Optional, Tuple, Dict
+import time
 import sys
 import os
 
@@ -8,6 +9,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import get_db_manager
 from auth.password_handler import hash_password, verify_password
 from config.settings import PASSWORD_MIN_LENGTH
+from utils.metrics import get_metrics
+
+LOGIN_SECONDS = get_metrics().histogram(
+    "game_hub_login_seconds", "Time to check a login, including password verification.", ("result",))
 
 
 class AuthenticationManager:
@@ -43,6 +48,12 @@ class AuthenticationManager:
             return False, "Registration failed. Please try again."
     
     def login_user(self, username: str, password: str) -> Tuple[bool, str, Optional[Dict]]:
+        start = time.perf_counter()
+        result = self._login_user(username, password)
+        LOGIN_SECONDS.observe(time.perf_counter() - start, result="success" if result[0] else "failure")
+        return result
+    
+    def _login_user(self, username: str, password: str) -> Tuple[bool, str, Optional[Dict]]:
         if not username or not password:
             return False, "Please enter both username and password", None
         
@@ -0,0 +1,92 @@
+# benchmarks/bench_leaderboard.py
+"""
+Benchmarks leaderboard paging on a large score table.
+
+Fills a temporary database with random scores, then times page fetches at
+increasing depths with the board indexes against the same query without
+them, and replays a scroll from top to bottom through a PageCache to show
+that the rows held stay bounded.
+
+Usage:
+    python benchmarks/bench_leaderboard.py [--scores 100000] [--users 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import LEADERBOARD_PAGE_SIZE, LEADERBOARD_CACHED_PAGES
+from database.db_manager import DatabaseManager
+from utils.page_cache import PageCache
+
+GAME = "Maze Path Game"
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+
+
+def fill(db, scores, users, seed=0):
+    rng = random.Random(seed)
+    with db.get_connection() as conn:
+        conn.executemany("INSERT INTO users (username, password_hash) VALUES (?, 'x')",
+                         [(f"player{i}",) for i in range(users)])
+        conn.executemany(
+            "INSERT INTO game_scores (user_id, game_name, score, difficulty) VALUES (?, ?, ?, ?)",
+            [(rng.randint(1, users), GAME, rng.randint(0, 5000), rng.choice(DIFFICULTIES)) for _ in range(scores)])
+        conn.commit()
+
+
+def time_pages(db, total, difficulty, repeats=5):
+    """ms per page fetch at the top, middle and bottom of the board."""
+    out = []
+    for offset in (0, total // 2, max(0, total - LEADERBOARD_PAGE_SIZE)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            rows = db.get_leaderboard_page(GAME, difficulty, offset, LEADERBOARD_PAGE_SIZE)
+        out.append(((time.perf_counter() - start) * 1000 / repeats, len(rows)))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Leaderboard paging benchmark")
+    parser.add_argument("--scores", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"))
+        start = time.perf_counter()
+        fill(db, args.scores, args.users)
+        print(f"{args.scores} scores inserted in {time.perf_counter() - start:.1f}s")
+
+        total = db.count_leaderboard(GAME)
+        hard = db.count_leaderboard(GAME, "Hard")
+        print(f"count: all {total}, Hard {hard}")
+
+        print(f"\n{'':>22} {'top':>8} {'middle':>8} {'bottom':>8}   (ms per {LEADERBOARD_PAGE_SIZE}-row page)")
+        for label, difficulty, count in (("indexed, all", None, total), ("indexed, Hard", "Hard", hard)):
+            print(f"{label:>22} " + " ".join(f"{ms:8.2f}" for ms, _ in time_pages(db, count, difficulty)))
+
+        with db.get_connection() as conn:
+            conn.execute("DROP INDEX idx_game_scores_board")
+            conn.execute("DROP INDEX idx_game_scores_board_difficulty")
+        print(f"{'no index, all':>22} " + " ".join(f"{ms:8.2f}" for ms, _ in time_pages(db, total, None, repeats=2)))
+
+        # Scroll the whole board one screen at a time, as the panel would
+        cache = PageCache(LEADERBOARD_PAGE_SIZE, LEADERBOARD_CACHED_PAGES)
+        db.initialize_database()
+        visible, fetched, peak_rows = 20, 0, 0
+        start = time.perf_counter()
+        for top in range(0, total - visible, visible):
+            for page in cache.missing_pages(top, top + visible - 1):
+                cache.put(page, db.get_leaderboard_page(GAME, None, page * LEADERBOARD_PAGE_SIZE, LEADERBOARD_PAGE_SIZE))
+                fetched += 1
+            peak_rows = max(peak_rows, sum(len(p) for p in cache.pages.values()))
+        print(f"\nFull scroll: {fetched} page fetches in {time.perf_counter() - start:.2f}s, "
+              f"peak rows held {peak_rows} of {total}")
+
+
+if __name__ == "__main__":
+    main()
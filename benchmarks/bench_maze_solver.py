@@ -0,0 +1,86 @@
+# benchmarks/bench_maze_solver.py
+"""
+Benchmarks the maze solver engine against a plain BFS over the grid.
+
+Usage:
+    python benchmarks/bench_maze_solver.py [--sizes 20 101 301] [--repeat 5]
+"""
+import argparse
+import sys
+import os
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games import maze_solver
+from games.maze_generator import generate_maze
+
+
+def time_call(func, repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def baseline_bfs(maze, start, end):
+    """Shortest path length by plain BFS over the list-of-lists grid."""
+    rows, cols = len(maze), len(maze[0])
+    queue = deque([(start[0], start[1], 0)])  # (row, col, distance)
+    visited = {start}
+
+    while queue:
+        r, c, dist = queue.popleft()
+        if (r, c) == end:
+            return dist
+        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0 and (nr, nc) not in visited:
+                visited.add((nr, nc))
+                queue.append((nr, nc, dist + 1))
+
+    return float('inf')
+
+
+def run(sizes, repeat: int) -> None:
+    header = f"{'size':>6} {'baseline':>10} {'bi-bfs':>10} {'a*':>10} {'frontier':>10} {'fill':>10}  moves"
+    print(header)
+    print("-" * len(header))
+
+    for size in sizes:
+        maze = generate_maze(size, size, seed=size)
+        start, end = (0, 0), (size - 1, size - 1)
+        compact = maze_solver.CompactMaze.from_grid(maze)
+
+        optimal = baseline_bfs(maze, start, end)
+        assert maze_solver.shortest_path_length(compact, start, end) == optimal
+        assert len(maze_solver.astar(compact, start, end)) - 1 == optimal
+
+        baseline = time_call(lambda: baseline_bfs(maze, start, end), repeat)
+        bibfs = time_call(lambda: maze_solver.bidirectional_bfs(compact, start, end), repeat)
+        astar = time_call(lambda: maze_solver.astar(compact, start, end), repeat)
+        fill = time_call(lambda: maze_solver.dead_end_fill(compact, start, end), repeat)
+        if maze_solver.np is not None:
+            frontier = f"{time_call(lambda: maze_solver.frontier_distance(compact, start, end, True), repeat):10.2f}"
+        else:
+            frontier = f"{'n/a':>10}"
+
+        print(f"{size:>6} {baseline:10.2f} {bibfs:10.2f} {astar:10.2f} {frontier} {fill:10.2f}  {optimal}")
+
+    print("\nTimes are best-of-%d in milliseconds." % repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 101, 301, 801])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_sequence_player.py
+"""
+Compares Simon-style sequence playback under a busy Tk loop:
+one root.after per flash/unflash at cumulative delays (the old approach)
+against SequencePlayer's single drift-corrected timer.
+
+Needs a display.
+
+Usage:
+    python benchmarks/bench_sequence_player.py [--steps 50] [--step-ms 120] [--load-ms 15]
+"""
+import argparse
+import random
+import sys
+import os
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.sequence_player import SequencePlayer
+from utils.frame_timer import FrameTimeHistogram
+
+
+def busy_load(root, load_ms, rng, state):
+    """Keeps the loop busy with handlers of random cost until stopped."""
+    if state['stop']:
+        return
+    end = time.perf_counter() + rng.uniform(0, load_ms) / 1000
+    while time.perf_counter() < end:
+        pass
+    root.after(5, busy_load, root, load_ms, rng, state)
+
+
+def run_naive(root, steps, step_ms, on_ms):
+    """Old approach: every flash and unflash queued up front at cumulative delays."""
+    jitter = FrameTimeHistogram(max_ms=250)
+    start = time.perf_counter()
+    finished = []
+
+    def event(deadline):
+        jitter.record(max(0.0, time.perf_counter() - deadline))
+
+    for i in range(steps):
+        on_at = i * step_ms
+        root.after(on_at, event, start + on_at / 1000)
+        # The old code queued each unflash from inside the flash callback
+        root.after(on_at, lambda d=start + (on_at + on_ms) / 1000: root.after(on_ms, event, d))
+    root.after(steps * step_ms, lambda: finished.append(time.perf_counter()))
+    while not finished:
+        root.update()
+    return jitter, finished[0] - start - steps * step_ms / 1000
+
+
+def run_player(root, steps, step_ms, on_ms):
+    """SequencePlayer: one pending timer, deadlines from the start time."""
+    finished = []
+    player = SequencePlayer(root, lambda item, on: None)
+    start = time.perf_counter()
+    player.play(range(steps), step_ms, on_ms, on_done=lambda: finished.append(time.perf_counter()))
+    while not finished:
+        root.update()
+    ideal_end = (steps - 1) * step_ms / 1000 + player.on_s
+    return player.jitter, finished[0] - start - ideal_end
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sequence playback jitter benchmark")
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--step-ms", type=int, default=120)
+    parser.add_argument("--load-ms", type=float, default=15.0, help="max cost of each busy handler")
+    args = parser.parse_args()
+    on_ms = int(args.step_ms * 0.625)
+
+    root = tk.Tk()
+    root.withdraw()
+    state = {'stop': False}
+    busy_load(root, args.load_ms, random.Random(0), state)
+
+    print(f"{'player':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'end drift ms':>13}")
+    for name, run in (("naive", run_naive), ("single", run_player)):
+        jitter, drift = run(root, args.steps, args.step_ms, on_ms)
+        stats = jitter.summary()
+        print(f"{name:>8} {stats['p50']:8.1f} {stats['p99']:8.1f} {stats['max']:8.1f} {drift * 1000:13.1f}")
+
+    state['stop'] = True
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
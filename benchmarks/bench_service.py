@@ -0,0 +1,194 @@
+# benchmarks/bench_service.py
+"""
+Load generator for the score service.
+
+Starts a ScoreService on a temporary database filled with random scores
+(in a thread with its own event loop), or targets a running one with --url,
+then drives it with many concurrent keep-alive clients for a fixed time.
+Each client mixes score submissions with reads of the hot top page, random
+deeper pages and player ranks. Reports throughput and latency percentiles
+per request kind, plus write batch sizes and cache hits for a local service.
+
+Usage:
+    python benchmarks/bench_service.py [--clients 50] [--seconds 10] [--write-ratio 0.2]
+    python benchmarks/bench_service.py --url http://127.0.0.1:8765
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_leaderboard import fill, GAME, DIFFICULTIES
+from service.score_server import ScoreService, BATCH_SIZE, CACHE_LOOKUPS
+from database.db_manager import DatabaseManager
+
+
+class HTTPClient:
+    """One keep-alive connection speaking just enough HTTP/1.1 for the service."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, body=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                          f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+        await self.writer.drain()
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        length = 0
+        for line in head.split(b"\r\n")[1:]:
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":", 1)[1])
+        return status, await self.reader.readexactly(length)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+
+async def client_loop(host, port, stop_at, args, users, total_scores, rng, latencies, errors):
+    client = HTTPClient(host, port)
+    try:
+        while time.perf_counter() < stop_at:
+            roll = rng.random()
+            if roll < args.write_ratio:
+                kind, method, body = "submit", "POST", {
+                    'username': rng.choice(users), 'game_name': GAME, 'score': rng.randint(0, 5000),
+                    'difficulty': rng.choice(DIFFICULTIES), 'time_taken': rng.uniform(10, 300)}
+                path = "/scores"
+            else:
+                method, body = "GET", None
+                roll = rng.random()
+                if roll < 0.6:
+                    kind, query = "top page", {'game': GAME, 'limit': 20}
+                elif roll < 0.8:
+                    kind, query = "deep page", {'game': GAME, 'difficulty': rng.choice(DIFFICULTIES),
+                                                'offset': rng.randrange(0, max(1, total_scores // 3)), 'limit': 20}
+                else:
+                    kind, query = "rank", {'game': GAME, 'username': rng.choice(users)}
+                path = "/" + ("rank" if kind == "rank" else "leaderboard") + "?" + urlencode(query)
+            start = time.perf_counter()
+            try:
+                status, _ = await client.request(method, path, body)
+            except (OSError, asyncio.IncompleteReadError):
+                errors[kind] = errors.get(kind, 0) + 1
+                client.close()
+                client = HTTPClient(host, port)
+                continue
+            latencies.setdefault(kind, []).append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                errors[kind] = errors.get(kind, 0) + 1
+    finally:
+        client.close()
+
+
+async def run_load(host, port, args, users, total_scores):
+    latencies, errors = {}, {}
+    stop_at = time.perf_counter() + args.seconds
+    await asyncio.gather(*(client_loop(host, port, stop_at, args, users, total_scores,
+                                       random.Random(i), latencies, errors)
+                           for i in range(args.clients)))
+    return latencies, errors
+
+
+def start_local_service(db_path, args):
+    """Runs a ScoreService in a background thread; returns (port, stop function)."""
+    loop = asyncio.new_event_loop()
+    service = ScoreService(db_path, pool_size=args.pool)
+    ready = threading.Event()
+    stopping = {}
+
+    async def serve():
+        stopping['event'] = asyncio.Event()
+        await service.start("127.0.0.1", 0)
+        ready.set()
+        await stopping['event'].wait()
+        await service.stop()
+
+    thread = threading.Thread(target=lambda: loop.run_until_complete(serve()), name="score-service", daemon=True)
+    thread.start()
+    ready.wait()
+
+    def stop():
+        loop.call_soon_threadsafe(stopping['event'].set)
+        thread.join(timeout=5)
+        loop.close()
+
+    return service.port, stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score service load generator")
+    parser.add_argument("--url", help="target a running service instead of starting one")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--scores", type=int, default=50000, help="scores pre-filled in the local database")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--pool", type=int, default=4, help="database threads of the local service")
+    args = parser.parse_args()
+
+    users = [f"player{i}" for i in range(args.users)]
+    tmp = None
+    stop = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+        total_scores = args.scores
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        db_path = os.path.join(tmp.name, "service.db")
+        fill(DatabaseManager(db_path), args.scores, args.users)
+        total_scores = args.scores
+        host = "127.0.0.1"
+        port, stop = start_local_service(db_path, args)
+        print(f"Local service on port {port}, {args.scores} scores, {args.users} players")
+
+    try:
+        latencies, errors = asyncio.run(run_load(host, port, args, users, total_scores))
+    finally:
+        if stop:
+            stop()
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"\n{args.clients} clients, {args.seconds:.0f}s: {total} requests, {total / args.seconds:.0f} req/s")
+    print(f"{'':>12} {'count':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for kind in sorted(set(latencies) | set(errors)):
+        values = sorted(latencies.get(kind, []))
+        print(f"{kind:>12} {len(values):8d} {percentile(values, 50):8.2f} {percentile(values, 95):8.2f} "
+              f"{percentile(values, 99):8.2f} {errors.get(kind, 0):7d}")
+
+    if not args.url:
+        batches = BATCH_SIZE.values().get((), [[], 0.0, 0])
+        if batches[2]:
+            print(f"\nWrites: {int(batches[1])} scores in {batches[2]} transactions "
+                  f"(mean batch {batches[1] / batches[2]:.1f})")
+        lookups = CACHE_LOOKUPS.values()
+        looked = sum(lookups.values())
+        if looked:
+            parts = ", ".join(f"{key[0]} {count / looked:.0%}" for key, count in sorted(lookups.items()))
+            print(f"Cache lookups: {int(looked)} ({parts})")
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
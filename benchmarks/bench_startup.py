@@ -0,0 +1,66 @@
+# benchmarks/bench_startup.py
+"""
+Time to first frame: starts ``main.py --profile-startup --exit-after-startup``
+repeatedly in fresh interpreters and reports when the login window was first
+painted, when the backend warm-up finished, and the slowest imports.
+
+Needs a display.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import os
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MARKER = "startup-json: "
+
+
+def run_once():
+    """One cold start. Returns (wall seconds, startup report dict)."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), "--profile-startup", "--exit-after-startup"],
+                          capture_output=True, text=True, cwd=ROOT, timeout=120)
+    wall = time.perf_counter() - start
+    for line in proc.stdout.splitlines():
+        if line.startswith(MARKER):
+            return wall, json.loads(line[len(MARKER):])
+    raise RuntimeError(f"no startup report (exit {proc.returncode}):\n{proc.stdout}\n{proc.stderr}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    walls, reports = [], []
+    for _ in range(args.runs):
+        wall, report = run_once()
+        walls.append(wall)
+        reports.append(report)
+
+    def median_mark(name):
+        return statistics.median(r['marks'][name] for r in reports)
+
+    def median_phase(name):
+        return statistics.median(next(p['ms'] for p in r['phases'] if p['name'] == name) for r in reports)
+
+    print(f"{args.runs} runs, medians (ms since main.py started executing)")
+    for name in ("imports", "create root window", "build login window", "auth + db init (worker)"):
+        print(f"  {name:<28} {median_phase(name):8.1f}")
+    print(f"  {'first frame':<28} {median_mark('first frame'):8.1f}   <- time to first frame")
+    print(f"  {'startup complete':<28} {median_mark('startup complete'):8.1f}")
+    print(f"  {'process wall time':<28} {statistics.median(walls) * 1000:8.1f}")
+
+    print("\nSlowest imports (last run, self ms):")
+    for entry in reports[-1].get('slowest_imports', [])[:5]:
+        print(f"  {entry['module']:<30} {entry['self_ms']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
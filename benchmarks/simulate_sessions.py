@@ -0,0 +1,205 @@
+# benchmarks/simulate_sessions.py
+"""
+Runs bot-played sessions of every game engine headlessly across a process pool.
+
+Each session is fully determined by its seed, so a surprising result can be
+reproduced with --workers 1 and the same --seed.
+
+Usage:
+    python benchmarks/simulate_sessions.py [--sessions 2000] [--workers 4]
+                                           [--games maze memory ...] [--seed 0]
+"""
+import argparse
+import random
+import statistics
+import sys
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import MEMORY_CARD_COUNTS
+from games.engines import MazeEngine, MemoryEngine, HangmanEngine, TypingEngine, SimonEngine
+from games.engines.simon_engine import PRESS_WRONG
+from games.maze_solver import CompactMaze, bidirectional_bfs
+from utils.word_corpus import get_hangman_corpus, get_typing_corpus
+
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+MEMORY_DIFFICULTIES = list(MEMORY_CARD_COUNTS)
+
+# Letters in rough English frequency order, for the Hangman bot
+LETTER_ORDER = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+
+
+def play_maze(rng):
+    """Walks the shortest path, taking a wrong turn now and then."""
+    difficulty = rng.choice(DIFFICULTIES)
+    engine = MazeEngine(difficulty, seed=rng.getrandbits(32))
+    path = bidirectional_bfs(CompactMaze.from_grid(engine.maze), engine.player, engine.end)
+    steps = [(b[0] - a[0], b[1] - a[1]) for a, b in zip(path, path[1:])]
+    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    for dr, dc in steps:
+        if rng.random() < 0.1:
+            detour = rng.choice(directions)
+            if engine.move(*detour):
+                engine.move(-detour[0], -detour[1])
+        engine.move(dr, dc)
+
+    return engine.finished, engine.compute_score(engine.moves * 0.3), engine.moves
+
+
+def play_memory(rng):
+    """Remembers the cards it has seen, but misses a known partner one time in five."""
+    difficulty = rng.choice(MEMORY_DIFFICULTIES)
+    engine = MemoryEngine(difficulty, seed=rng.getrandbits(32))
+    cards = engine.cards
+    unknown = list(range(len(cards)))
+    rng.shuffle(unknown)
+    seen = {}   # symbol id -> face-down card remembered
+    ready = []  # remembered pairs
+
+    while not engine.finished:
+        if ready:
+            first, second = ready.pop()
+        else:
+            first = unknown.pop()
+            partner = seen.pop(cards[first], None)
+            if partner is not None and (rng.random() < 0.8 or not unknown):
+                second = partner
+            else:
+                if partner is not None:
+                    seen[cards[first]] = partner
+                second = unknown.pop()
+
+        engine.reveal(first)
+        engine.reveal(second)
+        if not engine.resolve():
+            for index in (first, second):
+                other = seen.pop(cards[index], None)
+                if other is None:
+                    seen[cards[index]] = index
+                else:
+                    ready.append((other, index))
+
+    return True, engine.compute_score(engine.moves * 1.5), engine.moves
+
+
+def play_hangman(rng):
+    """Guesses letters in frequency order, skipping a few at random."""
+    engine = HangmanEngine.from_corpus(get_hangman_corpus(), seed=rng.getrandbits(32))
+    for letter in LETTER_ORDER:
+        if engine.finished:
+            break
+        if rng.random() < 0.1:
+            continue
+        engine.guess(letter)
+
+    return engine.won, engine.compute_score(len(engine.guessed_letters) * 2.0), engine.wrong_guesses
+
+
+def play_typing(rng, max_ticks=4000):
+    """Types the lowest word at a steady speed with occasional typos, for up to two simulated minutes."""
+    difficulty = rng.choice(DIFFICULTIES)
+    corpus = get_typing_corpus()
+    engine = TypingEngine(difficulty, lambda r: corpus.sample(rng=r), seed=rng.getrandbits(32))
+    engine.spawn()
+    ticks_per_key = rng.randint(4, 10)
+    keystrokes = 0
+
+    while not engine.game_over and engine.ticks < max_ticks:
+        engine.tick()
+        if engine.ticks % ticks_per_key or not engine.words:
+            continue
+
+        target = max(engine.words.values(), key=lambda w: w["y"])
+        if not target["word"].startswith(engine.current_input):
+            engine.backspace()
+        else:
+            char = target["word"][len(engine.current_input)]
+            engine.type_char(rng.choice("etaoin") if rng.random() < 0.03 else char)
+        keystrokes += 1
+
+    return not engine.game_over, engine.score, keystrokes
+
+
+def play_simon(rng):
+    """Repeats the sequence, failing with a chance that grows with its length."""
+    engine = SimonEngine(seed=rng.getrandbits(32))
+    while not engine.game_over:
+        engine.next_round()
+        for color in engine.sequence:
+            if rng.random() < 0.01 * len(engine.sequence):
+                color = next(c for c in engine.COLORS if c != color)
+            if engine.press(color) == PRESS_WRONG:
+                break
+
+    return engine.rounds_completed >= 10, engine.rounds_completed, len(engine.sequence)
+
+
+# Each player returns (succeeded, score, moves). Success means the maze or
+# board was cleared, the word was guessed, the typist survived the time limit
+# or Simon reached round 10.
+PLAYERS = {
+    "maze": play_maze,
+    "memory": play_memory,
+    "hangman": play_hangman,
+    "typing": play_typing,
+    "simon": play_simon,
+}
+
+
+def run_batch(game, seeds):
+    """Plays one session per seed. Runs in a worker process."""
+    player = PLAYERS[game]
+    return [player(random.Random(seed)) for seed in seeds]
+
+
+def simulate(game, sessions, workers, seed, batch_size=100):
+    """Returns (results, elapsed seconds) for `sessions` runs of one game."""
+    seeds = [seed * 1_000_003 + i for i in range(sessions)]
+    batches = [seeds[i:i + batch_size] for i in range(0, sessions, batch_size)]
+    results = []
+
+    start = time.perf_counter()
+    if workers <= 1:
+        for batch in batches:
+            results.extend(run_batch(game, batch))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch_results in pool.map(run_batch, [game] * len(batches), batches):
+                results.extend(batch_results)
+    return results, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000, help="sessions per game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--games", nargs="+", choices=list(PLAYERS), default=list(PLAYERS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Build the word indexes once so workers only mmap them
+    get_typing_corpus()
+    get_hangman_corpus()
+
+    header = f"{'game':>8} {'sessions/s':>11} {'ok %':>7} {'mean score':>11} {'p50 score':>10} {'mean moves':>11}"
+    print(header)
+    print("-" * len(header))
+
+    for game in args.games:
+        results, elapsed = simulate(game, args.sessions, args.workers, args.seed)
+        succeeded = [r[0] for r in results]
+        scores = [r[1] for r in results]
+        moves = [r[2] for r in results]
+        print(f"{game:>8} {len(results) / elapsed:11.0f} {100 * sum(succeeded) / len(succeeded):7.1f} "
+              f"{statistics.mean(scores):11.1f} {statistics.median(scores):10.1f} "
+              f"{statistics.mean(moves):11.1f}")
+
+    print(f"\n{args.sessions} sessions per game on {args.workers} worker(s), seed {args.seed}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,10 +35,74 @@ MAZE_SIZES = {
     "Hard": (20, 20)
 }
 
+# Game plugins: the manifest lists built-in games; installed packages can add
+# more through this entry point group. Game modules are imported while idle.
+GAMES_MANIFEST = os.path.join(BASE_DIR, "games", "manifest.json")
+GAMES_ENTRY_POINT_GROUP = "mini_game_hub.games"
+PRELOAD_GAMES = True
+
+# Database calls from the UI run on a worker thread; results are collected
+# from the Tk loop every DATA_POLL_MS while any are outstanding
+DATA_POLL_MS = 15
+
+# Event-loop lag watchdog: a heartbeat every LAG_WATCHDOG_INTERVAL_MS, and the
+# main thread's stack is captured when the loop is blocked for LAG_STALL_MS.
+# Set GAME_HUB_WATCHDOG=0 to turn it off.
+LAG_WATCHDOG = os.environ.get("GAME_HUB_WATCHDOG", "1") != "0"
+LAG_WATCHDOG_INTERVAL_MS = 50
+LAG_STALL_MS = 250
+
+# Game session profiling: GAME_HUB_PROFILE=cpu (cProfile), mem (tracemalloc)
+# or all. Reports go to SESSION_PROFILE_DIR; empty turns profiling off.
+SESSION_PROFILE = os.environ.get("GAME_HUB_PROFILE", "")
+SESSION_PROFILE_DIR = os.environ.get("GAME_HUB_PROFILE_DIR", os.path.join(BASE_DIR, "profiles"))
+SESSION_PROFILE_TOP = 25
+SESSION_PROFILE_FRAMES = 5
+
+# Metrics export (Prometheus text format): rewritten to METRICS_FILE every
+# METRICS_INTERVAL_S and/or served at http://METRICS_HOST:METRICS_PORT/metrics.
+# Both are off unless GAME_HUB_METRICS_FILE / GAME_HUB_METRICS_PORT are set.
+METRICS_FILE = os.environ.get("GAME_HUB_METRICS_FILE", "")
+METRICS_PORT = int(os.environ.get("GAME_HUB_METRICS_PORT", "0") or 0)
+METRICS_HOST = os.environ.get("GAME_HUB_METRICS_HOST", "127.0.0.1")
+METRICS_INTERVAL_S = 15
+
+# Shared score service (python -m service.score_server). Kiosks send scores
+# and read leaderboards from GAME_HUB_SCORE_SERVICE (e.g. http://host:8765)
+# instead of the local database when it is set.
+SCORE_SERVICE_URL = os.environ.get("GAME_HUB_SCORE_SERVICE", "")
+SCORE_SERVICE_HOST = "127.0.0.1"
+SCORE_SERVICE_PORT = 8765
+SCORE_SERVICE_DB_POOL = 4
+# Score writes are committed together: up to SCORE_BATCH_MAX per transaction,
+# waiting at most SCORE_BATCH_WINDOW_MS for more to arrive
+SCORE_BATCH_MAX = 200
+SCORE_BATCH_WINDOW_MS = 5
+# Leaderboard and rank responses are cached until a score for their game is
+# written, or for SCORE_CACHE_TTL_S at most
+SCORE_CACHE_TTL_S = 5.0
+SCORE_CACHE_ENTRIES = 512
+SCORE_CLIENT_TIMEOUT_S = 5.0
+
+# Leaderboard panel: rows are fetched in pages as they scroll into view and
+# only this many pages are kept in memory
+LEADERBOARD_PAGE_SIZE = 200
+LEADERBOARD_CACHED_PAGES = 6
+
+# Game animations, tweens and timers share one frame clock per game; this is
+# its frame interval while anything is animating
+FRAME_CLOCK_MS = 16
+
+# Pre-generated mazes kept ready per difficulty, and generator processes
+MAZE_POOL_SIZE = 3
+MAZE_POOL_WORKERS = 1
+
 MEMORY_CARD_COUNTS = {
     "Easy": 8,
     "Medium": 12,
-    "Hard": 16
+    "Hard": 16,
+    "Expert": 64,
+    "Giant": 256
 }
 
 HANGMAN_CATEGORIES = {
@@ -50,6 +114,17 @@ HANGMAN_CATEGORIES = {
 
 HANGMAN_MAX_ATTEMPTS = 6
 
+# Tone output: "auto" (winsound on Windows, aplay on Linux), "winsound",
+# "aplay", "wav" (write each tone to AUDIO_WAV_DIR) or "null"
+AUDIO_SINK = os.environ.get("GAME_HUB_AUDIO", "auto")
+AUDIO_WAV_DIR = os.path.join(BASE_DIR, "audio_out")
+
+# Word corpora. Sources are JSON lists (or category -> list objects) and are
+# compiled to a memory-mapped .idx file beside them on first use.
+# Set HANGMAN_WORDS_FILE to a category -> words file to replace HANGMAN_CATEGORIES.
+WORDS_FILE = os.path.join(BASE_DIR, "assets", "words.json")
+HANGMAN_WORDS_FILE = None
+
 # Security Configuration
 PASSWORD_MIN_LENGTH = 6
 PASSWORD_HASH_ROUNDS = 12
\ No newline at end of file
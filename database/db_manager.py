@@ -1,5 +1,7 @@
 # database/db_manager.py
+import re
 import sqlite3
+import time
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict
 import sys
@@ -9,6 +11,56 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import DATABASE_PATH
 from database import models
+from utils.metrics import get_metrics
+
+DB_STATEMENT_SECONDS = get_metrics().histogram(
+    "game_hub_db_statement_seconds", "SQLite statement execution time.", ("operation", "table"))
+
+_TABLE_PATTERN = re.compile(r"\b(?:FROM|INTO|UPDATE|ON|TABLE(?:\s+IF\s+NOT\s+EXISTS)?)\s+(\w+)", re.IGNORECASE)
+_statement_labels: Dict[str, Dict[str, str]] = {}
+
+
+def statement_labels(sql: str) -> Dict[str, str]:
+    """Operation and main table of a statement, e.g. SELECT / game_scores (cached per SQL string)."""
+    labels = _statement_labels.get(sql)
+    if labels is None:
+        words = sql.split(None, 1)
+        match = _TABLE_PATTERN.search(sql)
+        labels = {'operation': words[0].upper() if words else "",
+                  'table': match.group(1).lower() if match else ""}
+        _statement_labels[sql] = labels
+    return labels
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Records each statement's execution time in DB_STATEMENT_SECONDS."""
+    
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            DB_STATEMENT_SECONDS.observe(time.perf_counter() - start, **statement_labels(sql))
+    
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            DB_STATEMENT_SECONDS.observe(time.perf_counter() - start, **statement_labels(sql))
+
+
+class TimedConnection(sqlite3.Connection):
+    """A connection whose cursors (including those made by execute shortcuts) are TimedCursors."""
+    
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+    
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
 
 
 class DatabaseManager:
@@ -19,7 +71,7 @@ class DatabaseManager:
     
     
     def get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.Connection(self.db_path)
+        conn = TimedConnection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
     
@@ -31,6 +83,11 @@ class DatabaseManager:
                 cursor.execute(models.CREATE_USERS_TABLE)
                 cursor.execute(models.CREATE_GAME_SCORES_TABLE)
                 cursor.execute(models.CREATE_USER_STATS_TABLE)
+                cursor.execute(models.CREATE_GAME_REPLAYS_TABLE)
+                cursor.execute(models.CREATE_TYPING_SESSIONS_TABLE)
+                cursor.execute(models.CREATE_TYPING_SESSIONS_INDEX)
+                cursor.execute(models.CREATE_GAME_SCORES_BOARD_INDEX)
+                cursor.execute(models.CREATE_GAME_SCORES_BOARD_DIFFICULTY_INDEX)
                 conn.commit()
         except sqlite3.Error as e:
             print(f"Database initialization error: {e}")
@@ -63,6 +120,19 @@ class DatabaseManager:
             print(f"Error retrieving user: {e}")
             return None
     
+    def get_user_by_id(self, user_id: int) -> Optional[Dict]:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(models.GET_USER_BY_ID, (user_id,))
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
+                return None
+        except sqlite3.Error as e:
+            print(f"Error retrieving user: {e}")
+            return None
+    
     def update_last_login(self, user_id: int) -> bool:
         try:
             with self.get_connection() as conn:
@@ -77,7 +147,7 @@ class DatabaseManager:
     
     def save_game_score(self, user_id: int, game_name: str, score: int,
                        difficulty: str = None, time_taken: float = None,
-                       moves_count: int = None) -> bool:
+                       moves_count: int = None, replay: Tuple[bytes, bytes] = None) -> bool:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -85,6 +155,11 @@ class DatabaseManager:
                 cursor.execute(models.INSERT_GAME_SCORE,
                              (user_id, game_name, score, difficulty, time_taken, moves_count))
                 
+                if replay:
+                    maze_data, moves_data = replay
+                    cursor.execute(models.INSERT_GAME_REPLAY,
+                                 (cursor.lastrowid, sqlite3.Binary(maze_data), sqlite3.Binary(moves_data)))
+                
                 cursor.execute(models.UPDATE_USER_STATS,
                              (user_id, game_name, score, score, score))
                 
@@ -94,6 +169,64 @@ class DatabaseManager:
             print(f"Error saving game score: {e}")
             return False
     
+    def save_game_scores(self, entries: List[Dict]) -> bool:
+        """
+        Saves many scores in one transaction (no replays). Each entry has the
+        save_game_score arguments: user_id, game_name, score and optionally
+        difficulty, time_taken and moves_count.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(models.INSERT_GAME_SCORE,
+                                   [(e['user_id'], e['game_name'], e['score'], e.get('difficulty'),
+                                     e.get('time_taken'), e.get('moves_count')) for e in entries])
+                cursor.executemany(models.UPDATE_USER_STATS,
+                                   [(e['user_id'], e['game_name'], e['score'], e['score'], e['score'])
+                                    for e in entries])
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            print(f"Error saving game scores: {e}")
+            return False
+    
+    def get_game_replay(self, score_id: int) -> Optional[Dict]:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(models.GET_GAME_REPLAY, (score_id,))
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
+                return None
+        except sqlite3.Error as e:
+            print(f"Error retrieving replay: {e}")
+            return None
+    
+    def save_typing_session(self, user_id: int, keystrokes: int, errors: int, backspaces: int,
+                            avg_interval_ms: float, wpm: float, stats_blob: bytes) -> bool:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(models.INSERT_TYPING_SESSION,
+                             (user_id, keystrokes, errors, backspaces, avg_interval_ms, wpm,
+                              sqlite3.Binary(stats_blob)))
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            print(f"Error saving typing session: {e}")
+            return False
+    
+    def get_typing_stats_blobs(self, user_id: int, limit: int = 50) -> List[bytes]:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(models.GET_TYPING_STATS_BLOBS, (user_id, limit))
+                return [bytes(row['stats_blob']) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error retrieving typing stats: {e}")
+            return []
+    
     def get_user_high_scores(self, user_id: int) -> List[Dict]:
         try:
             with self.get_connection() as conn:
@@ -124,6 +257,64 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"Error retrieving leaderboard: {e}")
             return []
+    
+    def get_leaderboard_page(self, game_name: str, difficulty: Optional[str],
+                             offset: int, limit: int) -> List[Dict]:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                if difficulty is None:
+                    cursor.execute(models.GET_LEADERBOARD_PAGE, (game_name, limit, offset))
+                else:
+                    cursor.execute(models.GET_LEADERBOARD_PAGE_BY_DIFFICULTY, (game_name, difficulty, limit, offset))
+                return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error retrieving leaderboard page: {e}")
+            return []
+    
+    def count_leaderboard(self, game_name: str, difficulty: Optional[str] = None) -> int:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                if difficulty is None:
+                    cursor.execute(models.COUNT_LEADERBOARD, (game_name,))
+                else:
+                    cursor.execute(models.COUNT_LEADERBOARD_BY_DIFFICULTY, (game_name, difficulty))
+                return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Error counting leaderboard: {e}")
+            return 0
+    
+    def get_user_rank(self, user_id: int, game_name: str, difficulty: Optional[str] = None) -> Optional[Dict]:
+        """The player's best score on a board and its 1-based rank, or None if they have no score."""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                if difficulty is None:
+                    cursor.execute(models.GET_USER_BEST_SCORE, (user_id, game_name))
+                else:
+                    cursor.execute(models.GET_USER_BEST_SCORE_BY_DIFFICULTY, (user_id, game_name, difficulty))
+                best = cursor.fetchone()[0]
+                if best is None:
+                    return None
+                if difficulty is None:
+                    cursor.execute(models.COUNT_SCORES_ABOVE, (game_name, best))
+                else:
+                    cursor.execute(models.COUNT_SCORES_ABOVE_BY_DIFFICULTY, (game_name, difficulty, best))
+                return {'best_score': best, 'rank': cursor.fetchone()[0] + 1}
+        except sqlite3.Error as e:
+            print(f"Error retrieving rank: {e}")
+            return None
+    
+    def get_leaderboard_difficulties(self, game_name: str) -> List[str]:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(models.GET_LEADERBOARD_DIFFICULTIES, (game_name,))
+                return [row[0] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error retrieving leaderboard difficulties: {e}")
+            return []
 
 
 _db_instance = None
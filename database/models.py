@@ -39,6 +39,47 @@ CREATE TABLE IF NOT EXISTS user_stats (
 )
 """
 
+CREATE_GAME_REPLAYS_TABLE = """
+CREATE TABLE IF NOT EXISTS game_replays (
+    score_id INTEGER PRIMARY KEY,
+    maze_data BLOB NOT NULL,
+    moves_data BLOB NOT NULL,
+    FOREIGN KEY (score_id) REFERENCES game_scores (id) ON DELETE CASCADE
+)
+"""
+
+CREATE_TYPING_SESSIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS typing_sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    keystrokes INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    backspaces INTEGER NOT NULL,
+    avg_interval_ms REAL,
+    wpm REAL,
+    stats_blob BLOB NOT NULL,
+    played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+)
+"""
+
+CREATE_TYPING_SESSIONS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_typing_sessions_user
+ON typing_sessions (user_id, played_at)
+"""
+
+# Leaderboard order per game, with and without a difficulty filter. The rowid
+# (id) is part of every index, so paging subqueries are answered from the index
+CREATE_GAME_SCORES_BOARD_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_game_scores_board
+ON game_scores (game_name, score DESC, id)
+"""
+
+CREATE_GAME_SCORES_BOARD_DIFFICULTY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_game_scores_board_difficulty
+ON game_scores (game_name, difficulty, score DESC, id)
+"""
+
 INSERT_USER = """
 INSERT INTO users (username, password_hash, email)
 VALUES (?, ?, ?)
@@ -50,6 +91,12 @@ FROM users
 WHERE username = ?
 """
 
+GET_USER_BY_ID = """
+SELECT id, username, email, created_at, last_login
+FROM users
+WHERE id = ?
+"""
+
 UPDATE_LAST_LOGIN = """
 UPDATE users
 SET last_login = CURRENT_TIMESTAMP
@@ -61,6 +108,32 @@ INSERT INTO game_scores (user_id, game_name, score, difficulty, time_taken, move
 VALUES (?, ?, ?, ?, ?, ?)
 """
 
+INSERT_GAME_REPLAY = """
+INSERT INTO game_replays (score_id, maze_data, moves_data)
+VALUES (?, ?, ?)
+"""
+
+GET_GAME_REPLAY = """
+SELECT gs.id AS score_id, gs.game_name, gs.score, gs.difficulty, gs.played_at,
+       r.maze_data, r.moves_data
+FROM game_replays r
+JOIN game_scores gs ON r.score_id = gs.id
+WHERE r.score_id = ?
+"""
+
+INSERT_TYPING_SESSION = """
+INSERT INTO typing_sessions (user_id, keystrokes, errors, backspaces, avg_interval_ms, wpm, stats_blob)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+GET_TYPING_STATS_BLOBS = """
+SELECT stats_blob
+FROM typing_sessions
+WHERE user_id = ?
+ORDER BY played_at DESC, id DESC
+LIMIT ?
+"""
+
 GET_USER_HIGH_SCORES = """
 SELECT game_name, MAX(score) as high_score, difficulty
 FROM game_scores
@@ -93,4 +166,61 @@ JOIN users u ON gs.user_id = u.id
 WHERE gs.game_name = ?
 ORDER BY gs.score DESC
 LIMIT 10
-"""
\ No newline at end of file
+"""
+
+# Leaderboard pages: the subquery picks the page's ids from the index, so
+# skipped rows are never joined
+GET_LEADERBOARD_PAGE = """
+SELECT u.username, gs.score, gs.difficulty, gs.played_at
+FROM (SELECT id FROM game_scores
+      WHERE game_name = ?
+      ORDER BY score DESC, id
+      LIMIT ? OFFSET ?) page
+JOIN game_scores gs ON gs.id = page.id
+JOIN users u ON gs.user_id = u.id
+ORDER BY gs.score DESC, gs.id
+"""
+
+GET_LEADERBOARD_PAGE_BY_DIFFICULTY = """
+SELECT u.username, gs.score, gs.difficulty, gs.played_at
+FROM (SELECT id FROM game_scores
+      WHERE game_name = ? AND difficulty = ?
+      ORDER BY score DESC, id
+      LIMIT ? OFFSET ?) page
+JOIN game_scores gs ON gs.id = page.id
+JOIN users u ON gs.user_id = u.id
+ORDER BY gs.score DESC, gs.id
+"""
+
+COUNT_LEADERBOARD = """
+SELECT COUNT(*) FROM game_scores WHERE game_name = ?
+"""
+
+COUNT_LEADERBOARD_BY_DIFFICULTY = """
+SELECT COUNT(*) FROM game_scores WHERE game_name = ? AND difficulty = ?
+"""
+
+# Rank of a player's best score: one more than the scores above it, counted
+# from the board indexes
+GET_USER_BEST_SCORE = """
+SELECT MAX(score) FROM game_scores WHERE user_id = ? AND game_name = ?
+"""
+
+GET_USER_BEST_SCORE_BY_DIFFICULTY = """
+SELECT MAX(score) FROM game_scores WHERE user_id = ? AND game_name = ? AND difficulty = ?
+"""
+
+COUNT_SCORES_ABOVE = """
+SELECT COUNT(*) FROM game_scores WHERE game_name = ? AND score > ?
+"""
+
+COUNT_SCORES_ABOVE_BY_DIFFICULTY = """
+SELECT COUNT(*) FROM game_scores WHERE game_name = ? AND difficulty = ? AND score > ?
+"""
+
+GET_LEADERBOARD_DIFFICULTIES = """
+SELECT DISTINCT difficulty
+FROM game_scores
+WHERE game_name = ? AND difficulty IS NOT NULL
+ORDER BY difficulty
+"""
@@ -1,5 +1,20 @@
-from .maze_game import MazeGame
-from .memory_game import MemoryGame
-from .hangman_game import HangmanGame
-from .typing_game import TypingGame
-from .simon_game import SimonGame
\ No newline at end of file
+# Game classes are imported on first access so that headless code (engines,
+# solvers, generators) can use the package without loading Tk widgets.
+import importlib
+
+_GAME_MODULES = {
+    'MazeGame': '.maze_game',
+    'MemoryGame': '.memory_game',
+    'HangmanGame': '.hangman_game',
+    'TypingGame': '.typing_game',
+    'SimonGame': '.simon_game',
+}
+
+__all__ = list(_GAME_MODULES)
+
+
+def __getattr__(name):
+    if name in _GAME_MODULES:
+        module = importlib.import_module(_GAME_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
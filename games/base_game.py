@@ -4,71 +4,114 @@ import customtkinter as ctk
 from abc import ABC, abstractmethod
 import sys
 import os
-from typing import Any, Optional, Callable, Dict
+from typing import Any, Optional, Callable, Dict, List, Tuple
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ui.styles import Fonts
 from database.db_manager import get_db_manager
+from service.score_client import get_score_backend
+from ui.data_service import DataRequest, get_data_service
+from ui.frame_clock import FrameClock
+from ui.game_host import GameHost, build_header
+from utils.metrics import get_metrics
+from utils.session_profile import start_session_profile
+
+FRAME_CALLBACK_SECONDS = get_metrics().counter(
+    "game_hub_frame_callback_seconds_total", "CPU time spent in frame clock callbacks.", ("game", "callback"))
+FRAME_CALLBACK_CALLS = get_metrics().counter(
+    "game_hub_frame_callback_calls_total", "Frame clock callback runs.", ("game", "callback"))
 
 
 class BaseGame(ABC):
     """
     Abstract base class for all mini-games.
     Handles common window setup, header creation, and score saving.
+
+    A game runs either in a window of its own or inside a GameHost, which
+    reuses one window and header for every launch. Either way ``self.root``
+    is the container to build widgets in and ``self.window`` the toplevel.
+
+    Animations and delayed actions go through ``self.clock``, a FrameClock
+    that runs them all from one ``after`` per frame and is closed with the
+    game, so nothing a game scheduled can fire after it has gone.
+
+    With session profiling on (GAME_HUB_PROFILE), the game runs under a
+    SessionProfiler from here until ``on_close``; otherwise ``self.profile``
+    is None and nothing is collected.
     """
     
-    def __init__(self, root: ctk.CTk, user_data: Dict[str, Any], on_close_callback: Callable[[], None], game_name: str):
+    def __init__(self, root: Any, user_data: Dict[str, Any], on_close_callback: Callable[[], None], game_name: str):
         """
         Initialize the base game.
 
         Args:
-            root: The root window (CTk instance).
+            root: A window (CTk/CTkToplevel instance) or a GameHost.
             user_data: Dictionary containing user information (id, username, etc.).
             on_close_callback: Function to call when the game is closed.
             game_name: Display name of the game.
         """
-        self.root = root
         self.user_data = user_data
         self.on_close_callback = on_close_callback
         self.game_name = game_name
         self.db = get_db_manager()
+        # Scores go to the shared score service when one is configured
+        self.scores = get_score_backend()
+        self.data = get_data_service()
+        self.key_bindings: List[str] = []
+        self.closed = False
         
         self.score: int = 0
         self.moves: int = 0
         self.start_time: Optional[float] = None
         self.score_label: Optional[ctk.CTkLabel] = None
         
-        self.setup_window()
-        self.create_header()
+        if isinstance(root, GameHost):
+            self.host: Optional[GameHost] = root
+            self.root = root.begin(self)
+            self.window = root.window
+            self.score_label = root.score_label
+        else:
+            self.host = None
+            self.root = self.window = root
+            self.setup_window()
+            self.create_header()
+            
+            # Protocol for window close
+            self.window.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Protocol for window close
-        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.clock = FrameClock(self.window)
+        # Covers create_game_ui, which subclasses call next, through on_close
+        self.profile = start_session_profile(self.game_name)
     
     
     def setup_window(self) -> None:
         """Configures the game window properties."""
-        self.root.title(self.game_name)
-        self.root.after(0, lambda: self.root.state('zoomed'))
+        self.window.title(self.game_name)
+        self.window.after(0, lambda: self.window.state('zoomed'))
     
     
     def create_header(self) -> None:
         """Creates the common header with title, score, and exit button."""
-        header_frame = ctk.CTkFrame(self.root, height=60, corner_radius=0)
-        header_frame.pack(fill='x')
-        
-        # Game title
-        title_label = ctk.CTkLabel(header_frame, text=self.game_name, font=Fonts.title())
-        title_label.pack(side='left', padx=20, pady=10)
-        
-        # Close button
-        close_btn = ctk.CTkButton(header_frame, text="Exit", command=self.on_close,
-                                 fg_color="#C0392B", hover_color="#922B21", width=80)
-        close_btn.pack(side='right', padx=10, pady=10)
-
-        # Score display
-        self.score_label = ctk.CTkLabel(header_frame, text="Score: 0", font=Fonts.normal())
-        self.score_label.pack(side='right', padx=20, pady=10)
+        _, self.score_label, _ = build_header(self.window, self.game_name, self.on_close)
+    
+    def bind_key(self, sequence: str, handler: Callable[[Any], Any]) -> None:
+        """Binds a key on the game window; hosted games have it removed when they close."""
+        self.window.bind(sequence, handler)
+        if sequence not in self.key_bindings:
+            self.key_bindings.append(sequence)
+    
+    def unbind_key(self, sequence: str) -> None:
+        try:
+            self.window.unbind(sequence)
+        except tk.TclError:
+            pass
+        if sequence in self.key_bindings:
+            self.key_bindings.remove(sequence)
+    
+    def unbind_keys(self) -> None:
+        """Removes every key binding made with bind_key."""
+        for sequence in list(self.key_bindings):
+            self.unbind_key(sequence)
         
         
     def update_score_display(self) -> None:
@@ -76,33 +119,71 @@ class BaseGame(ABC):
         if self.score_label:
             self.score_label.configure(text=f"Score: {self.score}")
     
-    def save_score(self, difficulty: str = None, time_taken: float = None, moves_count: int = None) -> bool:
+    def save_score(self, difficulty: str = None, time_taken: float = None, moves_count: int = None,
+                   replay: Optional[Tuple[bytes, bytes]] = None) -> DataRequest:
         """
-        Saves the game score to the database.
+        Saves the game score to the database on the data worker.
+
+        Saves are not tied to the game window, so they complete even though
+        the window usually closes right after; the dashboard refresh that
+        follows is queued behind them and sees the new score.
 
         Args:
             difficulty: Difficulty level (e.g., "Easy", "Hard").
             time_taken: Time taken to complete the game/round in seconds.
             moves_count: Number of moves made (if applicable).
+            replay: Optional (maze_data, moves_data) blobs to store with the score.
 
         Returns:
-            bool: True if save was successful, False otherwise.
+            DataRequest: The queued save.
         """
-        success = self.db.save_game_score(
+        return self.data.submit(
+            self.scores.save_game_score,
             user_id=self.user_data['id'],
             game_name=self.game_name,
             score=self.score,
             difficulty=difficulty,
             time_taken=time_taken,
-            moves_count=moves_count
+            moves_count=moves_count,
+            replay=replay
         )
-        return success
     
     def on_close(self) -> None:
         """Handles game closure and cleanup."""
+        if self.closed:
+            return
+        self.closed = True
+        self.clock.close()
+        self.report_frame_costs()
+        if self.profile:
+            self.profile.stop()
+            # Reports are written on the data worker, ahead of the dashboard refresh
+            self.data.submit(self.profile.write, getattr(self, 'difficulty', None))
+        # Reads this game asked for are dropped; score saves still run
+        self.data.cancel_owner(self)
         if self.on_close_callback:
             self.on_close_callback()
-        self.root.destroy()
+        if self.host:
+            # The window stays alive for the next game; only this game's content goes
+            self.host.release(self)
+        else:
+            self.window.destroy()
+    
+    def report_frame_costs(self, top: int = 3) -> None:
+        """
+        Adds this session's frame callback costs to the metrics registry and,
+        when the session was profiled, prints the callbacks that used the
+        most CPU time.
+        """
+        stats = self.clock.stats()
+        for name, s in stats.items():
+            FRAME_CALLBACK_SECONDS.inc(s['total_ms'] / 1000, game=self.game_name, callback=name)
+            FRAME_CALLBACK_CALLS.inc(s['calls'], game=self.game_name, callback=name)
+        if not stats or not self.profile:
+            return
+        busiest = ", ".join(f"{name} {s['total_ms']:.0f} ms/{s['calls']} calls (max {s['max_ms']:.1f} ms)"
+                            for name, s in list(stats.items())[:top])
+        print(f"{self.game_name} frame costs over {self.clock.frames} frames: {busiest}")
     
     @abstractmethod
     def create_game_ui(self) -> None:
@@ -0,0 +1,16 @@
+"""
+Headless, seedable game engines.
+
+Engines hold the rules and state of each game and advance only through
+method calls (player events or simulation ticks). They never touch Tk, so
+they can be benchmarked, fuzzed and simulated in worker processes; the
+``BaseGame`` subclasses render their state.
+"""
+from games.engines.maze_engine import MazeEngine
+from games.engines.memory_engine import MemoryEngine
+from games.engines.hangman_engine import HangmanEngine
+from games.engines.typing_engine import TypingEngine
+from games.engines.simon_engine import SimonEngine
+from games.engines.hangman_solver import HangmanSolver
+
+__all__ = ['MazeEngine', 'MemoryEngine', 'HangmanEngine', 'TypingEngine', 'SimonEngine', 'HangmanSolver']
@@ -0,0 +1,114 @@
+# games/engines/hangman_engine.py
+import random
+from typing import FrozenSet, Optional, Set, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import HANGMAN_MAX_ATTEMPTS
+
+# guess() results
+GUESS_REPEAT = 0
+GUESS_HIT = 1
+GUESS_MISS = 2
+
+# Points taken off a won game per hint used
+HINT_PENALTY = 100
+
+
+class HangmanEngine:
+    """Hangman rules for a single word."""
+
+    def __init__(self, word: str, max_attempts: int = HANGMAN_MAX_ATTEMPTS):
+        """
+        Args:
+            word: Word to guess (case-insensitive).
+            max_attempts: Wrong guesses allowed.
+        """
+        self.word = word.upper()
+        self.letters: Set[str] = set(self.word)
+        self.max_attempts = max_attempts
+        self.attempts_left = max_attempts
+        self.guessed_letters: Set[str] = set()
+        self.hints_used = 0
+        # Board state (masked word, wrong letters) the last hint was given for
+        self._hint_state: Optional[Tuple[str, FrozenSet[str]]] = None
+        self._hint_letter: Optional[str] = None
+        self._missing = len(self.letters)
+
+    @classmethod
+    def from_corpus(cls, corpus, category: Optional[str] = None, seed: Optional[int] = None,
+                    **kwargs) -> 'HangmanEngine':
+        """Draws the word from a WordCorpus with a seeded RNG."""
+        return cls(corpus.sample(category=category, rng=random.Random(seed)), **kwargs)
+
+    @property
+    def wrong_guesses(self) -> int:
+        return self.max_attempts - self.attempts_left
+
+    @property
+    def won(self) -> bool:
+        return self._missing == 0
+
+    @property
+    def lost(self) -> bool:
+        return self.attempts_left == 0
+
+    @property
+    def finished(self) -> bool:
+        return self.won or self.lost
+
+    def guess(self, letter: str) -> int:
+        """
+        Guesses a letter.
+
+        Returns:
+            int: GUESS_REPEAT, GUESS_HIT or GUESS_MISS.
+        """
+        letter = letter.upper()
+        if letter in self.guessed_letters or self.finished:
+            return GUESS_REPEAT
+        self.guessed_letters.add(letter)
+        if letter in self.letters:
+            self._missing -= 1
+            return GUESS_HIT
+        self.attempts_left -= 1
+        return GUESS_MISS
+
+    def wrong_letters(self) -> Set[str]:
+        """Guessed letters that are not in the word."""
+        return self.guessed_letters - self.letters
+
+    def use_hint(self, solver) -> Optional[str]:
+        """
+        Asks a HangmanSolver for the best next letter and counts the hint.
+
+        Asking again before the next guess returns the same letter without
+        counting another hint. Once at most one candidate word is left a hint
+        tells the player nothing new, so none is given or charged.
+
+        Returns:
+            str: Suggested letter (upper case), or None if there is no hint.
+        """
+        state = (self.masked(), frozenset(self.wrong_letters()))
+        if state == self._hint_state:
+            return self._hint_letter
+        hint = solver.hint(*state)
+        if hint.letter is None or hint.candidates <= 1:
+            return None
+        self._hint_state = state
+        self._hint_letter = hint.letter.upper()
+        self.hints_used += 1
+        return self._hint_letter
+
+    def masked(self, hidden: str = '_') -> str:
+        """The word with unguessed letters hidden, space separated."""
+        return ' '.join(ch if ch in self.guessed_letters else hidden for ch in self.word)
+
+    def compute_score(self, time_taken: float) -> int:
+        """Score for a finished game; zero when lost."""
+        if not self.won:
+            return 0
+        time_bonus = max(0, 200 - int(time_taken * 2))
+        return max(0, 500 + time_bonus + self.attempts_left * 50 - self.hints_used * HINT_PENALTY)
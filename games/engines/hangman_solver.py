@@ -0,0 +1,196 @@
+# games/engines/hangman_solver.py
+"""
+Candidate search and next-letter hints for Hangman over a word list.
+
+Words are sorted by (length, word) and numbered, so every length is a
+contiguous id range. Each word gets a 26-bit letter mask, and each
+(length, position, letter) gets a sorted posting list of word ids. A
+revealed pattern is answered by intersecting the postings of its revealed
+positions, smallest first, then dropping words that contain a wrong guess
+(one AND per word) or a revealed letter at a hidden position.
+"""
+import math
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+HIDDEN = "_"
+
+
+def letter_mask(letters: Iterable[str]) -> int:
+    """26-bit mask with one bit per letter a-z."""
+    mask = 0
+    for ch in letters:
+        mask |= 1 << (ord(ch) - 97)
+    return mask
+
+
+def intersect_sorted(a: Sequence[int], b: Sequence[int]) -> array:
+    """
+    Intersection of two ascending id sequences.
+
+    Walks the shorter one and gallops through the longer one with bisect,
+    so a short list against a long one costs O(m log n) rather than O(n).
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    out = array('I')
+    lo, n = 0, len(b)
+    for x in a:
+        lo = bisect_left(b, x, lo)
+        if lo == n:
+            break
+        if b[lo] == x:
+            out.append(x)
+            lo += 1
+    return out
+
+
+class Hint(NamedTuple):
+    """Suggested letter, its expected information gain and the candidates it was scored on."""
+    letter: Optional[str]
+    gain_bits: float
+    candidates: int
+
+
+class HangmanSolver:
+    """Finds the words matching a Hangman position and suggests the next letter."""
+
+    def __init__(self, words: Iterable[str], max_sample: int = 4096):
+        """
+        Args:
+            words: Word list; case is ignored, words with non a-z letters are skipped.
+            max_sample: Above this many candidates, letters are scored on an
+                evenly spaced sample of them.
+        """
+        unique = {w.lower() for w in words if w.isascii() and w.isalpha()}
+        self.words: List[str] = sorted(unique, key=lambda w: (len(w), w))
+        self.max_sample = max_sample
+        self.masks = array('I', (letter_mask(w) for w in self.words))
+
+        self.length_ranges: Dict[int, Tuple[int, int]] = {}
+        postings = defaultdict(lambda: array('I'))
+        for word_id, word in enumerate(self.words):
+            start, _ = self.length_ranges.get(len(word), (word_id, 0))
+            self.length_ranges[len(word)] = (start, word_id + 1)
+            for pos, ch in enumerate(word):
+                postings[(len(word), pos, ch)].append(word_id)
+        # Ids are appended in ascending order, so every list is already sorted
+        self.postings: Dict[Tuple[int, int, str], array] = dict(postings)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @staticmethod
+    def parse_pattern(pattern: str) -> str:
+        """Normalizes "_ A _" or "_a_" (any case, optional spaces) to "_a_"."""
+        return pattern.replace(' ', '').lower()
+
+    def candidate_ids(self, pattern: str, wrong: Iterable[str] = ()) -> Sequence[int]:
+        """
+        Ids of the words consistent with a position.
+
+        Args:
+            pattern: Word with unrevealed letters as ``_``, e.g. "_a__a_".
+            wrong: Letters guessed that are not in the word.
+
+        Returns:
+            Ascending word ids.
+        """
+        pattern = self.parse_pattern(pattern)
+        length = len(pattern)
+        if length not in self.length_ranges:
+            return array('I')
+
+        revealed = [(pos, ch) for pos, ch in enumerate(pattern) if ch != HIDDEN]
+        if revealed:
+            lists = sorted((self.postings.get((length, pos, ch), array('I')) for pos, ch in revealed), key=len)
+            ids = lists[0]
+            for other in lists[1:]:
+                if not ids:
+                    break
+                ids = intersect_sorted(ids, other)
+        else:
+            ids = range(*self.length_ranges[length])
+
+        wrong_mask = letter_mask(ch.lower() for ch in wrong)
+        revealed_letters = {ch for _, ch in revealed}
+        hidden = [pos for pos, ch in enumerate(pattern) if ch == HIDDEN]
+        masks, words = self.masks, self.words
+        out = array('I')
+        for word_id in ids:
+            if masks[word_id] & wrong_mask:
+                continue
+            # A guessed letter shows in every position it occupies
+            if revealed_letters:
+                word = words[word_id]
+                if any(word[pos] in revealed_letters for pos in hidden):
+                    continue
+            out.append(word_id)
+        return out
+
+    def candidates(self, pattern: str, wrong: Iterable[str] = ()) -> List[str]:
+        """Words consistent with a position (see candidate_ids)."""
+        return [self.words[i] for i in self.candidate_ids(pattern, wrong)]
+
+    def letter_gains(self, candidate_ids: Sequence[int], guessed: Iterable[str] = ()) -> Dict[str, float]:
+        """
+        Expected information gain, in bits, of guessing each unguessed letter.
+
+        A guess splits the candidates by where the letter occurs (nowhere
+        being one outcome); the gain is the entropy of that split.
+        """
+        if len(candidate_ids) > self.max_sample:
+            step = len(candidate_ids) / self.max_sample
+            candidate_ids = [candidate_ids[int(i * step)] for i in range(self.max_sample)]
+        total = len(candidate_ids)
+        if not total:
+            return {}
+
+        skip = {ch.lower() for ch in guessed}
+        outcomes: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        for word_id in candidate_ids:
+            positions: Dict[str, int] = {}
+            for pos, ch in enumerate(self.words[word_id]):
+                if ch not in skip:
+                    positions[ch] = positions.get(ch, 0) | (1 << pos)
+            for ch, where in positions.items():
+                outcomes[ch][where] += 1
+
+        gains = {}
+        for ch, split in outcomes.items():
+            absent = total - sum(split.values())
+            counts = list(split.values()) + ([absent] if absent else [])
+            gains[ch] = sum(n / total * math.log2(total / n) for n in counts)
+        return gains
+
+    def hint(self, pattern: str, wrong: Iterable[str] = ()) -> Hint:
+        """
+        Best next letter for a position.
+
+        Args:
+            pattern: Word with unrevealed letters as ``_``.
+            wrong: Letters guessed that are not in the word.
+
+        Returns:
+            Hint: letter is None when no candidate word is left or every
+            letter of the candidates has been guessed.
+        """
+        wrong = [ch.lower() for ch in wrong]
+        ids = self.candidate_ids(pattern, wrong)
+        guessed = set(wrong) | set(self.parse_pattern(pattern).replace(HIDDEN, ''))
+        gains = self.letter_gains(ids, guessed)
+        if not gains:
+            return Hint(None, 0.0, len(ids))
+        # Ties go to the alphabetically first letter
+        letter = max(sorted(gains), key=lambda ch: gains[ch])
+        return Hint(letter, gains[letter], len(ids))
+
+
+@lru_cache(maxsize=16)
+def solver_for_corpus(corpus, category: Optional[str] = None) -> HangmanSolver:
+    """Shared solver over one category of a WordCorpus (or all of it)."""
+    return HangmanSolver(corpus.words(category=category))
@@ -0,0 +1,80 @@
+# games/engines/maze_engine.py
+from typing import List, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import MAZE_SIZES
+from games.maze_generator import DEFAULT_ALGORITHM, generate_maze, new_seed
+from games.maze_codec import MazeDescriptor, pack_moves
+from games.maze_solver import shortest_path_length
+
+
+class MazeEngine:
+    """Maze rules: a grid, a player position and the moves made so far."""
+
+    BASE_SCORES = {"Easy": 100, "Medium": 200, "Hard": 300}
+
+    def __init__(self, difficulty: str, seed: Optional[int] = None,
+                 maze: Optional[List[List[int]]] = None, algorithm: str = DEFAULT_ALGORITHM):
+        """
+        Args:
+            difficulty: Key into MAZE_SIZES.
+            seed: Generation seed; random when omitted.
+            maze: Pre-generated grid for this seed (e.g. from the maze pool).
+            algorithm: Generation algorithm key.
+        """
+        self.difficulty = difficulty
+        self.seed = new_seed() if seed is None else seed
+        self.algorithm = algorithm
+        if maze is None:
+            rows, cols = MAZE_SIZES[difficulty]
+            maze = generate_maze(rows, cols, self.seed, algorithm)
+        self.maze = maze
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.end: Tuple[int, int] = (self.rows - 1, self.cols - 1)
+        self.player: Tuple[int, int] = (0, 0)
+        self.moves = 0
+        self.move_log: List[Tuple[int, int]] = []
+        self._optimal: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.player == self.end
+
+    def can_move(self, dr: int, dc: int) -> bool:
+        """True if the move stays inside the maze and off walls."""
+        r, c = self.player[0] + dr, self.player[1] + dc
+        return 0 <= r < self.rows and 0 <= c < self.cols and self.maze[r][c] == 0
+
+    def move(self, dr: int, dc: int) -> bool:
+        """
+        Moves the player by one cell.
+
+        Returns:
+            bool: True if the move was made.
+        """
+        if self.finished or not self.can_move(dr, dc):
+            return False
+        self.player = (self.player[0] + dr, self.player[1] + dc)
+        self.moves += 1
+        self.move_log.append((dr, dc))
+        return True
+
+    def optimal_moves(self) -> float:
+        """Length of the shortest path from start to end."""
+        if self._optimal is None:
+            self._optimal = shortest_path_length(self.maze, (0, 0), self.end)
+        return self._optimal
+
+    def compute_score(self, time_taken: float) -> int:
+        """Base score by difficulty, minus penalties for extra moves and time."""
+        move_penalty = max(0, (self.moves - self.optimal_moves()) * 5)
+        time_penalty = int(time_taken * 2)
+        return int(max(10, self.BASE_SCORES[self.difficulty] - move_penalty - time_penalty))
+
+    def replay_data(self) -> Tuple[bytes, bytes]:
+        """(maze descriptor, packed moves) blobs for replay storage."""
+        descriptor = MazeDescriptor(self.seed, self.rows, self.cols, self.algorithm)
+        return descriptor.to_bytes(), pack_moves(self.move_log)
@@ -0,0 +1,170 @@
+# games/engines/memory_engine.py
+import random
+import unicodedata
+from array import array
+from functools import lru_cache
+from itertools import islice, product
+from typing import List, Optional, Sequence
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import MEMORY_CARD_COUNTS
+
+# reveal() results
+REVEAL_IGNORED = 0
+REVEAL_FIRST = 1
+REVEAL_SECOND = 2
+
+# Per-card states in MemoryEngine.state
+CARD_HIDDEN = 0
+CARD_FACE_UP = 1
+CARD_MATCHED = 2
+
+# Hand-picked symbols, used first for the small boards
+SYMBOLS = ['🎮', '🎯', '🎨', '🎭', '🎪', '🎸', '🎺', '🎹',
+           '⚽', '🏀', '🏈', '⚾', '🎾', '🏐', '🏓', '🏸',
+           '🚗', '🚕', '🚙', '🚌', '🚎', '🏎️', '🚓', '🚑']
+
+# Basic Multilingual Plane symbol blocks that common fonts cover
+GLYPH_RANGES = [
+    (0x2600, 0x26FF),  # Miscellaneous Symbols
+    (0x2700, 0x27BF),  # Dingbats
+    (0x25A0, 0x25FF),  # Geometric Shapes
+    (0x2190, 0x21FF),  # Arrows
+    (0x0391, 0x03A9),  # Greek capitals
+]
+
+# Two-character labels take over once the symbol glyphs run out
+LABEL_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+@lru_cache(maxsize=None)
+def _glyphs() -> tuple:
+    glyphs = list(SYMBOLS)
+    seen = set(glyphs)
+    for first, last in GLYPH_RANGES:
+        for code in range(first, last + 1):
+            ch = chr(code)
+            # Skip unassigned code points and arrow/shape modifiers
+            if ch not in seen and unicodedata.category(ch) in ('So', 'Lu'):
+                seen.add(ch)
+                glyphs.append(ch)
+    return tuple(glyphs)
+
+
+def glyph_pool(count: int) -> List[str]:
+    """
+    Returns ``count`` distinct card faces: SYMBOLS, then single symbol
+    characters, then two-character letter/digit labels, so any board size
+    has enough pairs.
+    """
+    glyphs = list(_glyphs()[:count])
+    if len(glyphs) < count:
+        labels = product(LABEL_CHARS, repeat=2)
+        glyphs.extend(a + b for a, b in islice(labels, count - len(glyphs)))
+    if len(glyphs) < count:
+        raise ValueError(f"Not enough glyphs for {count} pairs")
+    return glyphs
+
+
+class MemoryEngine:
+    """
+    Memory card rules: a shuffled deck and the pair currently face up.
+
+    Cards are symbol ids in an ``array`` and per-card state is one byte in
+    ``state``, so boards of thousands of cards stay small and every state
+    check is a single index.
+    """
+
+    BASE_SCORES = {"Easy": 200, "Medium": 400, "Hard": 600, "Expert": 1500, "Giant": 5000}
+
+    def __init__(self, difficulty: str, seed: Optional[int] = None,
+                 symbols: Optional[Sequence[str]] = None, num_cards: Optional[int] = None):
+        """
+        Args:
+            difficulty: Key into MEMORY_CARD_COUNTS.
+            seed: Shuffle seed; random when omitted.
+            symbols: Faces to draw pairs from; glyph_pool() when omitted.
+            num_cards: Board size overriding MEMORY_CARD_COUNTS (rounded down to even).
+        """
+        self.difficulty = difficulty
+        self.rng = random.Random(seed)
+        num_pairs = (num_cards or MEMORY_CARD_COUNTS[difficulty]) // 2
+        self.symbols: List[str] = list(symbols[:num_pairs]) if symbols else glyph_pool(num_pairs)
+        cards = list(range(num_pairs)) * 2
+        self.rng.shuffle(cards)
+        self.cards = array('H', cards)
+        self.state = bytearray(len(cards))
+        self.matched_count = 0
+        self.first_card: Optional[int] = None
+        self.second_card: Optional[int] = None
+        self.moves = 0
+
+    @property
+    def awaiting_resolve(self) -> bool:
+        """True while two cards are face up and resolve() has not run."""
+        return self.second_card is not None
+
+    @property
+    def pairs_found(self) -> int:
+        return self.matched_count // 2
+
+    @property
+    def total_pairs(self) -> int:
+        return len(self.cards) // 2
+
+    @property
+    def finished(self) -> bool:
+        return self.matched_count == len(self.cards)
+
+    def symbol(self, index: int) -> str:
+        """Face of the card at ``index``."""
+        return self.symbols[self.cards[index]]
+
+    def is_matched(self, index: int) -> bool:
+        return self.state[index] == CARD_MATCHED
+
+    def is_face_up(self, index: int) -> bool:
+        return self.state[index] != CARD_HIDDEN
+
+    def reveal(self, index: int) -> int:
+        """
+        Turns a card face up.
+
+        Returns:
+            int: REVEAL_IGNORED, REVEAL_FIRST or REVEAL_SECOND (a move was
+            made and resolve() must be called next).
+        """
+        if self.awaiting_resolve or self.is_face_up(index):
+            return REVEAL_IGNORED
+        self.state[index] = CARD_FACE_UP
+        if self.first_card is None:
+            self.first_card = index
+            return REVEAL_FIRST
+        self.second_card = index
+        self.moves += 1
+        return REVEAL_SECOND
+
+    def resolve(self) -> bool:
+        """
+        Settles the face-up pair: matched cards stay up, others turn back.
+
+        Returns:
+            bool: True if the pair matched.
+        """
+        first, second = self.first_card, self.second_card
+        matched = self.cards[first] == self.cards[second]
+        self.state[first] = self.state[second] = CARD_MATCHED if matched else CARD_HIDDEN
+        if matched:
+            self.matched_count += 2
+        self.first_card = None
+        self.second_card = None
+        return matched
+
+    def compute_score(self, time_taken: float) -> int:
+        """Base score by difficulty, minus penalties for extra moves and time."""
+        move_penalty = (self.moves - self.total_pairs) * 10
+        time_penalty = int(time_taken * 3)
+        return max(50, self.BASE_SCORES[self.difficulty] - move_penalty - time_penalty)
@@ -0,0 +1,55 @@
+# games/engines/simon_engine.py
+import random
+from typing import List, Optional
+
+# press() results
+PRESS_CORRECT = 0
+PRESS_ROUND_COMPLETE = 1
+PRESS_WRONG = 2
+
+
+class SimonEngine:
+    """Simon Says rules: a growing colour sequence and the player's progress through it."""
+
+    COLORS = ("green", "red", "blue", "yellow")
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Sequence seed; random when omitted.
+        """
+        self.rng = random.Random(seed)
+        self.sequence: List[str] = []
+        self.player_index = 0
+        self.game_over = False
+
+    @property
+    def rounds_completed(self) -> int:
+        """Rounds fully repeated by the player."""
+        if self.game_over or self.player_index < len(self.sequence):
+            return max(0, len(self.sequence) - 1)
+        return len(self.sequence)
+
+    def next_round(self) -> str:
+        """Appends a random colour and resets the player's progress. Returns the new colour."""
+        color = self.rng.choice(self.COLORS)
+        self.sequence.append(color)
+        self.player_index = 0
+        return color
+
+    def press(self, color: str) -> int:
+        """
+        Registers a player press.
+
+        Returns:
+            int: PRESS_CORRECT, PRESS_ROUND_COMPLETE or PRESS_WRONG.
+        """
+        if self.game_over or self.player_index >= len(self.sequence):
+            return PRESS_WRONG
+        if self.sequence[self.player_index] != color:
+            self.game_over = True
+            return PRESS_WRONG
+        self.player_index += 1
+        if self.player_index == len(self.sequence):
+            return PRESS_ROUND_COMPLETE
+        return PRESS_CORRECT
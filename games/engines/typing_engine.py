@@ -0,0 +1,139 @@
+# games/engines/typing_engine.py
+import random
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from games.word_trie import WordTrie
+
+# difficulty -> (pixels fallen per tick, ms between spawns)
+DIFFICULTY_SETTINGS = {
+    "Easy": (1, 2000),
+    "Medium": (2, 1500),
+    "Hard": (3, 1000),
+}
+
+
+class TickResult(NamedTuple):
+    """Words that appeared and words that reached the bottom during a tick."""
+    spawned: List[Dict[str, Any]]
+    missed: List[Dict[str, Any]]
+
+
+class TypingEngine:
+    """
+    Typing Defense rules, advanced in fixed ticks of TICK_MS simulated time.
+
+    Falling words are dicts ``{"id", "word", "x", "y"}`` keyed by an engine
+    id; renderers map those ids to whatever they draw.
+    """
+
+    TICK_MS = 30
+    WIDTH = 800
+    HEIGHT = 500
+    LIVES = 3
+
+    def __init__(self, difficulty: str, word_source: Callable[[random.Random], str],
+                 seed: Optional[int] = None):
+        """
+        Args:
+            difficulty: Key into DIFFICULTY_SETTINGS.
+            word_source: Returns a word to spawn, given the engine's RNG.
+            seed: Seed for word choice and spawn positions.
+        """
+        self.difficulty = difficulty
+        self.falling_speed, self.spawn_rate = DIFFICULTY_SETTINGS[difficulty]
+        self.word_source = word_source
+        self.rng = random.Random(seed)
+
+        self.words: Dict[int, Dict[str, Any]] = {}
+        self.index = WordTrie()
+        self.next_id = 0
+        self.spawn_timer = 0
+        self.ticks = 0
+
+        self.current_input = ""
+        self.lives = self.LIVES
+        self.score = 0
+        self.correct_words = 0
+
+    @property
+    def game_over(self) -> bool:
+        return self.lives <= 0
+
+    @property
+    def elapsed_ms(self) -> int:
+        """Simulated time since the start."""
+        return self.ticks * self.TICK_MS
+
+    def spawn(self) -> Dict[str, Any]:
+        """Adds a word at the top of the play field."""
+        word = {
+            "id": self.next_id,
+            "word": self.word_source(self.rng),
+            "x": self.rng.randint(50, self.WIDTH - 50),
+            "y": 0,
+        }
+        self.next_id += 1
+        self.words[word["id"]] = word
+        self.index.insert(word["word"], word["id"])
+        return word
+
+    def remove(self, word_id: int) -> Optional[Dict[str, Any]]:
+        """Drops a word from the field and the prefix index."""
+        self.index.remove(word_id)
+        return self.words.pop(word_id, None)
+
+    def tick(self) -> TickResult:
+        """Advances one fixed step: spawning, falling and bottom collisions."""
+        spawned, missed = [], []
+        if self.game_over:
+            return TickResult(spawned, missed)
+
+        self.ticks += 1
+        self.spawn_timer += self.TICK_MS
+        if self.spawn_timer >= self.spawn_rate:
+            self.spawn_timer -= self.spawn_rate
+            spawned.append(self.spawn())
+
+        for word in self.words.values():
+            word["y"] += self.falling_speed
+            if word["y"] > self.HEIGHT:
+                missed.append(word)
+
+        for word in missed:
+            self.remove(word["id"])
+            self.lives -= 1
+
+        return TickResult(spawned, missed)
+
+    def type_char(self, char: str) -> Optional[Dict[str, Any]]:
+        """
+        Appends a typed letter to the input.
+
+        Returns:
+            The destroyed word if the input now matches one exactly, else None.
+        """
+        self.current_input += char
+        word_id = self.index.match(self.current_input)
+        if word_id is None:
+            return None
+        word = self.remove(word_id)
+        self.score += len(word["word"]) * 10
+        self.correct_words += 1
+        self.current_input = ""
+        return word
+
+    def backspace(self) -> None:
+        """Deletes the last typed letter."""
+        self.current_input = self.current_input[:-1]
+
+    def input_is_valid(self) -> bool:
+        """True if the input is empty or a prefix of some falling word."""
+        return not self.current_input or self.index.has_prefix(self.current_input)
+
+    def candidates(self) -> Set[int]:
+        """Ids of the words the current input is a prefix of."""
+        return self.index.candidates(self.current_input) if self.current_input else set()
@@ -1,7 +1,6 @@
 # games/hangman_game.py
 import tkinter as tk
 from tkinter import messagebox
-import random
 import time
 import sys
 import os
@@ -10,17 +9,22 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from games.base_game import BaseGame
 from ui.styles import Colors, ButtonStyles, Fonts
-from config.settings import HANGMAN_CATEGORIES, HANGMAN_MAX_ATTEMPTS
+from utils.word_corpus import get_hangman_corpus
+from utils.word_difficulty import DIFFICULTY_BANDS, get_hangman_difficulty
+from games.engines.hangman_engine import HangmanEngine, GUESS_REPEAT, GUESS_MISS, HINT_PENALTY
+from games.engines.hangman_solver import solver_for_corpus
 
 
 class HangmanGame(BaseGame):
     
     def __init__(self, root, user_data, on_close_callback):
         self.category = None
+        self.band = "Medium"
+        self.engine = None
         self.word = None
-        self.guessed_letters = set()
-        self.attempts_left = HANGMAN_MAX_ATTEMPTS
         self.letter_buttons = []
+        self.corpus = get_hangman_corpus()
+        self.ratings = get_hangman_difficulty()
         
         super().__init__(root, user_data, on_close_callback, "Hangman Game")
         self.create_game_ui()
@@ -36,12 +40,21 @@ class HangmanGame(BaseGame):
         btn_frame = tk.Frame(self.category_frame, bg=Colors.BACKGROUND)
         btn_frame.pack()
         
-        for category in HANGMAN_CATEGORIES.keys():
+        for category in self.corpus.categories:
             btn = tk.Button(btn_frame, text=category, width=12,
                            command=lambda c=category: self.select_category(c),
                            **ButtonStyles.SECONDARY)
             btn.pack(side='left', padx=5)
         
+        # Difficulty band: words are ranked by a simulated guesser's misses
+        self.band_var = tk.StringVar(value=self.band)
+        band_frame = tk.Frame(self.category_frame, bg=Colors.BACKGROUND)
+        band_frame.pack(pady=10)
+        for band in DIFFICULTY_BANDS:
+            tk.Radiobutton(band_frame, text=band, value=band, variable=self.band_var,
+                           font=Fonts.normal(), bg=Colors.BACKGROUND, fg=Colors.TEXT,
+                           selectcolor=Colors.BACKGROUND).pack(side='left', padx=5)
+        
         # Game frame (hidden initially)
         self.game_frame = tk.Frame(self.root, bg=Colors.BACKGROUND)
         
@@ -70,6 +83,11 @@ class HangmanGame(BaseGame):
         self.letters_frame = tk.Frame(self.game_frame, bg=Colors.BACKGROUND)
         self.letters_frame.pack(pady=10)
         
+        # Hint: best next letter by information gain over the category
+        self.hint_btn = tk.Button(self.game_frame, text=f"Hint (-{HINT_PENALTY} pts)", width=14,
+                                  command=self.show_hint, **ButtonStyles.SECONDARY)
+        self.hint_btn.pack(pady=5)
+        
         # Instructions
         instructions = "Click letters to guess\nGuess the word before running out of attempts!"
         tk.Label(self.category_frame, text=instructions, font=Fonts.small(),
@@ -78,21 +96,22 @@ class HangmanGame(BaseGame):
     
     def select_category(self, category):
         self.category = category
+        self.band = self.band_var.get()
         self.category_frame.pack_forget()
         self.game_frame.pack(pady=20)
         self.start_game()
     
     def start_game(self):
         self.start_time = time.time()
-        self.guessed_letters = set()
-        self.attempts_left = HANGMAN_MAX_ATTEMPTS
         
-        self.word = random.choice(HANGMAN_CATEGORIES[self.category]).upper()
+        self.engine = HangmanEngine(self.ratings.sample(self.band, category=self.category))
+        self.word = self.engine.word
         
-        self.category_label.config(text=f"Category: {self.category}")
+        self.category_label.config(text=f"Category: {self.category} ({self.band})")
         self.update_word_display()
         self.update_attempts_display()
         self.draw_hangman()
+        self.hint_btn.config(text=f"Hint (-{HINT_PENALTY} pts)", state='normal')
         
         self.create_letter_buttons()
     
@@ -114,11 +133,10 @@ class HangmanGame(BaseGame):
             self.letter_buttons.append(btn)
     
     def guess_letter(self, letter):
-        if letter in self.guessed_letters:
+        result = self.engine.guess(letter)
+        if result == GUESS_REPEAT:
             return
         
-        self.guessed_letters.add(letter)
-        
         # Disable button
         for btn in self.letter_buttons:
             if btn.cget('text') == letter:
@@ -126,28 +144,37 @@ class HangmanGame(BaseGame):
                 break
         
         # Check if letter is in word
-        if letter not in self.word:
-            self.attempts_left -= 1
+        if result == GUESS_MISS:
             self.update_attempts_display()
             self.draw_hangman()
             
-            if self.attempts_left == 0:
+            if self.engine.lost:
                 self.end_game(won=False)
                 return
         
         self.update_word_display()
         
         # Check if word is complete
-        if all(letter in self.guessed_letters for letter in self.word):
+        if self.engine.won:
             self.end_game(won=True)
     
+    def show_hint(self):
+        solver = solver_for_corpus(self.corpus, self.category)
+        letter = self.engine.use_hint(solver)
+        if letter is None:
+            # Guessing further cannot add candidates, so none will turn up this round
+            self.hint_btn.config(text="No hint available", state='disabled')
+            return
+        for btn in self.letter_buttons:
+            if btn.cget('text') == letter:
+                btn.config(bg=Colors.WARNING)
+                break
+    
     def update_word_display(self):
-        display = ' '.join(letter if letter in self.guessed_letters else '_' 
-                          for letter in self.word)
-        self.word_label.config(text=display)
+        self.word_label.config(text=self.engine.masked())
     
     def update_attempts_display(self):
-        self.attempts_label.config(text=f"Attempts Left: {self.attempts_left}")
+        self.attempts_label.config(text=f"Attempts Left: {self.engine.attempts_left}")
     
     def draw_hangman(self):
         self.canvas.delete('all')
@@ -161,7 +188,7 @@ class HangmanGame(BaseGame):
         self.canvas.create_line(130, 20, 130, 50, width=3)
         
         # Draw body parts based on wrong guesses
-        wrong_guesses = HANGMAN_MAX_ATTEMPTS - self.attempts_left
+        wrong_guesses = self.engine.wrong_guesses
         
         if wrong_guesses >= 1:
             # Head
@@ -185,28 +212,25 @@ class HangmanGame(BaseGame):
     def end_game(self, won):
         time_taken = time.time() - self.start_time
         
+        # Calculate score (zero when lost)
+        self.score = self.engine.compute_score(time_taken)
+        
         if won:
-            # Calculate score
-            base_score = 500
-            time_bonus = max(0, 200 - int(time_taken * 2))
-            attempts_bonus = self.attempts_left * 50
-            self.score = base_score + time_bonus + attempts_bonus
-            
             message = (f"Congratulations! You won!\n\n"
                       f"Word: {self.word}\n"
                       f"Time: {int(time_taken)}s\n"
-                      f"Attempts Left: {self.attempts_left}\n"
+                      f"Attempts Left: {self.engine.attempts_left}\n"
                       f"Score: {self.score}")
             title = "Victory!"
         else:
-            self.score = 0
             message = (f"Game Over!\n\n"
                       f"The word was: {self.word}\n"
                       f"Better luck next time!")
             title = "Game Over"
         
         # Save score
-        self.save_score(self.category, time_taken, HANGMAN_MAX_ATTEMPTS - self.attempts_left)
+        # Scores are only comparable within a category and band
+        self.save_score(f"{self.category} - {self.band}", time_taken, self.engine.wrong_guesses)
         
         # Show results
         messagebox.showinfo(title, message)
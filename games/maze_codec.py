@@ -0,0 +1,149 @@
+# games/maze_codec.py
+"""
+Compact binary encodings for mazes and maze replays.
+
+- ``pack_maze`` / ``unpack_maze``: one bit per cell, zlib-compressed.
+- ``MazeDescriptor``: seed + algorithm + size (15 bytes) that rebuilds a
+  maze deterministically through ``games.maze_generator``.
+- ``pack_moves`` / ``unpack_moves``: player moves as a 2-bit-per-move stream.
+"""
+import base64
+import struct
+import zlib
+from datetime import date
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.maze_generator import DEFAULT_ALGORITHM, generate_maze
+
+FORMAT_VERSION = 1
+
+# Stable on-disk ids; never renumber existing entries
+ALGORITHM_IDS = {"dfs": 0}
+ALGORITHM_NAMES = {v: k for k, v in ALGORITHM_IDS.items()}
+
+# Move codes, two bits each
+MOVES = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+MOVE_CODES = {move: code for code, move in enumerate(MOVES)}
+
+# Blobs start with a one-byte tag so stored maze data can be either form
+_GRID_TAG = b'G'
+_DESCRIPTOR_TAG = b'D'
+_GRID_HEADER = struct.Struct('<cBHH')         # tag, version, rows, cols
+_DESCRIPTOR = struct.Struct('<cBBHHQ')        # tag, version, algorithm, rows, cols, seed
+_MOVES_HEADER = struct.Struct('<I')           # move count
+
+
+def pack_maze(maze: Sequence[Sequence[int]]) -> bytes:
+    """Encodes a 0/1 grid as a bit-per-cell, zlib-compressed blob."""
+    rows, cols = len(maze), len(maze[0])
+    bits = bytearray((rows * cols + 7) // 8)
+    i = 0
+    for row in maze:
+        for cell in row:
+            if cell:
+                bits[i >> 3] |= 1 << (i & 7)
+            i += 1
+    return _GRID_HEADER.pack(_GRID_TAG, FORMAT_VERSION, rows, cols) + zlib.compress(bytes(bits), 9)
+
+
+def unpack_maze(data: bytes) -> List[List[int]]:
+    """Decodes a blob produced by ``pack_maze``."""
+    tag, version, rows, cols = _GRID_HEADER.unpack_from(data)
+    if tag != _GRID_TAG or version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported maze format version: {version}")
+    bits = zlib.decompress(data[_GRID_HEADER.size:])
+    maze = []
+    i = 0
+    for _ in range(rows):
+        row = []
+        for _ in range(cols):
+            row.append((bits[i >> 3] >> (i & 7)) & 1)
+            i += 1
+        maze.append(row)
+    return maze
+
+
+class MazeDescriptor(NamedTuple):
+    """Everything needed to regenerate a maze."""
+    seed: int
+    rows: int
+    cols: int
+    algorithm: str = DEFAULT_ALGORITHM
+
+    def build(self) -> List[List[int]]:
+        """Regenerates the maze grid."""
+        return generate_maze(self.rows, self.cols, self.seed, self.algorithm)
+
+    def to_bytes(self) -> bytes:
+        """15-byte binary form."""
+        return _DESCRIPTOR.pack(_DESCRIPTOR_TAG, FORMAT_VERSION, ALGORITHM_IDS[self.algorithm],
+                                self.rows, self.cols, self.seed)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'MazeDescriptor':
+        tag, version, algorithm_id, rows, cols, seed = _DESCRIPTOR.unpack_from(data)
+        if tag != _DESCRIPTOR_TAG or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported maze descriptor version: {version}")
+        if algorithm_id not in ALGORITHM_NAMES:
+            raise ValueError(f"Unknown maze algorithm id: {algorithm_id}")
+        return cls(seed, rows, cols, ALGORITHM_NAMES[algorithm_id])
+
+    def to_code(self) -> str:
+        """Short text code for sharing a maze."""
+        return base64.urlsafe_b64encode(self.to_bytes()).decode('ascii').rstrip('=')
+
+    @classmethod
+    def from_code(cls, code: str) -> 'MazeDescriptor':
+        padded = code + '=' * (-len(code) % 4)
+        return cls.from_bytes(base64.urlsafe_b64decode(padded))
+
+
+def load_maze(data: bytes) -> List[List[int]]:
+    """Rebuilds a maze from either a descriptor or a ``pack_maze`` blob."""
+    if data[:1] == _DESCRIPTOR_TAG:
+        return MazeDescriptor.from_bytes(data).build()
+    return unpack_maze(data)
+
+
+def daily_descriptor(rows: int, cols: int, day: Optional[date] = None) -> MazeDescriptor:
+    """The shared maze of the day: every kiosk derives the same seed from the date."""
+    day = day or date.today()
+    seed = zlib.crc32(f"{day.isoformat()}:{rows}x{cols}".encode('ascii'))
+    return MazeDescriptor(seed, rows, cols)
+
+
+def pack_moves(moves: Sequence[Tuple[int, int]]) -> bytes:
+    """
+    Packs (dr, dc) unit moves into a 2-bit-per-move stream.
+
+    Args:
+        moves: Sequence of moves, each one of ``MOVES``.
+
+    Returns:
+        4-byte little-endian move count followed by the packed codes.
+    """
+    packed = bytearray((len(moves) + 3) // 4)
+    for i, move in enumerate(moves):
+        packed[i >> 2] |= MOVE_CODES[tuple(move)] << ((i & 3) * 2)
+    return _MOVES_HEADER.pack(len(moves)) + bytes(packed)
+
+
+def unpack_moves(data: bytes) -> List[Tuple[int, int]]:
+    """Decodes a stream produced by ``pack_moves``."""
+    (count,) = _MOVES_HEADER.unpack_from(data)
+    packed = data[_MOVES_HEADER.size:]
+    return [MOVES[(packed[i >> 2] >> ((i & 3) * 2)) & 3] for i in range(count)]
+
+
+def replay_positions(moves: Sequence[Tuple[int, int]], start: Tuple[int, int] = (0, 0)) -> List[Tuple[int, int]]:
+    """Expands a move list into the visited positions, start included."""
+    r, c = start
+    positions = [(r, c)]
+    for dr, dc in moves:
+        r, c = r + dr, c + dc
+        positions.append((r, c))
+    return positions
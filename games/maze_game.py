@@ -1,9 +1,7 @@
 # games/maze_game.py
 import tkinter as tk
 from tkinter import messagebox
-import random
 import time
-from collections import deque
 import sys
 import os
 
@@ -11,13 +9,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from games.base_game import BaseGame
 from ui.styles import Colors, ButtonStyles, Fonts
-from config.settings import MAZE_SIZES
+from games.maze_pool import get_maze_pool
+from games.engines.maze_engine import MazeEngine
 
 
 class MazeGame(BaseGame):
     
     def __init__(self, root, user_data, on_close_callback):
         self.difficulty = None
+        self.engine = None
         self.maze = None
         self.player_pos = None
         self.end_pos = None
@@ -26,6 +26,9 @@ class MazeGame(BaseGame):
         
         super().__init__(root, user_data, on_close_callback, "Maze Path Game")
         self.create_game_ui()
+        
+        # Warm the maze pool while the player picks a difficulty
+        get_maze_pool().fill()
     
     
     def create_game_ui(self):
@@ -64,22 +67,23 @@ class MazeGame(BaseGame):
         self.difficulty_frame.pack_forget()
         self.canvas_frame.pack(pady=20)
         self.stats_label.pack(pady=10)
-        self.root.after(100, self.root.focus_set)  # Ensure window gets focus
+        self.clock.call_later(100, self.root.focus_set)  # Ensure window gets focus
         self.start_game()
     
     def start_game(self):
         self.moves = 0
         self.start_time = time.time()
         
-        # Get maze size
-        rows, cols = MAZE_SIZES[self.difficulty]
-        
-        # Generate maze
-        self.maze = self.generate_maze(rows, cols)
+        # Take a pre-generated maze (falls back to generating one now)
+        pooled = get_maze_pool().take(self.difficulty)
+        self.engine = MazeEngine(self.difficulty, seed=pooled.seed, maze=pooled.maze,
+                                 algorithm=pooled.algorithm)
+        self.maze = self.engine.maze
+        rows, cols = self.engine.rows, self.engine.cols
         
         # Set start and end positions
-        self.player_pos = [0, 0]
-        self.end_pos = [rows-1, cols-1]
+        self.player_pos = list(self.engine.player)
+        self.end_pos = list(self.engine.end)
         
         # Create canvas
         canvas_width = cols * self.cell_size
@@ -96,46 +100,13 @@ class MazeGame(BaseGame):
         self.draw_maze()
         
         # Bind keys
-        self.root.bind('<Up>', lambda e: self.move_player(-1, 0))
-        self.root.bind('<Down>', lambda e: self.move_player(1, 0))
-        self.root.bind('<Left>', lambda e: self.move_player(0, -1))
-        self.root.bind('<Right>', lambda e: self.move_player(0, 1))
+        self.bind_key('<Up>', lambda e: self.move_player(-1, 0))
+        self.bind_key('<Down>', lambda e: self.move_player(1, 0))
+        self.bind_key('<Left>', lambda e: self.move_player(0, -1))
+        self.bind_key('<Right>', lambda e: self.move_player(0, 1))
         
         self.update_stats()
     
-    def generate_maze(self, rows, cols):
-        # Initialize maze with all walls
-        maze = [[1 for _ in range(cols)] for _ in range(rows)]
-        
-        # Carve paths using DFS
-        def carve_path(r, c):
-            maze[r][c] = 0
-            directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-            random.shuffle(directions)
-            
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 1:
-                    maze[r + dr//2][c + dc//2] = 0
-                    carve_path(nr, nc)
-        
-        carve_path(0, 0)
-        
-        # Ensure start and end are clear
-        # Ensure start and end are clear
-        maze[0][0] = 0
-        maze[rows-1][cols-1] = 0
-        
-        # Ensure end is reachable (fix for even-sized grids)
-        # DFS nodes are at (even, even), so if end is at (odd, odd), it might be isolated.
-        # We clear adjacent cells to connect it to the nearest DFS visited nodes.
-        if rows > 1:
-            maze[rows-2][cols-1] = 0  # Top neighbor
-        if cols > 1:
-            maze[rows-1][cols-2] = 0  # Left neighbor
-        
-        return maze
-    
     def draw_maze(self):
         self.canvas.delete('all')
         rows = len(self.maze)
@@ -179,21 +150,15 @@ class MazeGame(BaseGame):
                                outline='', tags='player')
     
     def move_player(self, dr, dc):
-        new_r = self.player_pos[0] + dr
-        new_c = self.player_pos[1] + dc
-        
-        # Check bounds and walls
-        if (0 <= new_r < len(self.maze) and 
-            0 <= new_c < len(self.maze[0]) and 
-            self.maze[new_r][new_c] == 0):
-            
-            self.player_pos = [new_r, new_c]
-            self.moves += 1
+        # The engine checks bounds and walls
+        if self.engine.move(dr, dc):
+            self.player_pos = list(self.engine.player)
+            self.moves = self.engine.moves
             self.draw_player()
             self.update_stats()
             
             # Check if reached end
-            if self.player_pos == self.end_pos:
+            if self.engine.finished:
                 self.end_game()
     
     def update_stats(self):
@@ -204,21 +169,11 @@ class MazeGame(BaseGame):
         time_taken = time.time() - self.start_time
         
         # Calculate score (higher is better)
-        # Base score by difficulty
-        base_scores = {"Easy": 100, "Medium": 200, "Hard": 300}
-        base_score = base_scores[self.difficulty]
-        
-        # Calculate optimal path
-        optimal_moves = self.calculate_optimal_path()
+        optimal_moves = self.engine.optimal_moves()
+        self.score = self.engine.compute_score(time_taken)
         
-        # Penalty for extra moves and time
-        move_penalty = max(0, (self.moves - optimal_moves) * 5)
-        time_penalty = int(time_taken * 2)
-        
-        self.score = max(10, base_score - move_penalty - time_penalty)
-        
-        # Save score
-        self.save_score(self.difficulty, time_taken, self.moves)
+        # Save score with a replay: maze descriptor + 2-bit move stream
+        self.save_score(self.difficulty, time_taken, self.moves, replay=self.engine.replay_data())
         
         # Show results
         message = (f"Congratulations! You completed the maze!\n\n"
@@ -228,23 +183,3 @@ class MazeGame(BaseGame):
         
         messagebox.showinfo("Game Complete", message)
         self.on_close()
-    
-    def calculate_optimal_path(self):
-        rows, cols = len(self.maze), len(self.maze[0])
-        queue = deque([(0, 0, 0)])  # (row, col, distance)
-        visited = set([(0, 0)])
-        
-        while queue:
-            r, c, dist = queue.popleft()
-            
-            if [r, c] == self.end_pos:
-                return dist
-            
-            for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nr, nc = r + dr, c + dc
-                if (0 <= nr < rows and 0 <= nc < cols and 
-                    self.maze[nr][nc] == 0 and (nr, nc) not in visited):
-                    visited.add((nr, nc))
-                    queue.append((nr, nc, dist + 1))
-        
-        return float('inf')
\ No newline at end of file
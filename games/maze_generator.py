@@ -0,0 +1,89 @@
+# games/maze_generator.py
+"""
+Deterministic maze generation.
+
+Generators are plain module-level functions of ``(rows, cols, rng)`` so they
+can run in worker processes and be replayed from a seed.
+"""
+import random
+from typing import Callable, Dict, List, Optional
+
+Grid = List[List[int]]
+
+
+def carve_dfs(rows: int, cols: int, rng: random.Random) -> Grid:
+    """
+    Recursive-backtracker maze (iterative, so large grids don't hit the
+    recursion limit). Produces the same layouts as the original recursive
+    ``MazeGame.generate_maze`` for a given RNG state.
+    """
+    maze = [[1] * cols for _ in range(rows)]
+    maze[0][0] = 0
+
+    def shuffled_directions():
+        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
+        rng.shuffle(directions)
+        return iter(directions)
+
+    stack = [(0, 0, shuffled_directions())]
+    while stack:
+        r, c, directions = stack[-1]
+        for dr, dc in directions:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 1:
+                maze[r + dr // 2][c + dc // 2] = 0
+                maze[nr][nc] = 0
+                stack.append((nr, nc, shuffled_directions()))
+                break
+        else:
+            stack.pop()
+
+    return maze
+
+
+ALGORITHMS: Dict[str, Callable[[int, int, random.Random], Grid]] = {
+    "dfs": carve_dfs,
+}
+
+DEFAULT_ALGORITHM = "dfs"
+
+
+def new_seed() -> int:
+    """Returns a fresh 32-bit seed."""
+    return random.getrandbits(32)
+
+
+def generate_maze(rows: int, cols: int, seed: Optional[int] = None,
+                  algorithm: str = DEFAULT_ALGORITHM) -> Grid:
+    """
+    Generates a maze grid (0 = path, 1 = wall) with start and end cleared.
+
+    Args:
+        rows: Number of rows.
+        cols: Number of columns.
+        seed: RNG seed; the same seed, algorithm and size always produce the
+            same maze. A random seed is used when omitted.
+        algorithm: Key into ``ALGORITHMS``.
+
+    Returns:
+        The maze as a list of rows.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown maze algorithm: {algorithm}")
+
+    rng = random.Random(new_seed() if seed is None else seed)
+    maze = ALGORITHMS[algorithm](rows, cols, rng)
+
+    # Ensure start and end are clear
+    maze[0][0] = 0
+    maze[rows-1][cols-1] = 0
+
+    # Ensure end is reachable (fix for even-sized grids)
+    # DFS nodes are at (even, even), so if end is at (odd, odd), it might be isolated.
+    # We clear adjacent cells to connect it to the nearest DFS visited nodes.
+    if rows > 1:
+        maze[rows-2][cols-1] = 0  # Top neighbor
+    if cols > 1:
+        maze[rows-1][cols-2] = 0  # Left neighbor
+
+    return maze
@@ -0,0 +1,159 @@
+# games/maze_pool.py
+"""
+Background pool of pre-generated mazes.
+
+Mazes are generated in worker processes with explicit seeds and kept in a
+small per-difficulty buffer, so starting a game only has to pop one.
+"""
+import atexit
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import MAZE_SIZES, MAZE_POOL_SIZE, MAZE_POOL_WORKERS
+from games.maze_generator import DEFAULT_ALGORITHM, generate_maze, new_seed
+from utils.metrics import get_metrics
+
+GENERATION_SECONDS = get_metrics().histogram(
+    "game_hub_maze_generation_seconds", "Time to generate one maze, in the pool's workers or inline.",
+    ("difficulty", "source"))
+TAKES = get_metrics().counter(
+    "game_hub_maze_pool_takes_total", "Mazes handed to games, by whether one was ready.", ("difficulty", "result"))
+
+
+class PooledMaze(NamedTuple):
+    """A generated maze and the descriptor that reproduces it."""
+    seed: int
+    algorithm: str
+    rows: int
+    cols: int
+    maze: List[List[int]]
+    generate_s: float = 0.0
+
+
+def _build(seed: int, algorithm: str, rows: int, cols: int) -> PooledMaze:
+    # Module-level so it can be pickled into worker processes; the time is
+    # recorded by the parent, whose metrics are the ones exported
+    start = time.perf_counter()
+    maze = generate_maze(rows, cols, seed, algorithm)
+    return PooledMaze(seed, algorithm, rows, cols, maze, time.perf_counter() - start)
+
+
+class MazePool:
+    """Keeps up to ``capacity`` ready mazes per difficulty."""
+
+    def __init__(self, sizes: Dict[str, Tuple[int, int]] = MAZE_SIZES,
+                 capacity: int = MAZE_POOL_SIZE, workers: int = MAZE_POOL_WORKERS,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        """
+        Args:
+            sizes: Difficulty name -> (rows, cols).
+            capacity: Maximum ready plus in-flight mazes per difficulty.
+            workers: Number of generator processes.
+            algorithm: Generation algorithm key.
+        """
+        self.sizes = dict(sizes)
+        self.capacity = capacity
+        self.workers = workers
+        self.algorithm = algorithm
+        self._ready: Dict[str, Deque[PooledMaze]] = {d: deque() for d in self.sizes}
+        self._pending: Dict[str, int] = {d: 0 for d in self.sizes}
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._closed = False
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self._executor is None and not self._closed:
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            except (OSError, NotImplementedError) as e:
+                print(f"Maze pool unavailable, generating synchronously: {e}")
+                self._closed = True
+        return self._executor
+
+    def fill(self, difficulty: Optional[str] = None) -> None:
+        """Schedules background generation until each buffer is at capacity."""
+        targets = [difficulty] if difficulty else list(self.sizes)
+        for diff in targets:
+            with self._lock:
+                missing = self.capacity - len(self._ready[diff]) - self._pending[diff]
+                if missing <= 0:
+                    continue
+                executor = self._get_executor()
+                if executor is None:
+                    return
+                self._pending[diff] += missing
+
+            rows, cols = self.sizes[diff]
+            for _ in range(missing):
+                try:
+                    future = executor.submit(_build, new_seed(), self.algorithm, rows, cols)
+                except RuntimeError:  # Executor shut down
+                    with self._lock:
+                        self._pending[diff] = 0
+                    return
+                future.add_done_callback(lambda f, d=diff: self._on_generated(d, f))
+
+    def _on_generated(self, difficulty: str, future: Future) -> None:
+        # Runs on the executor's management thread, never touches Tk
+        with self._lock:
+            self._pending[difficulty] = max(0, self._pending[difficulty] - 1)
+            if future.cancelled() or future.exception() is not None:
+                return
+            GENERATION_SECONDS.observe(future.result().generate_s, difficulty=difficulty, source="pool")
+            if len(self._ready[difficulty]) < self.capacity:
+                self._ready[difficulty].append(future.result())
+
+    def take(self, difficulty: str) -> PooledMaze:
+        """
+        Returns a ready maze for the difficulty, generating one synchronously
+        if the buffer is empty, and schedules a refill.
+        """
+        with self._lock:
+            ready = self._ready[difficulty]
+            item = ready.popleft() if ready else None
+
+        if item is None:
+            rows, cols = self.sizes[difficulty]
+            item = _build(new_seed(), self.algorithm, rows, cols)
+            GENERATION_SECONDS.observe(item.generate_s, difficulty=difficulty, source="inline")
+            TAKES.inc(difficulty=difficulty, result="inline")
+        else:
+            TAKES.inc(difficulty=difficulty, result="ready")
+
+        self.fill(difficulty)
+        return item
+
+    def available(self, difficulty: str) -> int:
+        """Number of ready mazes for the difficulty."""
+        with self._lock:
+            return len(self._ready[difficulty])
+
+    def shutdown(self) -> None:
+        """Stops the worker processes and drops buffered mazes."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            for ready in self._ready.values():
+                ready.clear()
+        if executor is not None:
+            if sys.version_info >= (3, 9):
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                executor.shutdown(wait=False)
+
+
+_pool_instance = None
+
+def get_maze_pool() -> MazePool:
+    global _pool_instance
+    if _pool_instance is None:
+        _pool_instance = MazePool()
+        atexit.register(_pool_instance.shutdown)
+    return _pool_instance
@@ -0,0 +1,380 @@
+# games/maze_solver.py
+"""
+Maze solving engine.
+
+Works on a compact, padded representation of the ``0 = path / 1 = wall``
+grids produced by ``games.maze_generator.generate_maze``. Cells are stored
+row-major in a single ``bytearray`` surrounded by a one-cell wall border, so
+neighbour lookups are plain index offsets with no bounds checks.
+"""
+import heapq
+from typing import List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+WALL = 1
+PATH = 0
+
+Position = Tuple[int, int]
+
+
+class CompactMaze:
+    """Flat, wall-padded view of a maze grid."""
+
+    __slots__ = ('rows', 'cols', 'width', 'cells', 'offsets')
+
+    def __init__(self, rows: int, cols: int, cells: bytearray):
+        """
+        Args:
+            rows: Number of rows in the unpadded maze.
+            cols: Number of columns in the unpadded maze.
+            cells: Padded cell buffer of size ``(rows + 2) * (cols + 2)``.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.cells = cells
+        self.offsets = (1, self.width, -1, -self.width)
+
+    @classmethod
+    def from_grid(cls, maze: Sequence[Sequence[int]]) -> 'CompactMaze':
+        """Builds a compact maze from a list-of-lists grid."""
+        rows, cols = len(maze), len(maze[0])
+        width = cols + 2
+        cells = bytearray([WALL]) * (width * (rows + 2))
+        for r, row in enumerate(maze):
+            start = (r + 1) * width + 1
+            cells[start:start + cols] = bytes(row)
+        return cls(rows, cols, cells)
+
+    def to_grid(self) -> List[List[int]]:
+        """Converts back to the list-of-lists grid used by the games."""
+        return [list(self.cells[(r + 1) * self.width + 1:(r + 1) * self.width + 1 + self.cols])
+                for r in range(self.rows)]
+
+    def index(self, pos: Sequence[int]) -> int:
+        """Flat index of a (row, col) position."""
+        return (pos[0] + 1) * self.width + pos[1] + 1
+
+    def position(self, index: int) -> Position:
+        """(row, col) position of a flat index."""
+        r, c = divmod(index, self.width)
+        return r - 1, c - 1
+
+    def is_open(self, pos: Sequence[int]) -> bool:
+        """True if the position is inside the maze and not a wall."""
+        return (0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+                and self.cells[self.index(pos)] == PATH)
+
+    def open_cells(self) -> int:
+        """Number of path cells."""
+        return self.rows * self.cols - (self.cells.count(WALL) - 2 * (self.width + self.rows))
+
+
+def _as_compact(maze) -> CompactMaze:
+    return maze if isinstance(maze, CompactMaze) else CompactMaze.from_grid(maze)
+
+
+def _walk_back(parents: dict, node: int) -> List[int]:
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    return path
+
+
+def bidirectional_bfs(maze, start: Position, end: Position) -> Optional[List[Position]]:
+    """
+    Finds a shortest path by expanding BFS frontiers from both ends.
+
+    Args:
+        maze: List-of-lists grid or ``CompactMaze``.
+        start: (row, col) start position.
+        end: (row, col) end position.
+
+    Returns:
+        List of positions from start to end inclusive, or None if unreachable.
+    """
+    grid = _as_compact(maze)
+    if not (grid.is_open(start) and grid.is_open(end)):
+        return None
+
+    cells, offsets = grid.cells, grid.offsets
+    s, e = grid.index(start), grid.index(end)
+    if s == e:
+        return [grid.position(s)]
+
+    fwd_parent = {s: None}
+    bwd_parent = {e: None}
+    fwd_frontier = [s]
+    bwd_frontier = [e]
+    meet = None
+
+    while fwd_frontier and bwd_frontier and meet is None:
+        # Always grow the smaller frontier
+        if len(fwd_frontier) <= len(bwd_frontier):
+            frontier, parents, others = fwd_frontier, fwd_parent, bwd_parent
+        else:
+            frontier, parents, others = bwd_frontier, bwd_parent, fwd_parent
+
+        next_frontier = []
+        for node in frontier:
+            for off in offsets:
+                nxt = node + off
+                if cells[nxt] or nxt in parents:
+                    continue
+                parents[nxt] = node
+                if nxt in others:
+                    meet = nxt
+                    break
+                next_frontier.append(nxt)
+            if meet is not None:
+                break
+
+        if frontier is fwd_frontier:
+            fwd_frontier = next_frontier
+        else:
+            bwd_frontier = next_frontier
+
+    if meet is None:
+        return None
+
+    forward = _walk_back(fwd_parent, meet)
+    forward.reverse()
+    backward = _walk_back(bwd_parent, meet)[1:]
+    return [grid.position(i) for i in forward + backward]
+
+
+def astar(maze, start: Position, end: Position) -> Optional[List[Position]]:
+    """
+    Finds a shortest path with A* using the Manhattan distance heuristic.
+
+    Args:
+        maze: List-of-lists grid or ``CompactMaze``.
+        start: (row, col) start position.
+        end: (row, col) end position.
+
+    Returns:
+        List of positions from start to end inclusive, or None if unreachable.
+    """
+    grid = _as_compact(maze)
+    if not (grid.is_open(start) and grid.is_open(end)):
+        return None
+
+    cells, offsets, width = grid.cells, grid.offsets, grid.width
+    s, e = grid.index(start), grid.index(end)
+    er, ec = divmod(e, width)
+
+    g_score = {s: 0}
+    parents = {s: None}
+    heap = [(abs(start[0] - end[0]) + abs(start[1] - end[1]), 0, s)]
+
+    while heap:
+        _, g, node = heapq.heappop(heap)
+        if node == e:
+            path = _walk_back(parents, node)
+            path.reverse()
+            return [grid.position(i) for i in path]
+        if g > g_score[node]:
+            continue  # Stale heap entry
+        g += 1
+        for off in offsets:
+            nxt = node + off
+            if cells[nxt] or g >= g_score.get(nxt, g + 1):
+                continue
+            g_score[nxt] = g
+            parents[nxt] = node
+            r, c = divmod(nxt, width)
+            heapq.heappush(heap, (g + abs(r - er) + abs(c - ec), g, nxt))
+
+    return None
+
+
+def shortest_path_length(maze, start: Position, end: Position) -> float:
+    """Number of moves on the shortest path, or ``inf`` if unreachable."""
+    path = bidirectional_bfs(maze, start, end)
+    return len(path) - 1 if path else float('inf')
+
+
+def frontier_distance(maze, start: Position, end: Position, use_numpy: Optional[bool] = None) -> float:
+    """
+    Shortest path length computed by whole-frontier expansion.
+
+    With NumPy available the frontier is a boolean mask grown by four array
+    shifts per step, which is much faster than per-cell BFS on very large
+    open grids. Falls back to ``shortest_path_length`` otherwise.
+
+    Args:
+        maze: List-of-lists grid or ``CompactMaze``.
+        start: (row, col) start position.
+        end: (row, col) end position.
+        use_numpy: Force (True) or disable (False) the NumPy path. Defaults
+            to using NumPy when it is installed.
+
+    Returns:
+        Number of moves, or ``inf`` if unreachable.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy:
+        return shortest_path_length(maze, start, end)
+    if np is None:
+        raise RuntimeError("NumPy is not installed")
+
+    grid = _as_compact(maze)
+    if not (grid.is_open(start) and grid.is_open(end)):
+        return float('inf')
+
+    open_mask = np.frombuffer(bytes(grid.cells), dtype=np.uint8).reshape(grid.rows + 2, grid.width) == PATH
+    visited = np.zeros_like(open_mask)
+    frontier = np.zeros_like(open_mask)
+    sr, sc = start[0] + 1, start[1] + 1
+    er, ec = end[0] + 1, end[1] + 1
+    frontier[sr, sc] = visited[sr, sc] = True
+
+    steps = 0
+    while frontier.any():
+        if visited[er, ec]:
+            return steps
+        grown = np.zeros_like(frontier)
+        # The wall border guarantees the wrapped edges are never open
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        frontier = grown & open_mask & ~visited
+        visited |= frontier
+        steps += 1
+
+    return float('inf')
+
+
+def dead_end_fill(maze, start: Position, end: Position) -> CompactMaze:
+    """
+    Fills every dead end until only cells on start-to-end routes remain.
+
+    Args:
+        maze: List-of-lists grid or ``CompactMaze``.
+        start: (row, col) start position (never filled).
+        end: (row, col) end position (never filled).
+
+    Returns:
+        A new ``CompactMaze`` whose remaining open cells are the solution
+        corridors (plus any loops attached to them).
+    """
+    grid = _as_compact(maze)
+    cells = bytearray(grid.cells)
+    offsets = grid.offsets
+    keep = {grid.index(start), grid.index(end)}
+
+    def open_degree(i: int) -> int:
+        return (not cells[i + offsets[0]]) + (not cells[i + offsets[1]]) + \
+               (not cells[i + offsets[2]]) + (not cells[i + offsets[3]])
+
+    stack = [i for i in range(len(cells))
+             if cells[i] == PATH and i not in keep and open_degree(i) <= 1]
+    while stack:
+        i = stack.pop()
+        if cells[i] or open_degree(i) > 1:
+            continue
+        cells[i] = WALL
+        for off in offsets:
+            n = i + off
+            if not cells[n] and n not in keep and open_degree(n) <= 1:
+                stack.append(n)
+
+    return CompactMaze(grid.rows, grid.cols, cells)
+
+
+def count_dead_ends(maze, start: Position = None, end: Position = None) -> int:
+    """Counts open cells with exactly one open neighbour, ignoring start and end."""
+    grid = _as_compact(maze)
+    cells, offsets = grid.cells, grid.offsets
+    skip = {grid.index(p) for p in (start, end) if p is not None}
+    count = 0
+    for i in range(len(cells)):
+        if cells[i] or i in skip:
+            continue
+        if sum(1 for off in offsets if not cells[i + off]) == 1:
+            count += 1
+    return count
+
+
+def bridges(maze, root: Position) -> Set[Tuple[int, int]]:
+    """
+    Edges (as sorted pairs of flat indexes) whose removal disconnects the
+    component containing ``root``; found with an iterative Tarjan DFS.
+    """
+    grid = _as_compact(maze)
+    cells, offsets = grid.cells, grid.offsets
+    disc = [0] * len(cells)
+    low = [0] * len(cells)
+    found: Set[Tuple[int, int]] = set()
+    r = grid.index(root)
+    if cells[r]:
+        return found
+
+    timer = 1
+    disc[r] = low[r] = timer
+    # (cell, parent, next neighbour to try)
+    stack = [(r, -1, 0)]
+    while stack:
+        v, parent, k = stack[-1]
+        if k < 4:
+            stack[-1] = (v, parent, k + 1)
+            w = v + offsets[k]
+            if cells[w]:
+                continue
+            if not disc[w]:
+                timer += 1
+                disc[w] = low[w] = timer
+                stack.append((w, v, 0))
+            elif w != parent and disc[w] < low[v]:
+                low[v] = disc[w]
+        else:
+            stack.pop()
+            if parent >= 0:
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+                if low[v] > disc[parent]:
+                    found.add((min(v, parent), max(v, parent)))
+    return found
+
+
+def has_unique_solution(maze, start: Position, end: Position) -> bool:
+    """
+    True if exactly one route connects start and end.
+
+    A second route would share a cycle with some edge of the shortest path,
+    so the route is unique exactly when every edge on that path is a bridge.
+    (Loops hanging off the route survive dead-end filling, so the filled
+    cell count alone cannot decide this.)
+    """
+    grid = _as_compact(maze)
+    path = bidirectional_bfs(grid, start, end)
+    if path is None:
+        return False
+    cut_edges = bridges(grid, start)
+    indexes = [grid.index(p) for p in path]
+    return all((min(a, b), max(a, b)) in cut_edges for a, b in zip(indexes, indexes[1:]))
+
+
+def rate_difficulty(maze, start: Position, end: Position) -> float:
+    """
+    Rates a maze between 0.0 (trivial) and 1.0 (hard).
+
+    The rating is the share of open cells that lie off the shortest solution
+    path, weighted by how many dead ends branch off.
+    """
+    grid = _as_compact(maze)
+    total = grid.open_cells()
+    if total == 0:
+        return 0.0
+    path = bidirectional_bfs(grid, start, end)
+    off_path = total - (len(path) if path else 0)
+    dead_ends = count_dead_ends(grid, start, end)
+    branchiness = min(1.0, dead_ends / max(1.0, total / 4))
+    return round(0.7 * (off_path / total) + 0.3 * branchiness, 3)
@@ -1,7 +1,7 @@
 # games/memory_game.py
 import tkinter as tk
 from tkinter import messagebox
-import random
+import math
 import time
 import sys
 import os
@@ -11,24 +11,22 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from games.base_game import BaseGame
 from ui.styles import Colors, ButtonStyles, Fonts
 from config.settings import MEMORY_CARD_COUNTS
+from games.engines.memory_engine import (MemoryEngine, REVEAL_SECOND, REVEAL_IGNORED,
+                                        CARD_HIDDEN, CARD_MATCHED)
+from ui.card_board import CardBoard
 
 
 class MemoryGame(BaseGame):
     
+    # Board width in pixels; cells shrink to fit wide boards down to MIN_CELL
+    BOARD_WIDTH = 800
+    MIN_CELL = 44
+    MAX_CELL = 100
+    
     def __init__(self, root, user_data, on_close_callback):
         self.difficulty = None
-        self.cards = []
-        self.card_buttons = []
-        self.revealed = []
-        self.matched = []
-        self.first_card = None
-        self.second_card = None
-        self.can_click = True
-        
-        # Card symbols
-        self.symbols = ['🎮', '🎯', '🎨', '🎭', '🎪', '🎸', '🎺', '🎹',
-                       '⚽', '🏀', '🏈', '⚾', '🎾', '🏐', '🏓', '🏸',
-                       '🚗', '🚕', '🚙', '🚌', '🚎', '🏎️', '🚓', '🚑']
+        self.engine = None
+        self.board = None
         
         super().__init__(root, user_data, on_close_callback, "Memory Card Game")
         self.create_game_ui()
@@ -44,7 +42,7 @@ class MemoryGame(BaseGame):
         btn_frame = tk.Frame(self.difficulty_frame, bg=Colors.BACKGROUND)
         btn_frame.pack()
         
-        for diff in ["Easy", "Medium", "Hard"]:
+        for diff in MEMORY_CARD_COUNTS:
             pairs = MEMORY_CARD_COUNTS[diff] // 2
             btn = tk.Button(btn_frame, text=f"{diff}\n({pairs} pairs)", width=12,
                            command=lambda d=diff: self.select_difficulty(d),
@@ -73,101 +71,72 @@ class MemoryGame(BaseGame):
     def start_game(self):
         self.moves = 0
         self.start_time = time.time()
-        self.matched = []
-        self.first_card = None
-        self.second_card = None
-        
-        # Get number of pairs
-        num_cards = MEMORY_CARD_COUNTS[self.difficulty]
-        num_pairs = num_cards // 2
-        
-        # Create card deck
-        self.cards = self.symbols[:num_pairs] * 2
-        random.shuffle(self.cards)
-        
-        # Create card grid
-        cols = 4
-        rows = (num_cards + cols - 1) // cols
-        
-        # Clear previous buttons
-        for btn in self.card_buttons:
-            btn.destroy()
-        self.card_buttons = []
-        
-        # Create buttons
-        for i, symbol in enumerate(self.cards):
-            row = i // cols
-            col = i % cols
-            
-            btn = tk.Button(self.game_frame, text="?", width=8, height=4,
-                           font=('Arial', 20), bg=Colors.SECONDARY, fg='white',
-                           command=lambda idx=i: self.reveal_card(idx))
-            btn.grid(row=row, column=col, padx=5, pady=5)
-            self.card_buttons.append(btn)
+        
+        # Create shuffled card deck
+        self.engine = MemoryEngine(self.difficulty)
+        num_cards = len(self.engine.cards)
+        
+        # Create card grid: four columns for the classic boards, square-ish beyond
+        cols = 4 if num_cards <= 16 else math.ceil(math.sqrt(num_cards))
+        cell = max(self.MIN_CELL, min(self.MAX_CELL, self.BOARD_WIDTH // cols))
+        
+        # One canvas, whatever the board size
+        if self.board:
+            self.board.destroy()
+        self.board = CardBoard(self.game_frame, num_cards, cols, self.card_face, self.reveal_card,
+                               cell=cell, bg=Colors.BACKGROUND)
+        self.board.pack()
         
         self.update_stats()
     
+    def card_face(self, index):
+        """(text, card fill, text fill) for a card, from its engine state."""
+        state = self.engine.state[index]
+        if state == CARD_HIDDEN:
+            return "?", Colors.SECONDARY, 'white'
+        if state == CARD_MATCHED:
+            return self.engine.symbol(index), Colors.SUCCESS, 'black'
+        return self.engine.symbol(index), 'white', 'black'
+    
     def reveal_card(self, index):
-        if not self.can_click or index in self.matched or index in self.revealed:
+        # The engine ignores clicks on face-up cards and while a pair is showing
+        result = self.engine.reveal(index)
+        if result == REVEAL_IGNORED:
             return
         
         # Reveal the card
-        self.revealed.append(index)
-        self.card_buttons[index].config(text=self.cards[index], bg='white', fg='black')
-        
-        if self.first_card is None:
-            # First card revealed
-            self.first_card = index
-        elif self.second_card is None:
-            # Second card revealed
-            self.second_card = index
-            self.moves += 1
+        self.board.refresh(index)
+        
+        if result == REVEAL_SECOND:
+            self.moves = self.engine.moves
             self.update_stats()
             
             # Check for match
-            self.can_click = False
-            self.root.after(1000, self.check_match)
+            self.clock.call_later(1000, self.check_match)
     
     def check_match(self):
-        if self.cards[self.first_card] == self.cards[self.second_card]:
-            # Match found
-            self.matched.extend([self.first_card, self.second_card])
-            self.card_buttons[self.first_card].config(state='disabled', bg=Colors.SUCCESS)
-            self.card_buttons[self.second_card].config(state='disabled', bg=Colors.SUCCESS)
-            
-            # Check if game is complete
-            if len(self.matched) == len(self.cards):
-                self.end_game()
-        else:
-            # No match - hide cards
-            self.card_buttons[self.first_card].config(text="?", bg=Colors.SECONDARY, fg='white')
-            self.card_buttons[self.second_card].config(text="?", bg=Colors.SECONDARY, fg='white')
-        
-        # Reset for next turn
-        self.revealed = []
-        self.first_card = None
-        self.second_card = None
-        self.can_click = True
+        first, second = self.engine.first_card, self.engine.second_card
+        
+        # Matched cards stay up in green, others turn back
+        matched = self.engine.resolve()
+        self.board.refresh(first)
+        self.board.refresh(second)
+        
+        # Check if game is complete
+        if matched and self.engine.finished:
+            self.end_game()
     
     def update_stats(self):
         elapsed = int(time.time() - self.start_time)
-        pairs_found = len(self.matched) // 2
-        total_pairs = len(self.cards) // 2
+        pairs_found = self.engine.pairs_found
+        total_pairs = self.engine.total_pairs
         self.stats_label.config(text=f"Moves: {self.moves}  |  Pairs: {pairs_found}/{total_pairs}  |  Time: {elapsed}s")
     
     def end_game(self):
         time_taken = time.time() - self.start_time
         
         # Calculate score
-        base_scores = {"Easy": 200, "Medium": 400, "Hard": 600}
-        base_score = base_scores[self.difficulty]
-        
-        # Optimal moves (one per pair)
-        optimal_moves = len(self.cards) // 2
-        move_penalty = (self.moves - optimal_moves) * 10
-        time_penalty = int(time_taken * 3)
-        
-        self.score = max(50, base_score - move_penalty - time_penalty)
+        self.score = self.engine.compute_score(time_taken)
         
         # Save score
         self.save_score(self.difficulty, time_taken, self.moves)
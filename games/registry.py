@@ -0,0 +1,171 @@
+# games/registry.py
+"""
+Registry of installed games.
+
+Games are described by a JSON manifest (and optionally by package entry
+points) so the dashboard can list them without importing any game code.
+Game modules are imported on first launch, or earlier by ``preload``, which
+imports one module per idle slot of the Tk loop. Import and construction
+times are recorded per game.
+"""
+import importlib
+import json
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import GAMES_MANIFEST, GAMES_ENTRY_POINT_GROUP
+
+
+class GameSpec(NamedTuple):
+    """What the dashboard needs to show a game, and where its class lives."""
+    key: str
+    name: str
+    description: str
+    icon: str
+    module: str
+    class_name: str
+
+
+class GameTiming(NamedTuple):
+    """Milliseconds spent importing a game's module and constructing its last instance."""
+    import_ms: Optional[float]
+    construct_ms: Optional[float]
+
+
+def load_manifest(path: str) -> List[GameSpec]:
+    """
+    Reads game specs from a JSON manifest.
+
+    Returns:
+        List[GameSpec]: Specs in manifest order; empty if the file is unreadable.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        return [GameSpec(e['key'], e['name'], e.get('description', ''), e.get('icon', '🎮'),
+                         e['module'], e['class']) for e in entries]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error reading game manifest {path}: {e}")
+        return []
+
+
+def discover_entry_points(group: str) -> List[GameSpec]:
+    """
+    Specs for games installed as ``module:Class`` entry points in ``group``.
+
+    Only entry point metadata is read; nothing is imported.
+    """
+    try:
+        from importlib.metadata import entry_points
+        found = entry_points()
+        eps = found.select(group=group) if hasattr(found, 'select') else found.get(group, [])
+    except Exception as e:
+        print(f"Error reading game entry points: {e}")
+        return []
+    specs = []
+    for ep in eps:
+        module, _, class_name = ep.value.partition(':')
+        specs.append(GameSpec(ep.name, ep.name.replace('_', ' ').title(), '', '🎮',
+                              module.strip(), class_name.strip()))
+    return specs
+
+
+class GameRegistry:
+    """Game specs by key, with lazy class loading and per-game timings."""
+
+    def __init__(self, specs: List[GameSpec]):
+        self.specs: Dict[str, GameSpec] = {}
+        for spec in specs:
+            self.specs.setdefault(spec.key, spec)
+        self.classes: Dict[str, type] = {}
+        self.import_ms: Dict[str, float] = {}
+        self.construct_ms: Dict[str, float] = {}
+        self.preload_id: Optional[str] = None
+
+    def __iter__(self):
+        return iter(self.specs.values())
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self.classes
+
+    def load_class(self, key: str) -> type:
+        """Imports a game's module (once) and returns its class."""
+        cls = self.classes.get(key)
+        if cls is None:
+            spec = self.specs[key]
+            start = time.perf_counter()
+            module = importlib.import_module(spec.module)
+            cls = getattr(module, spec.class_name)
+            self.import_ms[key] = (time.perf_counter() - start) * 1000
+            self.classes[key] = cls
+        return cls
+
+    def launch(self, key: str, root: Any, user_data: Dict[str, Any],
+               on_close_callback: Callable[[], None]) -> Any:
+        """Creates a game in ``root``, importing it first if needed."""
+        cls = self.load_class(key)
+        start = time.perf_counter()
+        game = cls(root, user_data, on_close_callback)
+        self.construct_ms[key] = (time.perf_counter() - start) * 1000
+        return game
+
+    def preload(self, root: Any, on_done: Optional[Callable[[], None]] = None) -> None:
+        """
+        Imports every game not yet loaded, one per idle callback.
+
+        Each import runs from ``after_idle`` and the next is queued behind a
+        short ``after``, so pending events are handled between imports.
+        A game that fails to import is reported and skipped.
+        """
+        pending = [key for key in self.specs if key not in self.classes]
+
+        def queue_step():
+            self.preload_id = root.after_idle(step)
+
+        def step():
+            self.preload_id = None
+            while pending:
+                key = pending.pop(0)
+                if key in self.classes:
+                    continue
+                try:
+                    self.load_class(key)
+                except Exception as e:
+                    print(f"Error preloading game {key}: {e}")
+                break
+            if pending:
+                self.preload_id = root.after(1, queue_step)
+            elif on_done:
+                on_done()
+
+        self.cancel_preload(root)
+        queue_step()
+
+    def cancel_preload(self, root: Any) -> None:
+        if self.preload_id is not None:
+            try:
+                root.after_cancel(self.preload_id)
+            except Exception:
+                pass
+            self.preload_id = None
+
+    def timings(self) -> Dict[str, GameTiming]:
+        """Import and construction times per game key (None if not measured yet)."""
+        return {key: GameTiming(self.import_ms.get(key), self.construct_ms.get(key)) for key in self.specs}
+
+
+_registry_instance = None
+
+def get_game_registry() -> GameRegistry:
+    global _registry_instance
+    if _registry_instance is None:
+        specs = load_manifest(GAMES_MANIFEST) + discover_entry_points(GAMES_ENTRY_POINT_GROUP)
+        _registry_instance = GameRegistry(specs)
+    return _registry_instance
@@ -1,32 +1,50 @@
 import tkinter as tk
 from tkinter import messagebox
-import win32api
-import winsound
-import random
 import time
 import sys
 import os
 import customtkinter as ctk
-from typing import List, Dict, Any, Callable, Tuple
+from typing import Dict, Any, Callable, Optional, Tuple
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from games.base_game import BaseGame
 from ui.styles import Colors, Fonts, ButtonStyles
+from games.engines.simon_engine import SimonEngine, PRESS_WRONG, PRESS_ROUND_COMPLETE
+from utils.audio import get_tone_player
+from ui.frame_clock import ClockHandle
+from ui.sequence_player import SequencePlayer
 
 class SimonGame(BaseGame):
     """
     Simon Says Game Implementation.
     Players must memorize and repeat a sequence of colors/sounds.
+    
+    Tones are played through the shared TonePlayer, which synthesizes them
+    once and plays them off the Tk thread, so flashes never block input.
+    The sequence is shown by a SequencePlayer on one drift-corrected timer
+    of the game's frame clock, getting faster each round down to MIN_STEP_MS.
     """
     
+    TONE_MS: int = 300
+    FAIL_TONE: Tuple[int, int] = (150, 500)
+    
+    # Sequence timing: step period shrinks by STEP_RAMP per round
+    BASE_STEP_MS: int = 800
+    MIN_STEP_MS: int = 300
+    STEP_RAMP: float = 0.95
+    ON_RATIO: float = 0.625 # fraction of a step the button stays lit
+    CLICK_FLASH_MS: int = 500
+    ROUND_PAUSE_MS: int = 1000
+    
     def __init__(self, root: ctk.CTk, user_data: Dict[str, Any], on_close_callback: Callable[[], None]):
         """Initialize the Simon Game."""
-        self.sequence: List[str] = []
-        self.player_sequence: List[str] = []
+        self.engine: SimonEngine = SimonEngine()
         self.buttons: Dict[str, ctk.CTkButton] = {} 
         self.game_active: bool = False
         self.showing_sequence: bool = False
+        self.round_timer: Optional[ClockHandle] = None
+        self.unflash_timers: Dict[str, ClockHandle] = {}
         
         # Colors: (Normal, Active/Bright, Frequency)
         self.color_map: Dict[str, Dict[str, Any]] = {
@@ -36,7 +54,12 @@ class SimonGame(BaseGame):
             "yellow": {"normal": "#D4AC0D", "bright": "#F1C40F", "freq": 600}
         }
         
+        # Build every tone now so the first flash doesn't pay for synthesis
+        self.audio = get_tone_player()
+        self.audio.preload([(c["freq"], self.TONE_MS) for c in self.color_map.values()] + [self.FAIL_TONE])
+        
         super().__init__(root, user_data, on_close_callback, "Simon Says")
+        self.sequence_player = SequencePlayer(self.clock, self.set_lit)
         self.create_game_ui()
 
     def create_game_ui(self) -> None:
@@ -77,8 +100,7 @@ class SimonGame(BaseGame):
 
     def start_game(self) -> None:
         """Starts a new game session."""
-        self.sequence = []
-        self.player_sequence = []
+        self.engine = SimonEngine()
         self.score = 0
         self.game_active = True
         self.start_btn.configure(state='disabled')
@@ -89,29 +111,46 @@ class SimonGame(BaseGame):
 
     def next_round(self) -> None:
         """Proceeds to the next round by adding a step to the sequence."""
-        self.player_sequence = []
-        self.score = len(self.sequence)
+        self.score = self.engine.rounds_completed
         self.update_score_display()
         
         # Add random color to sequence
-        colors = list(self.color_map.keys())
-        self.sequence.append(random.choice(colors))
+        self.engine.next_round()
         
-        self.status_label.configure(text=f"Round {len(self.sequence)}")
+        self.status_label.configure(text=f"Round {len(self.engine.sequence)}")
         
-        # Play sequence
-        self.root.after(1000, self.play_sequence)
+        # Play sequence after a short pause
+        self.round_timer = None
+        self.play_sequence(delay_ms=self.ROUND_PAUSE_MS)
+
+    def step_timing(self, round_number: int) -> Tuple[int, int]:
+        """(step period, lit time) in ms for a round, ramping up the speed."""
+        step_ms = max(self.MIN_STEP_MS, self.BASE_STEP_MS * self.STEP_RAMP ** (round_number - 1))
+        # Whole 10 ms so the tone cache only ever holds a few lengths
+        on_ms = int(step_ms * self.ON_RATIO) // 10 * 10
+        return int(step_ms), on_ms
 
-    def play_sequence(self) -> None:
+    def play_sequence(self, delay_ms: int = 0) -> None:
         """Plays back the current sequence to the player."""
         self.showing_sequence = True
-        delay = 0
+        step_ms, on_ms = self.step_timing(len(self.engine.sequence))
+        self.sequence_player.play(self.engine.sequence, step_ms, on_ms,
+                                  on_done=self.enable_input, delay_ms=delay_ms)
+
+    def set_lit(self, color: str, lit: bool) -> None:
+        """
+        Lights or dims a button, playing its tone when lit.
         
-        for color in self.sequence:
-            self.root.after(delay, lambda c=color: self.flash_button(c))
-            delay += 800 # 600ms flash + 200ms gap
-            
-        self.root.after(delay, self.enable_input)
+        Args:
+            color: The color key of the button.
+            lit: True to light the button.
+        """
+        style = self.color_map[color]
+        self.buttons[color].configure(fg_color=style["bright"] if lit else style["normal"])
+        if lit:
+            on_ms = self.sequence_player.on_s * 1000 if self.showing_sequence else self.TONE_MS
+            # Sound beep (returns immediately)
+            self.audio.play(style["freq"], int(min(self.TONE_MS, on_ms)))
 
     def flash_button(self, color: str) -> None:
         """
@@ -121,20 +160,16 @@ class SimonGame(BaseGame):
             color: The color key of the button to flash.
         """
         if not self.root: return
-        btn = self.buttons[color]
-        original_color = self.color_map[color]["normal"]
-        bright_color = self.color_map[color]["bright"]
-        frequency = self.color_map[color]["freq"]
-        
-        btn.configure(fg_color=bright_color)
-        
-        # Sound beep
-        try:
-            winsound.Beep(frequency, 300)
-        except:
-            pass
+        self.clock.cancel(self.unflash_timers.pop(color, None))
         
-        self.root.after(500, lambda: btn.configure(fg_color=original_color))
+        self.set_lit(color, True)
+        self.unflash_timers[color] = self.clock.call_later(self.CLICK_FLASH_MS, self.end_flash, color,
+                                                           name="SimonGame.end_flash")
+
+    def end_flash(self, color: str) -> None:
+        """Dims a button lit by a click."""
+        self.unflash_timers.pop(color, None)
+        self.set_lit(color, False)
 
     def enable_input(self) -> None:
         """Enables player input after sequence display."""
@@ -152,18 +187,17 @@ class SimonGame(BaseGame):
             return
         
         self.flash_button(color)
-        self.player_sequence.append(color)
         
         # Check correctness
-        idx = len(self.player_sequence) - 1
-        if self.player_sequence[idx] != self.sequence[idx]:
+        result = self.engine.press(color)
+        if result == PRESS_WRONG:
             self.end_game()
             return
             
         # Check if round complete
-        if len(self.player_sequence) == len(self.sequence):
+        if result == PRESS_ROUND_COMPLETE:
             self.status_label.configure(text="Good Job!")
-            self.root.after(1000, self.next_round)
+            self.round_timer = self.clock.call_later(self.ROUND_PAUSE_MS, self.next_round)
 
     def end_game(self) -> None:
         """Ends the game and saves score."""
@@ -172,17 +206,37 @@ class SimonGame(BaseGame):
         self.status_label.configure(text="Game Over!", text_color=Colors.DANGER)
         
         time_taken = time.time() - self.start_time
-        self.save_score("Standard", time_taken, len(self.sequence))
+        self.save_score("Standard", time_taken, len(self.engine.sequence))
         
-        try:
-            winsound.Beep(150, 500) # Fail sound
-        except:
-            pass
+        self.audio.play(*self.FAIL_TONE) # Fail sound
 
-        messagebox.showinfo("Game Over", f"Game Over!\nRounds completed: {len(self.sequence) - 1}")
+        messagebox.showinfo("Game Over", f"Game Over!\nRounds completed: {self.engine.rounds_completed}")
         self.on_close()
 
+    def report_jitter(self) -> None:
+        """
+        Prints how late sequence steps fired, relative to their deadlines, when
+        the session is profiled; otherwise it is only kept as a metric.
+        """
+        if not self.profile:
+            return
+        stats = self.sequence_player.jitter.summary()
+        if stats['count']:
+            print(f"Simon playback jitter over {stats['count']} events: "
+                  f"p50 {stats['p50']:.1f} ms, p99 {stats['p99']:.1f} ms, max {stats['max']:.1f} ms")
+
+    def stop_timers(self) -> None:
+        """Cancels sequence playback and every pending flash or round timer."""
+        self.sequence_player.cancel()
+        self.clock.cancel(self.round_timer)
+        self.round_timer = None
+        for timer in self.unflash_timers.values():
+            self.clock.cancel(timer)
+        self.unflash_timers = {}
+
     def on_close(self) -> None:
         """Cleanup on close."""
         self.game_active = False
+        self.stop_timers()
+        self.report_jitter()
         super().on_close()
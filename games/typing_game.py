@@ -5,38 +5,76 @@ import random
 import time
 import sys
 import os
-import json
 import math
-from typing import List, Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Set
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from games.base_game import BaseGame
+from ui.data_service import DataRequest
 from ui.styles import Colors, Fonts, ButtonStyles
+from games.engines.typing_engine import TypingEngine
+from utils.word_corpus import DIFFICULTY_TIERS, get_typing_corpus
+from utils.typing_analytics import KeystrokeLog, encode_summary
+from ui.canvas_pool import CanvasItemPool, ParticleSystem
+from ui.frame_clock import ClockHandle
+from utils.frame_timer import FrameTimeHistogram
+from utils.metrics import get_metrics
+
+FRAME_SECONDS = get_metrics().histogram(
+    "game_hub_typing_frame_seconds", "Typing game cost per simulation tick and per render.", ("phase",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.1))
 
 class TypingGame(BaseGame):
     """
     Typing Defense Game.
     Players must type falling words before they hit the bottom.
+    
+    Rules live in TypingEngine; this class feeds it keys and ticks and draws
+    its state. The loop is a frame clock tick due every TICK_MS; the engine
+    advances in fixed TICK_MS steps driven by an accumulator, so a late frame
+    is caught up with extra ticks instead of slowing the game down. Rendering
+    runs once per loop iteration.
     """
     
+    TICK_MS: int = TypingEngine.TICK_MS
+    MAX_CATCHUP_TICKS: int = 10
+    CANVAS_HEIGHT: int = TypingEngine.HEIGHT
+    CANVAS_BG: str = '#2C3E50'
+    WORD_FONT = ("Courier", 16, "bold")
+    OVERLAY_REFRESH_S: float = 0.5
+    
     def __init__(self, root: ctk.CTk, user_data: Dict[str, Any], on_close_callback: Callable[[], None]):
         """Initialize the Typing Game."""
-        self.active_words: List[Dict[str, Any]] = [] 
-        # List of {"word": str, "x": int, "y": int, "id": canvas_id}
-        
-        self.falling_speed: int = 1
-        self.spawn_rate: int = 2000 # ms
-        self.game_loop_id: Optional[str] = None
-        self.spawn_loop_id: Optional[str] = None
-        self.lives: int = 3
-        self.current_input: str = ""
+        self.engine: Optional[TypingEngine] = None
+        self.difficulty: Optional[str] = None
+        
+        # Engine word id -> canvas item, and the y each item was last drawn at
+        self.word_items: Dict[int, int] = {}
+        self.drawn_y: Dict[int, int] = {}
+        self.highlighted: Set[int] = set()
+        
+        self.game_loop_id: Optional[ClockHandle] = None
+        self.accumulator: float = 0.0
+        self.last_frame_time: float = 0.0
+        self.input_dirty: bool = False
+        self.stats_text: Optional[str] = None
+        self.score_text: Optional[str] = None
+        
+        # Frame-time instrumentation
+        self.tick_times = FrameTimeHistogram()
+        self.render_times = FrameTimeHistogram()
+        self.overlay_id: Optional[int] = None
+        self.overlay_updated: float = 0.0
         self.canvas: Optional[tk.Canvas] = None
+        self.word_pool: Optional[CanvasItemPool] = None
+        self.particles: Optional[ParticleSystem] = None
+        self.flash_id: Optional[ClockHandle] = None
         
         # Stats
-        self.correct_words: int = 0
         self.start_time: float = 0
         self.wpm: int = 0
+        self.keystrokes = KeystrokeLog()
         
         self.load_words()
         
@@ -44,15 +82,23 @@ class TypingGame(BaseGame):
         self.create_game_ui()
 
     def load_words(self) -> None:
-        """Loads words from JSON asset file."""
+        """Gets the shared word corpus (indexed and loaded once per process)."""
+        self.corpus = None
         try:
-            asset_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'words.json')
-            with open(asset_path, 'r') as f:
-                self.words_list = json.load(f)
+            self.corpus = get_typing_corpus()
         except Exception as e:
             print(f"Error loading words: {e}")
-            # Fallback list
-            self.words_list = ["error", "loading", "words", "fallback", "mode"]
+        # Fallback list
+        self.words_list = ["error", "loading", "words", "fallback", "mode"]
+
+    def pick_word(self, rng: random.Random = random) -> str:
+        """Draws a word from the tier matching the current difficulty."""
+        if self.corpus is not None:
+            try:
+                return self.corpus.sample(tier=DIFFICULTY_TIERS.get(self.difficulty), rng=rng)
+            except LookupError:
+                pass
+        return rng.choice(self.words_list)
 
     def create_game_ui(self) -> None:
         """Creates the UI elements."""
@@ -86,10 +132,14 @@ class TypingGame(BaseGame):
         self.stats_label.pack(pady=5)
         
         # Use standard canvas for game rendering as it's more flexible for moving text
-        self.canvas = tk.Canvas(self.game_container, width=800, height=500,
-                               bg='#2C3E50', highlightthickness=0)
+        self.canvas = tk.Canvas(self.game_container, width=TypingEngine.WIDTH, height=self.CANVAS_HEIGHT,
+                               bg=self.CANVAS_BG, highlightthickness=0)
         self.canvas.pack(pady=10)
         
+        # Word and particle items are recycled rather than created per spawn
+        self.word_pool = CanvasItemPool(self.canvas, 'text', font=self.WORD_FONT, anchor='n')
+        self.particles = ParticleSystem(self.clock, self.canvas)
+        
         # Current input display
         self.input_label = ctk.CTkLabel(self.game_container, text="Type here...", font=Fonts.large(),
                                       fg_color=Colors.SECONDARY, text_color='white', width=300, height=50,
@@ -107,123 +157,141 @@ class TypingGame(BaseGame):
         self.difficulty_frame.pack_forget()
         self.game_container.pack(fill='both', expand=True)
         
-        # Setup difficulty params
-        if difficulty == "Easy":
-            self.falling_speed = 1
-            self.spawn_rate = 2000
-        elif difficulty == "Medium":
-            self.falling_speed = 2
-            self.spawn_rate = 1500
-        else:
-            self.falling_speed = 3
-            self.spawn_rate = 1000
-            
+        self.engine = TypingEngine(difficulty, self.pick_word)
         self.score = 0
-        self.lives = 3
-        self.active_words = []
-        self.current_input = ""
-        self.correct_words = 0
+        self.word_items = {}
+        self.drawn_y = {}
+        self.highlighted = set()
+        self.keystrokes.clear()
         self.start_time = time.time()
         
         self.update_stats()
         self.update_input_display()
         
         # Bind keys
-        self.root.bind('<Key>', self.handle_keypress)
-        self.root.bind('<BackSpace>', lambda e: self.handle_backspace())
-        self.root.focus_set()
+        self.bind_key('<Key>', self.handle_keypress)
+        self.bind_key('<BackSpace>', lambda e: self.handle_backspace())
+        self.bind_key('<F3>', lambda e: self.toggle_perf_overlay())
+        self.window.focus_set()
         
-        # Start loops
-        self.spawn_word()
-        self.game_loop()
+        # Start loop
+        self.tick_times.reset()
+        self.render_times.reset()
+        self.accumulator = 0.0
+        self.last_frame_time = time.perf_counter()
+        self.add_word_item(self.engine.spawn())
+        self.clock.cancel(self.game_loop_id)
+        self.game_loop_id = self.clock.add_tick(self.game_loop, "TypingGame.game_loop", every_ms=self.TICK_MS)
 
-    def spawn_word(self) -> None:
-        """Spawns a new random word at the top of the canvas."""
-        # Pick random word
-        word = random.choice(self.words_list)
-        x_pos = random.randint(50, 750)
-        y_pos = 0
-        
-        text_id = self.canvas.create_text(x_pos, y_pos, text=word, fill='white',
-                                        font=("Courier", 16, "bold"), anchor='n')
-        
-        self.active_words.append({
-            "word": word,
-            "id": text_id,
-            "x": x_pos,
-            "y": y_pos
-        })
-        
-        # Schedule next spawn
-        self.spawn_loop_id = self.root.after(self.spawn_rate, self.spawn_word)
+    def add_word_item(self, word: Dict[str, Any]) -> None:
+        """Shows a newly spawned engine word on the canvas."""
+        self.word_items[word['id']] = self.word_pool.acquire(word['x'], word['y'], text=word['word'], fill='white')
+        self.drawn_y[word['id']] = word['y']
+        
+        # A new word may match what is already typed
+        if self.engine.current_input:
+            self.input_dirty = True
 
-    def game_loop(self) -> None:
-        """Main game loop for updating positions and checking collisions."""
-        # Move words down
-        to_remove = []
-        canvas_height = 500
-        
-        for w in self.active_words:
-            w['y'] += self.falling_speed
-            self.canvas.coords(w['id'], w['x'], w['y'])
-            
-            # Check collision with bottom
-            if w['y'] > canvas_height:
-                self.lives -= 1
-                self.canvas.delete(w['id'])
-                to_remove.append(w)
-                self.flash_damage()
+    def remove_word_item(self, word_id: int) -> None:
+        """Returns a removed engine word's canvas item to the pool."""
+        item = self.word_items.pop(word_id, None)
+        if item is not None:
+            self.word_pool.release(item)
+        self.drawn_y.pop(word_id, None)
+        self.highlighted.discard(word_id)
+
+    def game_loop(self, now: float) -> Optional[bool]:
+        """Runs the simulation ticks that are due and renders once; returns False when the game ends."""
+        tick_s = self.TICK_MS / 1000
+        self.accumulator += now - self.last_frame_time
+        self.last_frame_time = now
+        
+        # Past this much lag, drop time rather than spiral into catch-up
+        self.accumulator = min(self.accumulator, tick_s * self.MAX_CATCHUP_TICKS)
+        
+        while self.accumulator >= tick_s and not self.engine.game_over:
+            t0 = time.perf_counter()
+            self.simulate_tick()
+            elapsed = time.perf_counter() - t0
+            self.tick_times.record(elapsed)
+            FRAME_SECONDS.observe(elapsed, phase="tick")
+            self.accumulator -= tick_s
+        
+        t0 = time.perf_counter()
+        self.render()
+        elapsed = time.perf_counter() - t0
+        self.render_times.record(elapsed)
+        FRAME_SECONDS.observe(elapsed, phase="render")
+        
+        if self.engine.game_over:
+            self.game_loop_id = None
+            self.end_game()
+            return False
+        return None
+
+    def simulate_tick(self) -> None:
+        """Advances the engine by one fixed step and mirrors spawns and misses."""
+        result = self.engine.tick()
+        
+        for word in result.spawned:
+            self.add_word_item(word)
+        
+        for word in result.missed:
+            self.remove_word_item(word['id'])
+            self.flash_damage()
+        
+        if result.missed and self.engine.current_input:
+            self.input_dirty = True
+
+    def render(self) -> None:
+        """Pushes engine state to the canvas and labels, skipping anything unchanged."""
+        drawn_y = self.drawn_y
+        for word_id, w in self.engine.words.items():
+            if drawn_y.get(word_id) != w['y']:
+                self.canvas.coords(self.word_items[word_id], w['x'], w['y'])
+                drawn_y[word_id] = w['y']
         
-        for w in to_remove:
-            if w in self.active_words:
-                self.active_words.remove(w)
+        self.score = self.engine.score
+        
+        if self.input_dirty:
+            self.update_input_display()
         
         self.update_wpm()
         self.update_stats()
         
-        if self.lives <= 0:
-            self.end_game()
-            return
-            
-        self.game_loop_id = self.root.after(30, self.game_loop)
+        if self.overlay_id is not None:
+            now = time.perf_counter()
+            if now - self.overlay_updated >= self.OVERLAY_REFRESH_S:
+                self.overlay_updated = now
+                self.canvas.itemconfigure(self.overlay_id, text=self.perf_overlay_text())
 
     def handle_keypress(self, event: tk.Event) -> None:
         """Handles character input."""
+        pressed_at = time.perf_counter()
         if not event.char or len(event.char) > 1:
             return
         
         # Add char to input
         if event.char.isalpha():
-            self.current_input += event.char.lower()
+            char = event.char.lower()
+            # Trie lookup in the engine: O(len(input)) however many words are on screen
+            matched_word = self.engine.type_char(char)
+            error = matched_word is None and not self.engine.input_is_valid()
+            self.keystrokes.record(char if char.isascii() else '?', error, pressed_at)
+            
+            if matched_word:
+                # Success!
+                self.remove_word_item(matched_word['id'])
+                self.score = self.engine.score
+                self.show_success_effect(matched_word['x'], matched_word['y'])
             self.update_input_display()
-            self.check_input_match()
 
     def handle_backspace(self) -> None:
         """Handles backspace input."""
-        self.current_input = self.current_input[:-1]
+        self.keystrokes.record(None, timestamp=time.perf_counter())
+        self.engine.backspace()
         self.update_input_display()
 
-    def check_input_match(self) -> None:
-        """Checks if the typed input matches any active word."""
-        # Check if current input matches any active word
-        matched_word = None
-        
-        for w in self.active_words:
-            if w['word'] == self.current_input:
-                matched_word = w
-                break
-        
-        if matched_word:
-            # Success!
-            self.score += len(matched_word['word']) * 10
-            self.correct_words += 1
-            self.canvas.delete(matched_word['id'])
-            self.active_words.remove(matched_word)
-            self.current_input = ""
-            self.update_input_display()
-            
-            self.show_success_effect(matched_word['x'], matched_word['y'])
-
     def show_success_effect(self, x: int, y: int) -> None:
         """
         Shows a particle explosion effect at given coordinates.
@@ -232,80 +300,121 @@ class TypingGame(BaseGame):
             x: X coordinate.
             y: Y coordinate.
         """
-        # Particle explosion effect
-        particles = []
-        for _ in range(8):
-            dx = random.randint(-20, 20)
-            dy = random.randint(-20, 20)
-            p = self.canvas.create_oval(x, y, x+4, y+4, fill=Colors.SUCCESS, outline="")
-            particles.append((p, dx, dy))
-            
-        def update_particles(step=0):
-            if step > 10:
-                for p, _, _ in particles:
-                    self.canvas.delete(p)
-                return
-            
-            for p, dx, dy in particles:
-                self.canvas.move(p, dx/2, dy/2)
-                
-            self.root.after(50, lambda: update_particles(step+1))
-            
-        update_particles()
+        # Pooled particles, animated by the shared particle ticker
+        self.particles.burst(x, y, count=8, color=Colors.SUCCESS)
 
     def flash_damage(self) -> None:
         """Flashes the screen red to indicate damage."""
-        original_bg = self.canvas.cget('bg')
+        # Back-to-back hits extend one flash instead of stacking timers
+        self.clock.cancel(self.flash_id)
         self.canvas.configure(bg=Colors.DANGER)
-        self.root.after(100, lambda: self.canvas.configure(bg=original_bg))
+        self.flash_id = self.clock.call_later(100, self.end_flash)
+
+    def end_flash(self) -> None:
+        """Restores the canvas background after a damage flash."""
+        self.flash_id = None
+        self.canvas.configure(bg=self.CANVAS_BG)
 
     def update_input_display(self) -> None:
         """Updates the input label with current text and validation color."""
-        self.input_label.configure(text=self.current_input or "Type here...")
+        self.input_dirty = False
+        self.input_label.configure(text=self.engine.current_input or "Type here...")
         
         # Highlight logic
-        is_prefix = any(w['word'].startswith(self.current_input) for w in self.active_words)
-        if self.current_input and not is_prefix:
+        if not self.engine.input_is_valid():
             self.input_label.configure(fg_color=Colors.DANGER)
         else:
             self.input_label.configure(fg_color=Colors.SECONDARY)
+        
+        self.highlight_candidates()
+
+    def highlight_candidates(self) -> None:
+        """Colours every falling word that starts with the current input, touching only changed items."""
+        candidates = self.engine.candidates()
+        for word_id in self.highlighted - candidates:
+            self.canvas.itemconfigure(self.word_items[word_id], fill='white')
+        for word_id in candidates - self.highlighted:
+            self.canvas.itemconfigure(self.word_items[word_id], fill=Colors.WARNING)
+        self.highlighted = candidates
 
     def update_wpm(self) -> None:
         """Calculates and updates WPM."""
         elapsed_min = (time.time() - self.start_time) / 60
         if elapsed_min > 0:
-            self.wpm = int(self.correct_words / elapsed_min)
+            self.wpm = int(self.engine.correct_words / elapsed_min)
 
     def update_stats(self) -> None:
-        """Updates the status bar."""
-        self.stats_label.configure(text=f"Score: {self.score}  |  Lives: {'❤️' * self.lives}  |  WPM: {self.wpm}")
-        self.score_label.configure(text=f"Score: {self.score}")
+        """Updates the status bar, only reconfiguring labels whose text changed."""
+        stats_text = f"Score: {self.score}  |  Lives: {'❤️' * max(0, self.engine.lives)}  |  WPM: {self.wpm}"
+        if stats_text != self.stats_text:
+            self.stats_text = stats_text
+            self.stats_label.configure(text=stats_text)
+        
+        score_text = f"Score: {self.score}"
+        if score_text != self.score_text:
+            self.score_text = score_text
+            self.score_label.configure(text=score_text)
+
+    def perf_overlay_text(self) -> str:
+        """Formats tick and render cost percentiles for the overlay."""
+        tick = self.tick_times.summary()
+        render = self.render_times.summary()
+        return (f"tick   p50 {tick['p50']:.1f}ms  p99 {tick['p99']:.1f}ms  max {tick['max']:.1f}ms\n"
+                f"render p50 {render['p50']:.1f}ms  p99 {render['p99']:.1f}ms  max {render['max']:.1f}ms\n"
+                f"words {len(self.engine.words)}  ticks {tick['count']}  frames {render['count']}\n"
+                f"items: words {self.word_pool.created}  particles {self.particles.pool.created}")
+
+    def toggle_perf_overlay(self) -> None:
+        """Shows or hides the frame-time overlay (F3)."""
+        if self.overlay_id is None:
+            self.overlay_id = self.canvas.create_text(8, 8, text=self.perf_overlay_text(), anchor='nw',
+                                                      fill=Colors.WARNING, font=("Courier", 10))
+            self.overlay_updated = time.perf_counter()
+        else:
+            self.canvas.delete(self.overlay_id)
+            self.overlay_id = None
 
     def end_game(self) -> None:
         """Ends the game, stops loops and saves score."""
-        # Stop loops
-        if self.spawn_loop_id:
-            self.root.after_cancel(self.spawn_loop_id)
-        if self.game_loop_id:
-            self.root.after_cancel(self.game_loop_id)
+        self.stop_timers()
             
         self.update_stats()
-        try:
-            self.root.unbind('<Key>')
-        except:
-            pass
+        self.unbind_key('<Key>')
         
         time_taken = time.time() - self.start_time
-        self.save_score(self.difficulty, time_taken, self.score)
+        summary = self.keystrokes.summarize()
+        self.save_score(self.difficulty, time_taken, summary['keystrokes'])
+        self.save_typing_session(summary, time_taken)
         
         msg = f"Game Over!\n\nScore: {self.score}\nWPM: {self.wpm}\nTime: {int(time_taken)}s"
         messagebox.showinfo("Game Over", msg)
         self.on_close()
 
+    def save_typing_session(self, summary: Dict[str, Any], time_taken: float) -> DataRequest:
+        """Stores the session's keystroke analytics as one compressed row, on the data worker."""
+        minutes = time_taken / 60
+        wpm = self.engine.correct_words / minutes if minutes > 0 else 0.0
+        return self.data.submit(
+            self.db.save_typing_session,
+            user_id=self.user_data['id'],
+            keystrokes=summary['keystrokes'],
+            errors=summary['errors'],
+            backspaces=summary['backspaces'],
+            avg_interval_ms=summary['avg_interval_ms'],
+            wpm=wpm,
+            stats_blob=encode_summary(summary)
+        )
+
+    def stop_timers(self) -> None:
+        """Cancels the game loop, particle ticker and any pending damage flash."""
+        self.clock.cancel(self.game_loop_id)
+        self.game_loop_id = None
+        self.clock.cancel(self.flash_id)
+        self.flash_id = None
+        if self.particles:
+            self.particles.stop()
+
     def on_close(self) -> None:
         """Cleanup on close."""
-        if self.spawn_loop_id:
-            self.root.after_cancel(self.spawn_loop_id)
-        if self.game_loop_id:
-            self.root.after_cancel(self.game_loop_id)
+        self.stop_timers()
         super().on_close()
@@ -0,0 +1,92 @@
+# games/word_trie.py
+"""
+Incremental prefix trie over the words currently on screen.
+
+Each node keeps the keys of every word below it, so exact matches, prefix
+checks and "all candidates for this prefix" are O(len(prefix)) lookups.
+"""
+from typing import Dict, Hashable, Optional, Set
+
+
+class _Node:
+    __slots__ = ('children', 'keys', 'terminal')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.keys: Dict[Hashable, None] = {}      # Insertion-ordered set of keys below
+        self.terminal: Dict[Hashable, None] = {}  # Keys whose word ends here
+
+
+class WordTrie:
+    """Maps words to caller keys (e.g. canvas item ids); duplicate words are allowed."""
+
+    def __init__(self):
+        self._root = _Node()
+        self._words: Dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._words
+
+    def insert(self, word: str, key: Hashable) -> None:
+        """Adds a word under the given key."""
+        if key in self._words:
+            self.remove(key)
+        self._words[key] = word
+        node = self._root
+        node.keys[key] = None
+        for ch in word:
+            node = node.children.setdefault(ch, _Node())
+            node.keys[key] = None
+        node.terminal[key] = None
+
+    def remove(self, key: Hashable) -> Optional[str]:
+        """Removes the word stored under key, pruning empty branches. Returns the word."""
+        word = self._words.pop(key, None)
+        if word is None:
+            return None
+        node = self._root
+        node.keys.pop(key, None)
+        path = []
+        for ch in word:
+            path.append((node, ch))
+            node = node.children[ch]
+            node.keys.pop(key, None)
+        node.terminal.pop(key, None)
+        for parent, ch in reversed(path):
+            if parent.children[ch].keys:
+                break
+            del parent.children[ch]
+        return word
+
+    def clear(self) -> None:
+        """Removes every word."""
+        self._root = _Node()
+        self._words.clear()
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def match(self, word: str) -> Optional[Hashable]:
+        """Key of the oldest word exactly equal to ``word``, or None."""
+        node = self._find(word)
+        if node is None or not node.terminal:
+            return None
+        return next(iter(node.terminal))
+
+    def has_prefix(self, prefix: str) -> bool:
+        """True if any stored word starts with ``prefix``."""
+        node = self._find(prefix)
+        return node is not None and bool(node.keys)
+
+    def candidates(self, prefix: str) -> Set[Hashable]:
+        """Keys of every stored word starting with ``prefix``."""
+        node = self._find(prefix)
+        return set(node.keys) if node is not None else set()
@@ -1,16 +1,41 @@
 # main.py
-import tkinter as tk
-from tkinter import messagebox
-import customtkinter as ctk
+import argparse
+import contextlib
 import sys
 import os
 from typing import Optional, Dict, Any
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from utils.startup_profile import StartupProfiler
+
+# Created before the imports below so --profile-startup can time them
+PROFILER = StartupProfiler() if '--profile-startup' in sys.argv else None
+
+import tkinter as tk
+from tkinter import messagebox
+import customtkinter as ctk
+
 from ui.login_window import LoginWindow
-from ui.dashboard import Dashboard
-from config.settings import APP_NAME, APP_VERSION
+from ui.data_service import get_data_service
+from ui.lag_watchdog import get_lag_watchdog
+from config.settings import APP_NAME, APP_VERSION, LAG_WATCHDOG
+from utils.metrics import start_metrics_export
+
+if PROFILER:
+    PROFILER.record("imports", 0.0, PROFILER.elapsed_ms())
+
+
+def warm_up_backend(profiler: Optional[StartupProfiler] = None) -> None:
+    """
+    Runs on the data worker once the login window is visible: loads auth
+    (bcrypt) and creates the database schema, so the first login does not.
+    """
+    start = profiler.elapsed_ms() if profiler else 0.0
+    from auth.authentication import get_auth_manager
+    get_auth_manager()
+    if profiler:
+        profiler.record("auth + db init (worker)", start, profiler.elapsed_ms() - start)
 
 
 class MiniGameHub:
@@ -19,20 +44,60 @@ class MiniGameHub:
     Manages the root window, navigation between login and dashboard, and user session.
     """
     
-    def __init__(self):
-        """Initialize the application, setup options and creates the main window."""
-        ctk.set_appearance_mode("System")
-        ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
+    def __init__(self, profiler: Optional[StartupProfiler] = None, exit_after_startup: bool = False):
+        """
+        Initialize the application, setup options and creates the main window.
+        
+        Args:
+            profiler: Records startup phases when --profile-startup is given.
+            exit_after_startup: Quit once startup is complete (for benchmarks).
+        """
+        self.profiler = profiler
+        self.exit_after_startup = exit_after_startup
         
-        self.root = ctk.CTk()
-        self.root.title(APP_NAME)
-        # self.root.geometry("800x600") # Removed fixed geometry
-        self.root.after(0, lambda: self.root.state('zoomed')) # Maximize window
+        with self.phase("create root window"):
+            ctk.set_appearance_mode("System")
+            ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
+            
+            self.root = ctk.CTk()
+            self.root.title(APP_NAME)
+            # self.root.geometry("800x600") # Removed fixed geometry
+            self.root.after(0, lambda: self.root.state('zoomed')) # Maximize window
+            get_data_service().attach(self.root)
+            if LAG_WATCHDOG:
+                get_lag_watchdog(self.root, verbose=self.profiler is not None)
         
         self.current_user: Optional[Dict[str, Any]] = None
         self.current_window: Any = None
         
-        self.show_login()
+        with self.phase("build login window"):
+            self.show_login()
+        
+        # Idle callbacks run after Tk's own redraw, so this fires once the
+        # login window has been painted
+        self.root.after_idle(self.on_first_frame)
+    
+    def phase(self, name: str):
+        """Times a startup phase when profiling, otherwise does nothing."""
+        if self.profiler:
+            return self.profiler.phase(name)
+        return contextlib.nullcontext()
+    
+    def on_first_frame(self) -> None:
+        """Login window is on screen: start the backend warm-up and metrics export behind it."""
+        if self.profiler:
+            self.profiler.mark("first frame")
+        start_metrics_export()
+        get_data_service().submit(warm_up_backend, self.profiler, on_result=self.on_startup_complete)
+    
+    def on_startup_complete(self, _result: Any) -> None:
+        """Backend is ready; print the startup profile if one was requested."""
+        if self.profiler:
+            self.profiler.mark("startup complete")
+            self.profiler.finish()
+            print(self.profiler.format_report())
+        if self.exit_after_startup:
+            self.root.destroy()
     
     def show_login(self) -> None:
         """Switches to the Login screen."""
@@ -41,8 +106,11 @@ class MiniGameHub:
     
     def show_dashboard(self) -> None:
         """Switches to the Dashboard screen."""
+        # Imported here: the dashboard (and the game registry) is not needed for the first frame
+        from ui.dashboard import Dashboard
         self.clear_window()
-        self.current_window = Dashboard(self.root, self.current_user, self.on_logout)
+        self.current_window = Dashboard(self.root, self.current_user, self.on_logout,
+                                        report_timings=self.profiler is not None)
     
     def on_login_success(self, user_data: Dict[str, Any]) -> None:
         """
@@ -61,24 +129,48 @@ class MiniGameHub:
     
     def clear_window(self) -> None:
         """Destroys all child widgets in the root window."""
+        # Results for the screen being replaced are no longer wanted
+        if self.current_window is not None:
+            get_data_service().cancel_owner(self.current_window)
         for widget in self.root.winfo_children():
             widget.destroy()
     
     def run(self) -> None:
         """Starts the main event loop."""
         self.root.mainloop()
+        
+        watchdog = get_lag_watchdog()
+        if watchdog:
+            watchdog.stop()
+            if not watchdog.verbose:
+                return
+            stats = watchdog.summary()
+            print(f"Event loop lag: p50 {stats['p50']:.1f} ms, p99 {stats['p99']:.1f} ms, "
+                  f"max {stats['max']:.1f} ms, {stats['stalls']} stalls")
+            for culprit, count in sorted(stats['culprits'].items(), key=lambda x: -x[1]):
+                print(f"  {count:4d}  {culprit}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print import and startup phase timings once the app is ready")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="quit as soon as startup completes (used by benchmarks)")
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     """Entry point of the application."""
     try:
+        args = parse_args()
         print(f"Starting {APP_NAME} v{APP_VERSION}")
         print("=" * 50)
         
         # Create and run application
-        app = MiniGameHub()
+        app = MiniGameHub(PROFILER, exit_after_startup=args.exit_after_startup)
         app.run()
-        
+    
     except Exception as e:
         print(f"Fatal error: {e}")
         messagebox.showerror("Error", f"Application failed to start:\n{str(e)}")
@@ -87,4 +179,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
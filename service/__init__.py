@@ -0,0 +1,18 @@
+# The server (asyncio, HTTP) is only imported when asked for, so kiosks that
+# just use the client do not load it.
+import importlib
+
+_EXPORTS = {
+    'ScoreClient': '.score_client',
+    'get_score_backend': '.score_client',
+    'ScoreService': '.score_server',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
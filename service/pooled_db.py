@@ -0,0 +1,56 @@
+# service/pooled_db.py
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import DATABASE_PATH, SCORE_SERVICE_DB_POOL
+from database.db_manager import DatabaseManager, TimedConnection
+
+
+class PooledDatabaseManager(DatabaseManager):
+    """
+    A DatabaseManager for the score service: a fixed pool of threads, each
+    holding one long-lived connection, instead of a new connection per call.
+
+    Connections use WAL journaling, so the pool's readers are not blocked by
+    the service's (single, batched) writer. ``run`` awaits any
+    DatabaseManager method on the pool from the event loop.
+    """
+
+    def __init__(self, db_path: str = DATABASE_PATH, size: int = SCORE_SERVICE_DB_POOL):
+        self.size = size
+        self.local = threading.local()
+        self.connections: List[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="score-db")
+        super().__init__(db_path)
+
+    def get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = TimedConnection(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs ``fn(*args)`` (usually one of this manager's methods) on the pool."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections.clear()
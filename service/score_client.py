@@ -0,0 +1,143 @@
+# service/score_client.py
+import http.client
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit, quote
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import SCORE_SERVICE_URL, SCORE_CLIENT_TIMEOUT_S
+from database.db_manager import DatabaseManager, get_db_manager
+
+
+class ScoreClient:
+    """
+    The score and leaderboard calls of DatabaseManager, answered by a shared
+    score service instead of the local database.
+
+    Accounts stay local: a player's user id is turned into their username
+    through the local database, and the service keys scores by username.
+    Each calling thread keeps one keep-alive connection to the service.
+    Errors are printed and an empty result returned, as DatabaseManager does.
+    Replays are not sent.
+    """
+
+    def __init__(self, base_url: str, timeout: float = SCORE_CLIENT_TIMEOUT_S,
+                 local: Optional[DatabaseManager] = None):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.local_db = local
+        self.usernames: Dict[int, str] = {}
+        self.connections = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self.connections, 'conn', None)
+        if conn is None:
+            conn = self.connections.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def _request(self, method: str, path: str, query: Optional[Dict[str, Any]] = None,
+                 body: Optional[Dict[str, Any]] = None) -> Any:
+        """Sends one request and returns the decoded JSON; raises on failure."""
+        if query:
+            path += "?" + urlencode({k: v for k, v in query.items() if v is not None})
+        payload = json.dumps(body).encode('utf-8') if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload is not None else {}
+        # One retry: the service may have closed an idle keep-alive connection
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request(method, self.prefix + path, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, ConnectionError) as e:
+                conn.close()
+                self.connections.conn = None
+                if attempt:
+                    raise OSError(f"score service unreachable: {e}")
+                continue
+            except OSError:
+                conn.close()
+                self.connections.conn = None
+                raise
+            if response.status != 200:
+                raise OSError(f"score service returned {response.status}: {data[:200]!r}")
+            return json.loads(data)
+
+    def username(self, user_id: int) -> Optional[str]:
+        name = self.usernames.get(user_id)
+        if name is None:
+            user = (self.local_db or get_db_manager()).get_user_by_id(user_id)
+            if user:
+                name = self.usernames[user_id] = user['username']
+        return name
+
+    def save_game_score(self, user_id: int, game_name: str, score: int,
+                        difficulty: str = None, time_taken: float = None,
+                        moves_count: int = None, replay: Tuple[bytes, bytes] = None) -> bool:
+        try:
+            self._request('POST', '/scores', body={
+                'username': self.username(user_id), 'game_name': game_name, 'score': score,
+                'difficulty': difficulty, 'time_taken': time_taken, 'moves_count': moves_count})
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Error saving game score: {e}")
+            return False
+
+    def get_leaderboard_page(self, game_name: str, difficulty: Optional[str],
+                             offset: int, limit: int) -> List[Dict]:
+        try:
+            return self._request('GET', '/leaderboard', {'game': game_name, 'difficulty': difficulty,
+                                                         'offset': offset, 'limit': limit})['rows']
+        except (OSError, ValueError) as e:
+            print(f"Error retrieving leaderboard page: {e}")
+            return []
+
+    def count_leaderboard(self, game_name: str, difficulty: Optional[str] = None) -> int:
+        try:
+            return self._request('GET', '/leaderboard', {'game': game_name, 'difficulty': difficulty,
+                                                         'limit': 0})['total']
+        except (OSError, ValueError) as e:
+            print(f"Error counting leaderboard: {e}")
+            return 0
+
+    def get_leaderboard_difficulties(self, game_name: str) -> List[str]:
+        try:
+            return self._request('GET', '/difficulties', {'game': game_name})
+        except (OSError, ValueError) as e:
+            print(f"Error retrieving leaderboard difficulties: {e}")
+            return []
+
+    def get_user_rank(self, user_id: int, game_name: str, difficulty: Optional[str] = None) -> Optional[Dict]:
+        try:
+            return self._request('GET', '/rank', {'game': game_name, 'username': self.username(user_id),
+                                                  'difficulty': difficulty})
+        except (OSError, ValueError) as e:
+            print(f"Error retrieving rank: {e}")
+            return None
+
+    def get_user_game_stats(self, user_id: int) -> List[Dict]:
+        try:
+            return self._request('GET', f"/users/{quote(self.username(user_id) or '', safe='')}/stats")
+        except (OSError, ValueError) as e:
+            print(f"Error retrieving game stats: {e}")
+            return []
+
+
+_backend_instance = None
+
+def get_score_backend():
+    """
+    Where scores are saved and leaderboards read: a ScoreClient when
+    GAME_HUB_SCORE_SERVICE is set, otherwise the local DatabaseManager.
+    """
+    global _backend_instance
+    if _backend_instance is None:
+        _backend_instance = ScoreClient(SCORE_SERVICE_URL) if SCORE_SERVICE_URL else get_db_manager()
+    return _backend_instance
@@ -0,0 +1,454 @@
+# service/score_server.py
+"""
+Shared score and leaderboard service for many kiosks.
+
+A small asyncio HTTP/1.1 server with JSON bodies and keep-alive connections:
+
+    GET  /health
+    GET  /leaderboard?game=&difficulty=&offset=0&limit=50   -> total and rows
+    GET  /difficulties?game=
+    GET  /rank?game=&username=&difficulty=                  -> best score and rank
+    GET  /users/<username>/stats
+    POST /scores   {"username", "game_name", "score", "difficulty", "time_taken", "moves_count"}
+    GET  /metrics  (Prometheus text)
+
+Players are identified by username; kiosks keep their own accounts and
+the service creates a user row the first time a name submits a score.
+
+Database calls run on a PooledDatabaseManager. Score submissions are queued
+and committed in batches, one transaction each, and a submit is answered
+once its batch is committed. Board reads (leaderboard, difficulties, rank)
+are cached as encoded responses until a batch writes a score for that game;
+concurrent misses for the same response share one query.
+
+Usage:
+    python -m service.score_server [--host 127.0.0.1] [--port 8765] [--db path]
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import (DATABASE_PATH, SCORE_SERVICE_HOST, SCORE_SERVICE_PORT, SCORE_SERVICE_DB_POOL,
+                             SCORE_BATCH_MAX, SCORE_BATCH_WINDOW_MS, SCORE_CACHE_TTL_S, SCORE_CACHE_ENTRIES)
+from service.pooled_db import PooledDatabaseManager
+from utils.metrics import get_metrics
+
+# Service-created users cannot log in anywhere; the hash never verifies
+REMOTE_PASSWORD_HASH = "!remote"
+MAX_BODY_BYTES = 64 * 1024
+MAX_PAGE_ROWS = 500
+
+REQUEST_SECONDS = get_metrics().histogram(
+    "game_hub_service_request_seconds", "Score service request handling time.", ("route", "status"))
+BATCH_SIZE = get_metrics().histogram(
+    "game_hub_service_write_batch_size", "Scores committed per write transaction.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500))
+CACHE_LOOKUPS = get_metrics().counter(
+    "game_hub_service_cache_lookups_total", "Board response cache lookups.", ("result",))
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseCache:
+    """
+    Encoded responses keyed by request, grouped by game so a write can drop
+    every cached board of that game. Loads for the same key share one future.
+    """
+
+    def __init__(self, ttl_s: float = SCORE_CACHE_TTL_S, max_entries: int = SCORE_CACHE_ENTRIES):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        # key -> (expires at, game, body)
+        self.entries: "OrderedDict[Any, Tuple[float, str, bytes]]" = OrderedDict()
+        self.inflight: Dict[Any, "asyncio.Future[bytes]"] = {}
+        self.generations: Dict[str, int] = {}
+
+    async def get(self, key: Any, game: str, load: Callable[[], Awaitable[bytes]]) -> bytes:
+        entry = self.entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            self.entries.move_to_end(key)
+            CACHE_LOOKUPS.inc(result="hit")
+            return entry[2]
+        pending = self.inflight.get(key)
+        if pending is not None:
+            CACHE_LOOKUPS.inc(result="shared")
+            return await asyncio.shield(pending)
+
+        CACHE_LOOKUPS.inc(result="miss")
+        generation = self.generations.get(game, 0)
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            body = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here so an unshared failure is not reported as unhandled
+            future.exception()
+            raise
+        finally:
+            self.inflight.pop(key, None)
+        future.set_result(body)
+        # A write that landed while loading makes this body stale already
+        if self.generations.get(game, 0) == generation:
+            self.entries[key] = (now + self.ttl_s, game, body)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return body
+
+    def invalidate(self, game: str) -> None:
+        self.generations[game] = self.generations.get(game, 0) + 1
+        for key in [k for k, (_, g, _) in self.entries.items() if g == game]:
+            del self.entries[key]
+
+
+class ScoreBatcher:
+    """Queues score submissions and commits them in batches."""
+
+    def __init__(self, commit: Callable[[List[Dict[str, Any]]], Awaitable[List[bool]]],
+                 max_batch: int = SCORE_BATCH_MAX, window_ms: float = SCORE_BATCH_WINDOW_MS):
+        """
+        Args:
+            commit: Writes a batch; returns, per submission, True once it is committed.
+            max_batch: Most submissions per commit.
+            window_ms: How long a batch waits for more submissions.
+        """
+        self.commit = commit
+        self.max_batch = max_batch
+        self.window_s = window_ms / 1000.0
+        self.queue: "asyncio.Queue[Tuple[Dict[str, Any], asyncio.Future]]" = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def submit(self, entry: Dict[str, Any]) -> bool:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((entry, future))
+        return await future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window_s
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            BATCH_SIZE.observe(len(batch))
+            try:
+                results = await self.commit([entry for entry, _ in batch])
+            except Exception as e:
+                print(f"Error committing score batch: {e}")
+                results = [False] * len(batch)
+            for (_, future), ok in zip(batch, results):
+                if not future.done():
+                    future.set_result(ok)
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+
+class ScoreService:
+    """The HTTP service over one database."""
+
+    def __init__(self, db_path: str = DATABASE_PATH, pool_size: int = SCORE_SERVICE_DB_POOL,
+                 batch_max: int = SCORE_BATCH_MAX, batch_window_ms: float = SCORE_BATCH_WINDOW_MS,
+                 cache_ttl_s: float = SCORE_CACHE_TTL_S):
+        self.db = PooledDatabaseManager(db_path, pool_size)
+        self.cache = ResponseCache(cache_ttl_s)
+        self.batch_max = batch_max
+        self.batch_window_ms = batch_window_ms
+        self.batcher: Optional[ScoreBatcher] = None
+        self.user_ids: Dict[str, int] = {}
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.routes: Dict[Tuple[str, str], Callable[[Dict[str, str], bytes], Awaitable[bytes]]] = {
+            ('GET', '/health'): self.health,
+            ('GET', '/leaderboard'): self.leaderboard,
+            ('GET', '/difficulties'): self.difficulties,
+            ('GET', '/rank'): self.rank,
+            ('POST', '/scores'): self.submit_score,
+        }
+
+    async def start(self, host: str = SCORE_SERVICE_HOST, port: int = SCORE_SERVICE_PORT) -> asyncio.AbstractServer:
+        self.batcher = ScoreBatcher(self.commit_scores, self.batch_max, self.batch_window_ms)
+        self.batcher.start()
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            await self.batcher.stop()
+        self.db.close()
+
+    # HTTP
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                raw_length = headers.get('content-length') or "0"
+                # Digits only: int() would also take signs, spaces and underscores
+                if not (raw_length.isascii() and raw_length.isdigit()):
+                    writer.write(self.response(400, json.dumps({'error': "invalid Content-Length"}).encode(), False))
+                    break
+                length = int(raw_length)
+                if length > MAX_BODY_BYTES:
+                    writer.write(self.response(413, json.dumps({'error': "body too large"}).encode(), False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                keep_alive = version == "HTTP/1.1" and headers.get('connection', '').lower() != "close"
+                status, payload, content_type = await self.dispatch(method, target, body)
+                writer.write(self.response(status, payload, keep_alive, content_type))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def response(status: int, payload: bytes, keep_alive: bool, content_type: str = "application/json") -> bytes:
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        return head.encode('latin-1') + payload
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, bytes, str]:
+        start = time.perf_counter()
+        parts = urlsplit(target)
+        path = parts.path.rstrip('/') or '/'
+        query = dict(parse_qsl(parts.query))
+        route = path
+        content_type = "application/json"
+        try:
+            if path == '/metrics' and method == 'GET':
+                payload = get_metrics().render().encode('utf-8')
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path.startswith('/users/') and path.endswith('/stats') and method == 'GET':
+                route = '/users/stats'
+                payload = await self.user_stats(unquote(path[len('/users/'):-len('/stats')]))
+            else:
+                handler = self.routes.get((method, path))
+                if handler is None:
+                    known = any(p == path for _, p in self.routes)
+                    raise HTTPError(405 if known else 404, f"{method} {path} not supported")
+                payload = await handler(query, body)
+            status = 200
+        except HTTPError as e:
+            status, payload = e.status, json.dumps({'error': str(e)}).encode()
+            route = route if status != 404 else 'unknown'
+        except Exception as e:
+            print(f"Error handling {method} {target}: {e}")
+            status, payload = 500, json.dumps({'error': "internal error"}).encode()
+        REQUEST_SECONDS.observe(time.perf_counter() - start, route=route, status=status)
+        return status, payload, content_type
+
+    # Routes
+
+    @staticmethod
+    def encode(data: Any) -> bytes:
+        return json.dumps(data, default=str, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def require(query: Dict[str, str], name: str) -> str:
+        value = query.get(name)
+        if not value:
+            raise HTTPError(400, f"missing '{name}'")
+        return value
+
+    @staticmethod
+    def int_arg(query: Dict[str, str], name: str, default: int, low: int, high: int) -> int:
+        try:
+            value = int(query.get(name, default))
+        except ValueError:
+            raise HTTPError(400, f"'{name}' must be an integer")
+        return max(low, min(value, high))
+
+    async def health(self, query: Dict[str, str], body: bytes) -> bytes:
+        return self.encode({'ok': True})
+
+    async def leaderboard(self, query: Dict[str, str], body: bytes) -> bytes:
+        game = self.require(query, 'game')
+        difficulty = query.get('difficulty') or None
+        offset = self.int_arg(query, 'offset', 0, 0, 1 << 31)
+        limit = self.int_arg(query, 'limit', 50, 0, MAX_PAGE_ROWS)
+
+        async def load() -> bytes:
+            total = await self.db.run(self.db.count_leaderboard, game, difficulty)
+            rows = await self.db.run(self.db.get_leaderboard_page, game, difficulty, offset, limit) if limit else []
+            return self.encode({'game': game, 'difficulty': difficulty, 'offset': offset,
+                                'total': total, 'rows': rows})
+
+        return await self.cache.get(('leaderboard', game, difficulty, offset, limit), game, load)
+
+    async def difficulties(self, query: Dict[str, str], body: bytes) -> bytes:
+        game = self.require(query, 'game')
+
+        async def load() -> bytes:
+            return self.encode(await self.db.run(self.db.get_leaderboard_difficulties, game))
+
+        return await self.cache.get(('difficulties', game), game, load)
+
+    async def rank(self, query: Dict[str, str], body: bytes) -> bytes:
+        game = self.require(query, 'game')
+        username = self.require(query, 'username')
+        difficulty = query.get('difficulty') or None
+
+        async def load() -> bytes:
+            user_id = await self.user_id(username, create=False)
+            rank = await self.db.run(self.db.get_user_rank, user_id, game, difficulty) if user_id else None
+            return self.encode(rank)
+
+        return await self.cache.get(('rank', game, difficulty, username), game, load)
+
+    async def user_stats(self, username: str) -> bytes:
+        user_id = await self.user_id(username, create=False)
+        stats = await self.db.run(self.db.get_user_game_stats, user_id) if user_id else []
+        return self.encode(stats)
+
+    async def submit_score(self, query: Dict[str, str], body: bytes) -> bytes:
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "body must be JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "body must be a JSON object")
+        username, game = data.get('username'), data.get('game_name')
+        if not isinstance(username, str) or not username or not isinstance(game, str) or not game:
+            raise HTTPError(400, "'username' and 'game_name' are required")
+        # bool is an int subclass; JSON true/false is not a score
+        if not isinstance(data.get('score'), int) or isinstance(data['score'], bool):
+            raise HTTPError(400, "'score' must be an integer")
+        entry = {'username': username, 'game_name': game, 'score': data['score'],
+                 'difficulty': data.get('difficulty'), 'time_taken': data.get('time_taken'),
+                 'moves_count': data.get('moves_count')}
+        if not await self.batcher.submit(entry):
+            raise HTTPError(503, "score could not be saved")
+        return self.encode({'ok': True})
+
+    # Database
+
+    async def user_id(self, username: str, create: bool) -> Optional[int]:
+        user_id = self.user_ids.get(username)
+        if user_id is None:
+            user_id = await self.db.run(self.lookup_user, username, create)
+            if user_id is not None:
+                self.user_ids[username] = user_id
+        return user_id
+
+    def lookup_user(self, username: str, create: bool) -> Optional[int]:
+        """Runs on the pool: the user's id, creating the user if asked."""
+        user = self.db.get_user_by_username(username)
+        if user is None and create:
+            user_id = self.db.create_user(username, REMOTE_PASSWORD_HASH)
+            if user_id is not None:
+                return user_id
+            # Created concurrently (or failed): look again
+            user = self.db.get_user_by_username(username)
+        return user['id'] if user else None
+
+    async def commit_scores(self, entries: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Resolves usernames and writes one batch in a single transaction.
+        An entry whose user cannot be resolved fails on its own; the rest
+        of the batch is still written.
+        """
+        results = [False] * len(entries)
+        rows, committed = [], []
+        for i, entry in enumerate(entries):
+            user_id = await self.user_id(entry['username'], create=True)
+            if user_id is not None:
+                rows.append(dict(entry, user_id=user_id))
+                committed.append(i)
+        if not rows or not await self.db.run(self.db.save_game_scores, rows):
+            return results
+        for i in committed:
+            results[i] = True
+        for game in {row['game_name'] for row in rows}:
+            self.cache.invalidate(game)
+        return results
+
+
+async def serve(host: str, port: int, db_path: str, pool_size: int) -> None:
+    service = ScoreService(db_path, pool_size)
+    await service.start(host, port)
+    print(f"Score service on http://{host}:{service.port} (database {db_path})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shared score and leaderboard service")
+    parser.add_argument("--host", default=SCORE_SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SCORE_SERVICE_PORT)
+    parser.add_argument("--db", default=DATABASE_PATH, help="SQLite database to serve")
+    parser.add_argument("--pool", type=int, default=SCORE_SERVICE_DB_POOL, help="database threads")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.db, args.pool))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,17 @@
+# Screens are imported on first access: importing one ui module (e.g. the
+# login window at startup) does not pull in the dashboard and its games.
+import importlib
 
-from ui.login_window import LoginWindow
-from ui.dashboard import Dashboard
+_UI_MODULES = {
+    'LoginWindow': '.login_window',
+    'Dashboard': '.dashboard',
+}
 
-__all__ = ['LoginWindow', 'Dashboard']
+__all__ = list(_UI_MODULES)
+
+
+def __getattr__(name):
+    if name in _UI_MODULES:
+        module = importlib.import_module(_UI_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
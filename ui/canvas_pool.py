@@ -0,0 +1,133 @@
+# ui/canvas_pool.py
+import tkinter as tk
+import random
+from typing import Any, Dict, List, Optional
+
+
+class CanvasItemPool:
+    """
+    Recycles canvas items of one type instead of creating and deleting them.
+
+    Released items are hidden and kept on a free list; acquiring one moves
+    it, applies the new options and shows it again, so Tk item ids stay
+    bounded by the peak number of items on screen.
+    """
+
+    def __init__(self, canvas: tk.Canvas, item_type: str, max_free: int = 256, **defaults: Any):
+        """
+        Args:
+            canvas: Canvas that owns the items.
+            item_type: Canvas item type, e.g. "text" or "oval".
+            max_free: Hidden items to keep; extras are deleted on release.
+            **defaults: Options applied when an item is first created.
+        """
+        self.canvas = canvas
+        self.item_type = item_type
+        self.max_free = max_free
+        self.defaults = defaults
+        self.free: List[int] = []
+        self.created = 0
+
+    def acquire(self, *coords: float, **options: Any) -> int:
+        """Returns a visible item at the given coordinates with the given options."""
+        if self.free:
+            item = self.free.pop()
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state='normal', **options)
+            return item
+        self.created += 1
+        create = getattr(self.canvas, f"create_{self.item_type}")
+        return create(*coords, **{**self.defaults, **options})
+
+    def release(self, item: int) -> None:
+        """Hides an item and returns it to the pool."""
+        if len(self.free) >= self.max_free:
+            self.canvas.delete(item)
+            return
+        self.canvas.itemconfigure(item, state='hidden')
+        self.free.append(item)
+
+    def clear(self) -> None:
+        """Deletes all pooled (hidden) items."""
+        for item in self.free:
+            self.canvas.delete(item)
+        self.free = []
+
+
+class ParticleSystem:
+    """
+    Short-lived particle bursts animated by a single shared ticker.
+
+    However many bursts are alive, there is at most one pending ``after``
+    callback, and each frame updates every particle in one pass.
+    """
+
+    def __init__(self, root: tk.Misc, canvas: tk.Canvas, frame_ms: int = 50, size: int = 4):
+        """
+        Args:
+            root: Widget or FrameClock used for scheduling.
+            canvas: Canvas to draw on.
+            frame_ms: Milliseconds between animation frames.
+            size: Particle diameter in pixels.
+        """
+        self.root = root
+        self.canvas = canvas
+        self.frame_ms = frame_ms
+        self.size = size
+        self.pool = CanvasItemPool(canvas, 'oval', outline='')
+        # Each particle: [item, x, y, dx, dy, frames_left]
+        self.particles: List[List[Any]] = []
+        self.ticker_id: Optional[str] = None
+
+    def burst(self, x: float, y: float, count: int = 8, color: str = 'white',
+              spread: int = 20, frames: int = 11) -> None:
+        """
+        Emits a burst of particles from a point.
+
+        Args:
+            x: X coordinate.
+            y: Y coordinate.
+            count: Number of particles.
+            color: Fill colour.
+            spread: Maximum speed in pixels per two frames along each axis.
+            frames: Frames each particle lives for.
+        """
+        for _ in range(count):
+            item = self.pool.acquire(x, y, x + self.size, y + self.size, fill=color)
+            dx = random.randint(-spread, spread) / 2
+            dy = random.randint(-spread, spread) / 2
+            self.particles.append([item, x, y, dx, dy, frames])
+        if self.ticker_id is None:
+            self.ticker_id = self.root.after(self.frame_ms, self.tick)
+
+    def tick(self) -> None:
+        """Advances every live particle by one frame."""
+        self.ticker_id = None
+        alive = []
+        coords = self.canvas.coords
+        size = self.size
+        for p in self.particles:
+            p[5] -= 1
+            if p[5] <= 0:
+                self.pool.release(p[0])
+                continue
+            p[1] += p[3]
+            p[2] += p[4]
+            coords(p[0], p[1], p[2], p[1] + size, p[2] + size)
+            alive.append(p)
+        self.particles = alive
+        if alive:
+            self.ticker_id = self.root.after(self.frame_ms, self.tick)
+
+    def stats(self) -> Dict[str, int]:
+        """Live particles, pooled items and total items ever created."""
+        return {'live': len(self.particles), 'pooled': len(self.pool.free), 'created': self.pool.created}
+
+    def stop(self) -> None:
+        """Cancels the ticker and hides every live particle."""
+        if self.ticker_id is not None:
+            self.root.after_cancel(self.ticker_id)
+            self.ticker_id = None
+        for p in self.particles:
+            self.pool.release(p[0])
+        self.particles = []
@@ -0,0 +1,132 @@
+# ui/card_board.py
+import tkinter as tk
+from typing import Callable, List, Tuple
+
+
+class CardBoard:
+    """
+    A grid of cards drawn on one scrollable canvas.
+
+    Only the rows in view have canvas items: one rectangle and one text item
+    per visible cell, created once and re-bound to other cards as the board
+    scrolls. Clicks are mapped to card indexes arithmetically, so board size
+    only affects the scroll region, not the number of widgets or items.
+    """
+
+    def __init__(self, parent: tk.Misc, count: int, columns: int,
+                 face: Callable[[int], Tuple[str, str, str]], on_click: Callable[[int], None],
+                 cell: int = 100, gap: int = 8, max_height: int = 560,
+                 bg: str = 'white', font_family: str = 'Arial'):
+        """
+        Args:
+            parent: Widget to place the board in.
+            count: Number of cards.
+            columns: Cards per row.
+            face: Returns (text, card fill, text fill) for a card index.
+            on_click: Called with the index of a clicked card.
+            cell: Cell size in pixels, card plus gap.
+            gap: Space between cards in pixels.
+            max_height: Viewport height; taller boards scroll.
+            bg: Canvas background.
+            font_family: Font for card faces; size follows the cell size.
+        """
+        self.count = count
+        self.columns = columns
+        self.rows = (count + columns - 1) // columns
+        self.face = face
+        self.on_click = on_click
+        self.cell = cell
+        self.gap = gap
+
+        width = columns * cell
+        board_height = self.rows * cell
+        height = min(board_height, max_height)
+
+        self.frame = tk.Frame(parent, bg=bg)
+        self.canvas = tk.Canvas(self.frame, width=width, height=height, bg=bg,
+                                highlightthickness=0, scrollregion=(0, 0, width, board_height))
+        self.canvas.pack(side='left')
+        if board_height > height:
+            scrollbar = tk.Scrollbar(self.frame, orient='vertical', command=self.yview)
+            scrollbar.pack(side='right', fill='y')
+            self.canvas.configure(yscrollcommand=scrollbar.set)
+            self.canvas.bind('<MouseWheel>', self.on_wheel)
+            self.canvas.bind('<Button-4>', lambda e: self.yview('scroll', -1, 'units'))
+            self.canvas.bind('<Button-5>', lambda e: self.yview('scroll', 1, 'units'))
+        self.canvas.configure(yscrollincrement=cell)
+        self.canvas.bind('<Button-1>', self.on_press)
+
+        # One slot row per visible row (plus one for partial rows while scrolling)
+        self.font = (font_family, max(8, cell // 4))
+        self.visible_rows = min(self.rows, height // cell + 2)
+        self.first_row = 0
+        self.slots: List[List[Tuple[int, int]]] = []
+        for _ in range(self.visible_rows):
+            row_items = []
+            for _ in range(columns):
+                rect = self.canvas.create_rectangle(0, 0, 0, 0, outline='')
+                text = self.canvas.create_text(0, 0, font=self.font)
+                row_items.append((rect, text))
+            self.slots.append(row_items)
+        self.bind_rows()
+
+    def pack(self, **kwargs) -> None:
+        self.frame.pack(**kwargs)
+
+    def destroy(self) -> None:
+        self.frame.destroy()
+
+    def index_at(self, x: float, y: float) -> int:
+        """Card index under canvas coordinates, or -1 for gaps and empty cells."""
+        col, row = int(x // self.cell), int(y // self.cell)
+        if not (0 <= col < self.columns and 0 <= row < self.rows):
+            return -1
+        if x - col * self.cell >= self.cell - self.gap or y - row * self.cell >= self.cell - self.gap:
+            return -1
+        index = row * self.columns + col
+        return index if index < self.count else -1
+
+    def on_press(self, event) -> None:
+        index = self.index_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if index >= 0:
+            self.on_click(index)
+
+    def on_wheel(self, event) -> None:
+        self.yview('scroll', -1 if event.delta > 0 else 1, 'units')
+
+    def yview(self, *args) -> None:
+        """Scrolls the canvas and re-binds slots if the first visible row changed."""
+        self.canvas.yview(*args)
+        first_row = int(self.canvas.canvasy(0) // self.cell)
+        first_row = max(0, min(first_row, self.rows - self.visible_rows))
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.bind_rows()
+
+    def bind_rows(self) -> None:
+        """Moves every slot onto the card it now shows and redraws it."""
+        for offset, row_items in enumerate(self.slots):
+            row = self.first_row + offset
+            for col, (rect, text) in enumerate(row_items):
+                index = row * self.columns + col
+                if index >= self.count:
+                    self.canvas.itemconfigure(rect, state='hidden')
+                    self.canvas.itemconfigure(text, state='hidden')
+                    continue
+                x, y = col * self.cell, row * self.cell
+                size = self.cell - self.gap
+                self.canvas.coords(rect, x, y, x + size, y + size)
+                self.canvas.coords(text, x + size / 2, y + size / 2)
+                self.draw_slot(index, rect, text)
+
+    def draw_slot(self, index: int, rect: int, text: int) -> None:
+        label, fill, text_fill = self.face(index)
+        self.canvas.itemconfigure(rect, fill=fill, state='normal')
+        self.canvas.itemconfigure(text, text=label, fill=text_fill, state='normal')
+
+    def refresh(self, index: int) -> None:
+        """Redraws one card if it is in view."""
+        offset = index // self.columns - self.first_row
+        if 0 <= offset < self.visible_rows:
+            rect, text = self.slots[offset][index % self.columns]
+            self.draw_slot(index, rect, text)
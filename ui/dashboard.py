@@ -8,14 +8,21 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ui.styles import Fonts
-from config.settings import DASHBOARD_WIDTH, DASHBOARD_HEIGHT, APP_NAME
+from config.settings import DASHBOARD_WIDTH, DASHBOARD_HEIGHT, APP_NAME, PRELOAD_GAMES, SESSION_PROFILE
 from database.db_manager import get_db_manager
-from utils.helpers import format_score
+from service.score_client import get_score_backend
+from utils.session_profile import list_profiles, profile_modes
+from utils.typing_analytics import slowest_bigrams
+from games.registry import get_game_registry
+from ui.data_service import get_data_service
+from ui.game_host import GameHost
+from ui.leaderboard_panel import LeaderboardPanel
+from ui.stat_cards import KeyedCardList, GameStatCard, TypingInsightsCard, ProfileCard
 
 class Dashboard:
     """Main application dashboard."""
     
-    def __init__(self, root, user_data, on_logout):
+    def __init__(self, root, user_data, on_logout, report_timings=False):
         """
         Initialize the dashboard.
         
@@ -23,15 +30,26 @@ class Dashboard:
             root: Parent CustomTkinter window (CTk)
             user_data: Dictionary containing user information
             on_logout: Callback function when user logs out
+            report_timings: Print game preload timings (--profile-startup)
         """
         self.root = root
         self.user_data = user_data
         self.on_logout = on_logout
         self.db = get_db_manager()
+        self.scores = get_score_backend()
+        self.data = get_data_service()
+        self.registry = get_game_registry()
+        # One game window, created on the first launch and reused afterwards
+        self.game_host = GameHost(self.root)
         
         self.setup_window()
         self.create_widgets()
         self.load_user_stats()
+        
+        # Import game modules while the user looks at the dashboard
+        if PRELOAD_GAMES:
+            # Timings stay available from registry.timings(); printed only when profiling startup
+            self.registry.preload(self.root, on_done=self.report_game_timings if report_timings else None)
     
     def setup_window(self):
         """Configure the dashboard window."""
@@ -61,8 +79,8 @@ class Dashboard:
         logout_btn.pack(side='right', padx=20, pady=20)
         
         # Refresh button
-        refresh_btn = ctk.CTkButton(header_frame, text="Refresh Stats", command=self.load_user_stats)
-        refresh_btn.pack(side='right', padx=10, pady=20)
+        self.refresh_btn = ctk.CTkButton(header_frame, text="Refresh Stats", command=self.load_user_stats)
+        self.refresh_btn.pack(side='right', padx=10, pady=20)
         
         # Main content area
         # Left side - Games
@@ -74,177 +92,127 @@ class Dashboard:
         
         self.create_game_buttons(games_frame)
         
-        # Right side - Statistics
-        stats_frame = ctk.CTkFrame(self.root)
-        stats_frame.grid(row=1, column=1, sticky="nsew", padx=20, pady=20)
-        
-        stats_label = ctk.CTkLabel(stats_frame, text="Your Statistics", font=Fonts.large())
-        stats_label.pack(pady=10)
+        # Right side - Statistics and leaderboard
+        self.side_tabs = ctk.CTkTabview(self.root, command=self.on_side_tab)
+        self.side_tabs.grid(row=1, column=1, sticky="nsew", padx=20, pady=20)
+        stats_frame = self.side_tabs.add("Your Statistics")
+        leaderboard_frame = self.side_tabs.add("Leaderboard")
         
         # Scrollable frame for stats
         self.stats_scroll = ctk.CTkScrollableFrame(stats_frame, label_text="Stats History")
         self.stats_scroll.pack(fill="both", expand=True, padx=10, pady=10)
         
-        self.create_stats_display() # Initializes the container structure (already done by ScrollableFrame)
+        self.create_stats_display()
+        
+        # Scores are stored under each game's display name
+        self.leaderboard = LeaderboardPanel(leaderboard_frame, [game.name for game in self.registry])
+        self.leaderboard.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Captured game session profiles, only while profiling is switched on
+        self.profile_cards = None
+        if profile_modes(SESSION_PROFILE):
+            profiles_scroll = ctk.CTkScrollableFrame(self.side_tabs.add("Profiles"), label_text="Session Profiles")
+            profiles_scroll.pack(fill="both", expand=True, padx=10, pady=10)
+            self.profile_cards = KeyedCardList(profiles_scroll, empty_text="No sessions profiled yet.")
     
     def create_game_buttons(self, parent):
-        """Create buttons for each game."""
-        games = [
-            {
-                'name': 'Maze Path Game',
-                'description': 'Navigate through mazes',
-                'icon': '🎯',
-                'command': self.launch_maze_game
-            },
-            {
-                'name': 'Memory Card Game',
-                'description': 'Match pairs of cards',
-                'icon': '🃏',
-                'command': self.launch_memory_game
-            },
-            {
-                'name': 'Hangman Game',
-                'description': 'Guess the word',
-                'icon': '📝',
-                'command': self.launch_hangman_game
-            },
-            {
-                'name': 'Typing Defense',
-                'description': 'Type fast to survive',
-                'icon': '⌨️',
-                'command': self.launch_typing_game
-            },
-            {
-                'name': 'Simon Says',
-                'description': 'Follow the sequence',
-                'icon': '🔴',
-                'command': self.launch_simon_game
-            }
-        ]
-        
-        for game in games:
+        """Create buttons for each registered game (no game code is imported here)."""
+        for game in self.registry:
             card = ctk.CTkFrame(parent)
             card.pack(fill='x', padx=10, pady=10)
             
             # Icon
-            ctk.CTkLabel(card, text=game['icon'], font=("Arial", 30)).pack(side='left', padx=10)
+            ctk.CTkLabel(card, text=game.icon, font=("Arial", 30)).pack(side='left', padx=10)
             
             # Info
             info_frame = ctk.CTkFrame(card, fg_color="transparent")
             info_frame.pack(side='left', fill='both', expand=True)
             
-            ctk.CTkLabel(info_frame, text=game['name'], font=Fonts.normal(), anchor="w").pack(fill='x')
-            ctk.CTkLabel(info_frame, text=game['description'], font=Fonts.small(), text_color="gray", anchor="w").pack(fill='x')
+            ctk.CTkLabel(info_frame, text=game.name, font=Fonts.normal(), anchor="w").pack(fill='x')
+            ctk.CTkLabel(info_frame, text=game.description, font=Fonts.small(), text_color="gray", anchor="w").pack(fill='x')
             
             # Play button
-            ctk.CTkButton(card, text="Play", command=game['command'], width=60).pack(side='right', padx=10)
+            ctk.CTkButton(card, text="Play", command=lambda k=game.key: self.launch_game(k), width=60).pack(side='right', padx=10)
     
     def create_stats_display(self):
         """Setup stats display."""
-        # CustomTkinter ScrollableFrame handles the scrolling automatically.
-        # We just add children to self.stats_scroll
-        pass
+        # Cards are keyed by game and kept across refreshes; each refresh
+        # only reconfigures, adds or removes the cards that changed
+        self.stat_cards = KeyedCardList(self.stats_scroll, empty_text="No games played yet!")
 
     def load_user_stats(self):
-        """Load and display user statistics."""
-        # Clear existing stats
-        for widget in self.stats_scroll.winfo_children():
-            widget.destroy()
-        
-        # Get stats from database
-        stats = self.db.get_user_game_stats(self.user_data['id'])
-        
-        if not stats:
-            ctk.CTkLabel(self.stats_scroll, text="No games played yet!").pack(pady=20)
-            return
-        
-        # Display stats for each game
-        for stat in stats:
-            self.create_stat_card(stat)
+        """Load user statistics in the background; the cards update when they arrive."""
+        user_id = self.user_data['id']
+        # Refreshes asked for while one is still queued share it
+        self.data.submit(self.fetch_user_stats, user_id, on_result=self.show_user_stats,
+                         key=('user_stats', user_id), owner=self, loading=self)
     
-    def create_stat_card(self, stat):
-        """Create a card displaying stats for one game."""
-        card = ctk.CTkFrame(self.stats_scroll)
-        card.pack(fill='x', padx=5, pady=5)
-        
-        # Header
-        ctk.CTkLabel(card, text=stat['game_name'], font=Fonts.normal()).pack(pady=5)
-        
-        # Stats Grid
-        grid_frame = ctk.CTkFrame(card, fg_color="transparent")
-        grid_frame.pack(fill='x', padx=10, pady=5)
-        
-        ctk.CTkLabel(grid_frame, text=f"Played: {stat['games_played']}").pack(side='left', padx=10)
-        ctk.CTkLabel(grid_frame, text=f"Best: {format_score(stat['best_score'])}").pack(side='right', padx=10)
-        # Avg could go on a new line or middle, but this is fine for now
-
-    def launch_maze_game(self):
-        """Launch the Maze Path Game."""
-        try:
-            from games.maze_game import MazeGame
-            # For games, we might want a new Toplevel, CTk has CTkToplevel
-            game_window = ctk.CTkToplevel(self.root)
-            # Ensure it comes to front
-            game_window.attributes('-topmost', True)
-            game_window.after(100, lambda: game_window.attributes('-topmost', False))
-            
-            MazeGame(game_window, self.user_data, self.on_game_close)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
+    def fetch_user_stats(self, user_id):
+        """Runs on the data worker: per-game stats plus typing insights."""
+        stats = self.scores.get_user_game_stats(user_id)
+        bigrams = slowest_bigrams(self.db.get_typing_stats_blobs(user_id)) if stats else []
+        return stats, bigrams
     
-    def launch_memory_game(self):
-        """Launch the Memory Card Game."""
-        try:
-            from games.memory_game import MemoryGame
-            game_window = ctk.CTkToplevel(self.root)
-            game_window.attributes('-topmost', True)
-            game_window.after(100, lambda: game_window.attributes('-topmost', False))
-            
-            MemoryGame(game_window, self.user_data, self.on_game_close)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
+    def show_user_stats(self, result):
+        """Update the stat cards that changed."""
+        stats, bigrams = result
+        entries = [(f"game:{stat['game_name']}", GameStatCard, stat) for stat in stats]
+        if bigrams:
+            entries.append(("typing:bigrams", TypingInsightsCard, bigrams))
+        
+        self.stat_cards.sync(entries)
     
-    def launch_hangman_game(self):
-        """Launch the Hangman Game."""
-        try:
-            from games.hangman_game import HangmanGame
-            game_window = ctk.CTkToplevel(self.root)
-            game_window.attributes('-topmost', True)
-            game_window.after(100, lambda: game_window.attributes('-topmost', False))
-            
-            HangmanGame(game_window, self.user_data, self.on_game_close)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
+    def set_loading(self, loading):
+        """Show that stats are being fetched."""
+        self.refresh_btn.configure(text="Loading..." if loading else "Refresh Stats")
+        self.stat_cards.set_loading(loading)
     
-    def launch_typing_game(self):
-        """Launch the Typing Defense Game."""
-        try:
-            from games.typing_game import TypingGame
-            game_window = ctk.CTkToplevel(self.root)
-            game_window.attributes('-topmost', True)
-            game_window.after(100, lambda: game_window.attributes('-topmost', False))
-            
-            TypingGame(game_window, self.user_data, self.on_game_close)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
-
-    def launch_simon_game(self):
-        """Launch Simon Says Game."""
+    def launch_game(self, key):
+        """Launch a registered game in the shared game window."""
+        cls = None
         try:
-            from games.simon_game import SimonGame
-            game_window = ctk.CTkToplevel(self.root)
-            game_window.attributes('-topmost', True)
-            game_window.after(100, lambda: game_window.attributes('-topmost', False))
-            
-            SimonGame(game_window, self.user_data, self.on_game_close)
+            cls = self.registry.load_class(key)
+            self.registry.launch(key, self.game_host, self.user_data, self.on_game_close)
         except Exception as e:
+            # Drop whatever a game that failed while building its UI left in the window
+            if cls is not None and isinstance(self.game_host.game, cls):
+                self.game_host.release()
             messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
+    
+    def report_game_timings(self):
+        """Print how long each game took to import (and construct, once launched)."""
+        parts = []
+        for key, timing in self.registry.timings().items():
+            if timing.import_ms is not None:
+                parts.append(f"{key} {timing.import_ms:.0f} ms")
+        print(f"Preloaded {len(parts)}/{len(self.registry)} games: " + ", ".join(parts))
 
+    def on_side_tab(self):
+        """Load the leaderboard the first time its tab is opened; list profiles whenever theirs is."""
+        tab = self.side_tabs.get()
+        if tab == "Leaderboard":
+            self.leaderboard.load()
+        elif tab == "Profiles":
+            self.load_profiles()
+    
+    def load_profiles(self):
+        """List captured session profiles, newest first."""
+        if self.profile_cards is None:
+            return
+        self.data.submit(list_profiles, on_result=self.show_profiles, key='profiles', owner=self)
+    
+    def show_profiles(self, profiles):
+        self.profile_cards.sync([(profile['name'], ProfileCard, profile) for profile in profiles])
+    
     def on_game_close(self):
         """Callback when a game is closed."""
         self.load_user_stats()  # Refresh stats
+        self.leaderboard.refresh()
+        self.load_profiles()
     
     def handle_logout(self):
         """Handle logout button click."""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.registry.cancel_preload(self.root)
+            self.game_host.destroy()
             self.on_logout()
\ No newline at end of file
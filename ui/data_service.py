@@ -0,0 +1,247 @@
+# ui/data_service.py
+"""
+Runs database work off the Tk thread.
+
+Calls are queued to one worker thread, so writes keep their order and a
+read submitted after a write sees it. Results come back through a queue
+that the Tk loop drains with ``root.after`` while anything is outstanding;
+callbacks always run on the Tk thread.
+
+Requests with the same ``key`` are coalesced: while one is queued and not
+yet started, further submits join it instead of queueing another query.
+Requests can be tagged with an ``owner`` and cancelled together when the
+owner's window closes; their callbacks are then never called.
+
+Widgets that want to show progress implement ``set_loading(bool)``. It is
+called with True when the first request naming the widget is submitted and
+False once none are left.
+"""
+import atexit
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Protocol, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import DATA_POLL_MS
+
+
+class LoadingState(Protocol):
+    """Anything that can show that data is on its way."""
+
+    def set_loading(self, loading: bool) -> None:
+        ...
+
+
+class DataRequest:
+    """One queued call and the callbacks waiting for its result."""
+
+    def __init__(self, fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any],
+                 key: Optional[Hashable], owner: Any):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.owner = owner
+        self.callbacks: List[Tuple[Optional[Callable[[Any], None]], Optional[Callable[[Exception], None]]]] = []
+        self.loading: List[LoadingState] = []
+        self.started = False
+        self.cancelled = False
+        self.done = False
+
+
+class DataService:
+    """Worker thread for database calls, with results delivered on the Tk loop."""
+
+    def __init__(self, poll_ms: int = DATA_POLL_MS):
+        self.poll_ms = poll_ms
+        self.root: Any = None
+        self.poll_id: Optional[str] = None
+        self.jobs: "queue.Queue[Optional[DataRequest]]" = queue.Queue()
+        self.results: "queue.Queue[Tuple[DataRequest, Any, Optional[Exception]]]" = queue.Queue()
+        self.pending: Dict[Hashable, DataRequest] = {}
+        self.outstanding: List[DataRequest] = []
+        self.loading_counts: Dict[int, int] = {}
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, root: Any) -> None:
+        """Delivers results on ``root``'s event loop. Until attached, calls run inline."""
+        self.root = root
+        if self.outstanding:
+            self._schedule_poll()
+
+    def submit(self, fn: Callable[..., Any], *args: Any,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               key: Optional[Hashable] = None, owner: Any = None,
+               loading: Optional[LoadingState] = None, **kwargs: Any) -> DataRequest:
+        """
+        Queues ``fn(*args, **kwargs)`` for the worker thread.
+
+        Args:
+            fn: The database call.
+            on_result: Called on the Tk thread with the return value.
+            on_error: Called on the Tk thread if ``fn`` raises; the error is printed when None.
+            key: Requests with the same key share one queued call.
+            owner: Tag for cancel_owner, usually the window that asked.
+            loading: Told when the request starts and finishes.
+
+        Returns:
+            DataRequest: The queued request (possibly an existing one it joined).
+        """
+        if key is not None:
+            with self._lock:
+                request = self.pending.get(key)
+                if request is not None and not request.started and not request.cancelled:
+                    request.callbacks.append((on_result, on_error))
+                    self._add_loading(request, loading)
+                    self.coalesced += 1
+                    return request
+
+        request = DataRequest(fn, args, kwargs, key, owner)
+        request.callbacks.append((on_result, on_error))
+        self._add_loading(request, loading)
+
+        if self.root is None:
+            # No event loop to deliver to (scripts, benchmarks): run inline
+            self._deliver(request, *self._call(request))
+            return request
+
+        with self._lock:
+            if key is not None:
+                self.pending[key] = request
+        self.outstanding.append(request)
+        self._ensure_thread()
+        self.jobs.put(request)
+        self._schedule_poll()
+        return request
+
+    def cancel(self, request: DataRequest) -> None:
+        """Drops a request; its callbacks will not be called."""
+        if request.done or request.cancelled:
+            return
+        with self._lock:
+            request.cancelled = True
+            if request.key is not None and self.pending.get(request.key) is request:
+                del self.pending[request.key]
+        self._finish(request)
+
+    def cancel_owner(self, owner: Any) -> int:
+        """Cancels every outstanding request tagged with ``owner``. Returns how many."""
+        mine = [r for r in self.outstanding if r.owner is owner]
+        for request in mine:
+            self.cancel(request)
+        return len(mine)
+
+    def _add_loading(self, request: DataRequest, loading: Optional[LoadingState]) -> None:
+        if loading is None or any(w is loading for w in request.loading):
+            return
+        request.loading.append(loading)
+        count = self.loading_counts.get(id(loading), 0)
+        self.loading_counts[id(loading)] = count + 1
+        if count == 0:
+            self._set_loading(loading, True)
+
+    def _finish(self, request: DataRequest) -> None:
+        """Releases a request's loading states and stops tracking it."""
+        request.done = True
+        if request in self.outstanding:
+            self.outstanding.remove(request)
+        for widget in request.loading:
+            count = self.loading_counts.get(id(widget), 1) - 1
+            if count <= 0:
+                self.loading_counts.pop(id(widget), None)
+                self._set_loading(widget, False)
+            else:
+                self.loading_counts[id(widget)] = count
+
+    @staticmethod
+    def _set_loading(widget: LoadingState, loading: bool) -> None:
+        try:
+            widget.set_loading(loading)
+        except Exception as e:
+            # The widget may have been destroyed while the request ran
+            print(f"Error updating loading state: {e}")
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="data-service", daemon=True)
+                self._thread.start()
+
+    @staticmethod
+    def _call(request: DataRequest) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return request.fn(*request.args, **request.kwargs), None
+        except Exception as e:
+            return None, e
+
+    def _run(self) -> None:
+        while True:
+            request = self.jobs.get()
+            if request is None:
+                return
+            with self._lock:
+                if request.cancelled:
+                    continue
+                request.started = True
+                if request.key is not None and self.pending.get(request.key) is request:
+                    del self.pending[request.key]
+            result, error = self._call(request)
+            self.results.put((request, result, error))
+
+    def _schedule_poll(self) -> None:
+        if self.poll_id is None and self.root is not None:
+            try:
+                self.poll_id = self.root.after(self.poll_ms, self._poll)
+            except Exception:
+                # Root destroyed; nothing left to deliver to
+                self.poll_id = None
+
+    def _poll(self) -> None:
+        self.poll_id = None
+        while True:
+            try:
+                request, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if not request.cancelled:
+                self._deliver(request, result, error)
+        if self.outstanding:
+            self._schedule_poll()
+
+    def _deliver(self, request: DataRequest, result: Any, error: Optional[Exception]) -> None:
+        self._finish(request)
+        for on_result, on_error in request.callbacks:
+            try:
+                if error is None:
+                    if on_result:
+                        on_result(result)
+                elif on_error:
+                    on_error(error)
+                else:
+                    print(f"Error in data request {getattr(request.fn, '__name__', request.fn)}: {error}")
+            except Exception as e:
+                print(f"Error in data callback: {e}")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Lets queued calls (pending score saves) finish, then stops the worker."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self.jobs.put(None)
+            thread.join(timeout=timeout)
+
+
+_service_instance = None
+
+def get_data_service() -> DataService:
+    global _service_instance
+    if _service_instance is None:
+        _service_instance = DataService()
+        atexit.register(_service_instance.shutdown)
+    return _service_instance
@@ -0,0 +1,223 @@
+# ui/frame_clock.py
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import FRAME_CLOCK_MS
+
+
+class ClockHandle:
+    """A registered tick, tween or timer; pass it to FrameClock.cancel."""
+
+    __slots__ = ('name', 'cancelled')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cancelled = False
+
+
+class FrameClock:
+    """
+    One scheduler for a game's animations and delayed actions.
+
+    Ticks run every frame (or every ``every_ms``), tweens run every frame
+    for their duration, and timers run once on the first frame at or after
+    their deadline. All of them are driven by a single pending ``after``:
+    every ``frame_ms`` while ticks or tweens are active, otherwise exactly
+    at the next timer's deadline, and not at all when idle.
+
+    ``after`` and ``after_cancel`` mirror Tk's, so helpers written against a
+    Tk widget (SequencePlayer, ParticleSystem) can be driven by the clock.
+    ``close`` cancels everything; the game calls it when it closes.
+
+    CPU time spent in each callback is accumulated per name; see ``stats``.
+    """
+
+    def __init__(self, root: Any, frame_ms: int = FRAME_CLOCK_MS,
+                 now: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            root: Widget used for the one pending ``after``.
+            frame_ms: Frame interval while ticks or tweens are active.
+            now: Monotonic clock in seconds.
+        """
+        self.root = root
+        self.frame_s = frame_ms / 1000.0
+        self.now = now
+        self.closed = False
+
+        # handle -> [callback, every_s, next_due]
+        self.ticks: Dict[ClockHandle, List[Any]] = {}
+        # handle -> [update, on_done, start, duration_s]
+        self.tweens: Dict[ClockHandle, List[Any]] = {}
+        self.timers: List[Tuple[float, int, ClockHandle, Callable[[], Any]]] = []
+        self._seq = itertools.count()
+
+        self.after_id: Optional[str] = None
+        self.wake_at = float('inf')
+        self.last_frame = 0.0
+        self.frames = 0
+        # name -> [calls, total CPU seconds, max CPU seconds]
+        self.costs: Dict[str, List[float]] = {}
+
+    # Registration
+
+    def add_tick(self, callback: Callable[[float], Any], name: Optional[str] = None,
+                 every_ms: float = 0) -> ClockHandle:
+        """
+        Calls ``callback(now)`` every frame, or at most every ``every_ms``.
+        Returning False from the callback unregisters it.
+        """
+        handle = ClockHandle(name or getattr(callback, '__qualname__', 'tick'))
+        self.ticks[handle] = [callback, every_ms / 1000.0, self.now() + every_ms / 1000.0]
+        self._schedule()
+        return handle
+
+    def tween(self, duration_ms: float, update: Callable[[float], Any],
+              on_done: Optional[Callable[[], Any]] = None, name: Optional[str] = None) -> ClockHandle:
+        """Calls ``update(t)`` each frame with t rising from 0 to 1 over ``duration_ms``, then ``on_done()``."""
+        handle = ClockHandle(name or getattr(update, '__qualname__', 'tween'))
+        self.tweens[handle] = [update, on_done, self.now(), max(duration_ms, 1) / 1000.0]
+        self._schedule()
+        return handle
+
+    def call_later(self, delay_ms: float, callback: Callable[..., Any], *args: Any,
+                   name: Optional[str] = None) -> ClockHandle:
+        """Calls ``callback(*args)`` once, on the first frame ``delay_ms`` from now or later."""
+        handle = ClockHandle(name or getattr(callback, '__qualname__', 'timer'))
+        fn = (lambda: callback(*args)) if args else callback
+        heapq.heappush(self.timers, (self.now() + delay_ms / 1000.0, next(self._seq), handle, fn))
+        self._schedule()
+        return handle
+
+    def cancel(self, handle: Optional[ClockHandle]) -> None:
+        if handle is None:
+            return
+        handle.cancelled = True
+        self.ticks.pop(handle, None)
+        self.tweens.pop(handle, None)
+
+    # Tk-compatible subset
+
+    def after(self, delay_ms: float, callback: Callable[..., Any], *args: Any) -> ClockHandle:
+        return self.call_later(delay_ms, callback, *args)
+
+    def after_cancel(self, handle: Optional[ClockHandle]) -> None:
+        self.cancel(handle)
+
+    # Frame loop
+
+    def _next_wake(self) -> float:
+        while self.timers and self.timers[0][2].cancelled:
+            heapq.heappop(self.timers)
+        wake = self.timers[0][0] if self.timers else float('inf')
+        if self.ticks or self.tweens:
+            wake = min(wake, max(self.last_frame + self.frame_s, self.now()))
+        return wake
+
+    def _schedule(self) -> None:
+        if self.closed:
+            return
+        wake = self._next_wake()
+        if wake == float('inf'):
+            return
+        if self.after_id is not None:
+            # Already waking up early enough
+            if self.wake_at <= wake + 0.0005:
+                return
+            self.root.after_cancel(self.after_id)
+        self.wake_at = wake
+        self.after_id = self.root.after(max(0, int((wake - self.now()) * 1000)), self._frame)
+
+    def _run(self, handle: ClockHandle, fn: Callable[..., Any], *args: Any) -> Any:
+        """Calls one callback, timing it; errors are reported and unregister it."""
+        start = time.thread_time()
+        try:
+            return fn(*args)
+        except Exception as e:
+            print(f"Error in frame callback {handle.name}: {e}")
+            self.cancel(handle)
+            return False
+        finally:
+            elapsed = time.thread_time() - start
+            cost = self.costs.get(handle.name)
+            if cost is None:
+                self.costs[handle.name] = [1, elapsed, elapsed]
+            else:
+                cost[0] += 1
+                cost[1] += elapsed
+                if elapsed > cost[2]:
+                    cost[2] = elapsed
+
+    def _frame(self) -> None:
+        self.after_id = None
+        self.wake_at = float('inf')
+        now = self.now()
+        if now < self.last_frame + self.frame_s and not self.timers_due(now):
+            # Tk rounds delays down to whole milliseconds; wait out the rest
+            self._schedule()
+            return
+        self.last_frame = now
+        self.frames += 1
+
+        while self.timers and self.timers[0][0] <= now and not self.closed:
+            _, _, handle, fn = heapq.heappop(self.timers)
+            if not handle.cancelled:
+                handle.cancelled = True
+                self._run(handle, fn)
+
+        for handle, entry in list(self.ticks.items()):
+            if handle.cancelled or self.closed:
+                continue
+            callback, every_s, due = entry
+            if now < due:
+                continue
+            entry[2] = now + every_s
+            if self._run(handle, callback, now) is False:
+                self.cancel(handle)
+
+        for handle, entry in list(self.tweens.items()):
+            if handle.cancelled or self.closed:
+                continue
+            update, on_done, start, duration_s = entry
+            t = min(1.0, (now - start) / duration_s)
+            self._run(handle, update, t)
+            if t >= 1.0 and not handle.cancelled:
+                self.cancel(handle)
+                if on_done:
+                    self._run(handle, on_done)
+
+        self._schedule()
+
+    def timers_due(self, now: float) -> bool:
+        return bool(self.timers) and self.timers[0][0] <= now
+
+    def close(self) -> None:
+        """Cancels every tick, tween and timer and stops scheduling."""
+        self.closed = True
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+        for handle in list(self.ticks) + list(self.tweens):
+            handle.cancelled = True
+        for _, _, handle, _ in self.timers:
+            handle.cancelled = True
+        self.ticks.clear()
+        self.tweens.clear()
+        self.timers.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per callback name: calls and total_ms, mean_ms and max_ms of CPU time, busiest first."""
+        out = {}
+        for name, (calls, total, worst) in sorted(self.costs.items(), key=lambda x: -x[1][1]):
+            out[name] = {'calls': calls, 'total_ms': total * 1000,
+                         'mean_ms': total * 1000 / calls, 'max_ms': worst * 1000}
+        return out
@@ -0,0 +1,132 @@
+# ui/game_host.py
+from typing import Any, Callable, Optional, Tuple
+import customtkinter as ctk
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.styles import Fonts
+
+
+def build_header(parent: Any, title: str, on_exit: Callable[[], None]) -> Tuple[Any, Any, Any]:
+    """
+    The game header bar: title on the left, score and Exit on the right.
+
+    Returns:
+        (title label, score label, exit button)
+    """
+    header_frame = ctk.CTkFrame(parent, height=60, corner_radius=0)
+    header_frame.pack(fill='x')
+
+    # Game title
+    title_label = ctk.CTkLabel(header_frame, text=title, font=Fonts.title())
+    title_label.pack(side='left', padx=20, pady=10)
+
+    # Close button
+    close_btn = ctk.CTkButton(header_frame, text="Exit", command=on_exit,
+                              fg_color="#C0392B", hover_color="#922B21", width=80)
+    close_btn.pack(side='right', padx=10, pady=10)
+
+    # Score display
+    score_label = ctk.CTkLabel(header_frame, text="Score: 0", font=Fonts.normal())
+    score_label.pack(side='right', padx=20, pady=10)
+    return title_label, score_label, close_btn
+
+
+class GameHost:
+    """
+    One game window, reused for every game launched from the dashboard.
+
+    The toplevel and its header bar are built on the first launch. Each game
+    gets a fresh content frame below the header; when the game closes, its
+    frame is destroyed, its key bindings are removed and the window is
+    withdrawn, ready for the next launch.
+    """
+
+    def __init__(self, master: Any):
+        self.master = master
+        self.window: Optional[ctk.CTkToplevel] = None
+        self.content: Optional[ctk.CTkFrame] = None
+        self.game: Any = None
+        self.title_label: Any = None
+        self.score_label: Any = None
+        self.exit_button: Any = None
+        self.replacing = False
+
+    def ensure_window(self) -> ctk.CTkToplevel:
+        """Creates the toplevel and header on first use; shows it again afterwards."""
+        if self.window is not None and self.window.winfo_exists():
+            self.window.deiconify()
+            self.window.lift()
+            self.window.focus_force()
+            return self.window
+
+        self.window = ctk.CTkToplevel(self.master)
+        # Ensure it comes to front
+        self.window.attributes('-topmost', True)
+        self.window.after(100, lambda: self.window.attributes('-topmost', False))
+        self.window.after(0, lambda: self.window.state('zoomed'))
+        self.window.protocol("WM_DELETE_WINDOW", self.close_game)
+        self.title_label, self.score_label, self.exit_button = build_header(self.window, "", self.close_game)
+        return self.window
+
+    def begin(self, game: Any) -> ctk.CTkFrame:
+        """
+        Makes ``game`` the hosted game. A game still running is closed first
+        (without hiding the window), the header is pointed at the new game and
+        a fresh content frame is packed below it.
+
+        Returns:
+            The frame the game should build its widgets in.
+        """
+        previous = self.game
+        if previous is not None:
+            self.replacing = True
+            try:
+                previous.on_close()
+            finally:
+                self.replacing = False
+        self.discard_content()
+
+        window = self.ensure_window()
+        self.game = game
+        window.title(game.game_name)
+        self.title_label.configure(text=game.game_name)
+        self.score_label.configure(text="Score: 0")
+        self.content = ctk.CTkFrame(window, fg_color="transparent", corner_radius=0)
+        self.content.pack(fill='both', expand=True)
+        return self.content
+
+    def close_game(self) -> None:
+        """Exit button / window close: let the current game close itself."""
+        if self.game is not None:
+            self.game.on_close()
+        else:
+            self.release()
+
+    def release(self, game: Any = None) -> None:
+        """Removes a closed game's content and bindings and hides the window."""
+        if game is not None and game is not self.game:
+            return
+        if self.game is not None:
+            self.game.unbind_keys()
+        self.game = None
+        self.discard_content()
+        if not self.replacing and self.window is not None and self.window.winfo_exists():
+            self.window.withdraw()
+
+    def discard_content(self) -> None:
+        if self.content is not None:
+            self.content.destroy()
+            self.content = None
+
+    def destroy(self) -> None:
+        """Closes the window for good (e.g. on logout)."""
+        if self.game is not None:
+            self.game.unbind_keys()
+            self.game = None
+        if self.window is not None and self.window.winfo_exists():
+            self.window.destroy()
+        self.window = None
+        self.content = None
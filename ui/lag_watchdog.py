@@ -0,0 +1,177 @@
+# ui/lag_watchdog.py
+"""
+Watches how long the Tk event loop is blocked.
+
+A heartbeat callback is scheduled with ``root.after`` every ``interval_ms``;
+how late each one runs goes into a lag histogram. A monitor thread checks
+when the last heartbeat ran, and once the loop has been silent for longer
+than ``stall_ms`` it captures the main thread's Python stack. The report
+names the innermost game method on that stack (a method of a ``BaseGame``
+subclass), which is usually the code holding the loop.
+"""
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import LAG_WATCHDOG_INTERVAL_MS, LAG_STALL_MS
+from utils.frame_timer import FrameTimeHistogram
+from utils.metrics import get_metrics
+
+LAG_SECONDS = get_metrics().histogram(
+    "game_hub_ui_loop_lag_seconds", "How late the event-loop heartbeat ran.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+STALLS = get_metrics().counter(
+    "game_hub_ui_stalls_total", "Event-loop stalls longer than LAG_STALL_MS, by the game method running.", ("culprit",))
+
+
+class StallReport(NamedTuple):
+    """One stall: how long the loop was blocked, what was running, and the stack."""
+    started_at: float
+    duration_ms: float
+    culprit: Optional[str]
+    stack: List[str]
+
+
+def find_culprit(frame: Any) -> Optional[str]:
+    """
+    ``GameClass.method`` for the innermost frame whose ``self`` is a game.
+
+    Games are recognised by having ``BaseGame`` in their MRO, so this module
+    does not import the games package.
+    """
+    while frame is not None:
+        obj = frame.f_locals.get('self')
+        if obj is not None and any(cls.__name__ == 'BaseGame' for cls in type(obj).__mro__[1:]):
+            return f"{type(obj).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class LagWatchdog:
+    """Heartbeat lag histogram and stall stacks for one Tk root."""
+
+    def __init__(self, root: Any, interval_ms: int = LAG_WATCHDOG_INTERVAL_MS,
+                 stall_ms: int = LAG_STALL_MS, max_reports: int = 50, verbose: bool = False):
+        """
+        Args:
+            root: Tk root whose loop is watched.
+            interval_ms: Heartbeat period.
+            stall_ms: Silence after which the main thread's stack is captured.
+            max_reports: Stall reports kept (oldest are dropped).
+            verbose: Print each stall as it is captured; either way stalls
+                and lag are kept in the STALLS/LAG_SECONDS metrics.
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.verbose = verbose
+        self.lag = FrameTimeHistogram(max_ms=max(1000.0, stall_ms * 4))
+        self.stalls: Deque[StallReport] = deque(maxlen=max_reports)
+        self.main_thread_id = threading.get_ident()
+        self.after_id: Optional[str] = None
+        self.expected_at = 0.0
+        self.last_beat = 0.0
+        self.stall_open = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self.last_beat = time.perf_counter()
+        self.schedule()
+        self._thread = threading.Thread(target=self._monitor, name="lag-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def schedule(self) -> None:
+        self.expected_at = time.perf_counter() + self.interval_ms / 1000
+        self.after_id = self.root.after(self.interval_ms, self.beat)
+
+    def beat(self) -> None:
+        """Heartbeat: records how late it ran and closes any open stall."""
+        now = time.perf_counter()
+        late = max(0.0, now - self.expected_at)
+        self.lag.record(late)
+        LAG_SECONDS.observe(late)
+        if self.stall_open:
+            self.stall_open = False
+            # Replace the capture-time duration with the full length of the stall
+            if self.stalls:
+                report = self.stalls[-1]
+                self.stalls[-1] = report._replace(duration_ms=(now - report.started_at) * 1000)
+                if self.verbose:
+                    print(f"UI stall ended after {self.stalls[-1].duration_ms:.0f} ms")
+        self.last_beat = now
+        if not self._stop.is_set():
+            self.schedule()
+
+    def _monitor(self) -> None:
+        poll_s = self.stall_ms / 4000
+        while not self._stop.wait(poll_s):
+            silent_ms = (time.perf_counter() - self.last_beat) * 1000 - self.interval_ms
+            if silent_ms >= self.stall_ms and not self.stall_open:
+                self.stall_open = True
+                self.capture(silent_ms)
+
+    def capture(self, silent_ms: float) -> Optional[StallReport]:
+        """Snapshots the main thread's stack for the current stall."""
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return None
+        report = StallReport(
+            started_at=self.last_beat + self.interval_ms / 1000,
+            duration_ms=silent_ms,
+            culprit=find_culprit(frame),
+            stack=traceback.format_stack(frame),
+        )
+        self.stalls.append(report)
+        STALLS.inc(culprit=report.culprit or "(other)")
+        if self.verbose:
+            where = report.culprit or "outside game code"
+            print(f"UI stall: event loop blocked {silent_ms:.0f} ms in {where}\n" + "".join(report.stack[-6:]))
+        return report
+
+    def culprits(self) -> Dict[str, int]:
+        """Stall count per culprit (None for stalls outside game code)."""
+        counts: Dict[str, int] = {}
+        for report in self.stalls:
+            key = report.culprit or "(other)"
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """Lag percentiles plus stall totals."""
+        stats = self.lag.summary()
+        stats['stalls'] = len(self.stalls)
+        stats['culprits'] = self.culprits()
+        return stats
+
+
+_watchdog_instance = None
+
+def get_lag_watchdog(root: Any = None, verbose: bool = False) -> Optional[LagWatchdog]:
+    """The app's watchdog, created (and started) the first time a root is given."""
+    global _watchdog_instance
+    if _watchdog_instance is None and root is not None:
+        _watchdog_instance = LagWatchdog(root, verbose=verbose)
+        _watchdog_instance.start()
+    return _watchdog_instance
@@ -0,0 +1,247 @@
+# ui/leaderboard_panel.py
+import tkinter as tk
+from typing import Any, Dict, List, Optional, Tuple
+import customtkinter as ctk
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import LEADERBOARD_PAGE_SIZE, LEADERBOARD_CACHED_PAGES
+from service.score_client import get_score_backend
+from ui.data_service import DataRequest, get_data_service
+from ui.styles import Fonts
+from utils.helpers import format_score
+from utils.page_cache import PageCache
+
+ALL_DIFFICULTIES = "All"
+
+
+class LeaderboardPanel:
+    """
+    Scores for one game, best first, filtered by difficulty.
+
+    Rows are drawn on a canvas with one set of text items per visible row;
+    scrolling re-labels those items instead of moving them, and the scrollbar
+    is driven by row position rather than canvas coordinates. Rows are
+    fetched a page at a time on the data worker as they come into view, and
+    only LEADERBOARD_CACHED_PAGES pages are kept, so widgets, canvas items
+    and memory stay the same however many scores the board has.
+    """
+
+    ROW_HEIGHT = 26
+    COLUMNS: List[Tuple[str, float, str]] = [
+        # (heading, x as a fraction of the width, anchor)
+        ("#", 0.02, 'w'),
+        ("Player", 0.14, 'w'),
+        ("Score", 0.58, 'e'),
+        ("Difficulty", 0.62, 'w'),
+        ("Date", 0.98, 'e'),
+    ]
+
+    def __init__(self, parent: Any, game_names: List[str], height: int = 400,
+                 bg: str = '#2B2B2B', fg: str = '#DCE4EE', stripe: str = '#333333'):
+        """
+        Args:
+            parent: Widget to place the panel in.
+            game_names: Games offered in the filter, as stored with their scores.
+            height: Initial height of the row area in pixels.
+            bg, fg, stripe: Canvas background, text colour and alternate row fill.
+        """
+        # The local database, or the shared score service when one is configured
+        self.db = get_score_backend()
+        self.data = get_data_service()
+        self.game_names = game_names
+        self.game = game_names[0] if game_names else ""
+        self.difficulty: Optional[str] = None
+        self.fg = fg
+        self.stripe = stripe
+
+        self.cache = PageCache(LEADERBOARD_PAGE_SIZE, LEADERBOARD_CACHED_PAGES)
+        self.requested: Dict[int, DataRequest] = {}
+        self.generation = 0
+        self.total = 0
+        self.top = 0
+        self.loaded = False
+
+        self.frame = ctk.CTkFrame(parent, fg_color="transparent")
+
+        filters = ctk.CTkFrame(self.frame, fg_color="transparent")
+        filters.pack(fill='x', pady=(0, 5))
+        self.game_menu = ctk.CTkOptionMenu(filters, values=game_names or [""], command=self.on_game)
+        self.game_menu.pack(side='left', padx=(0, 10))
+        self.difficulty_menu = ctk.CTkOptionMenu(filters, values=[ALL_DIFFICULTIES], command=self.on_difficulty)
+        self.difficulty_menu.pack(side='left')
+        self.count_label = ctk.CTkLabel(filters, text="", font=Fonts.small(), text_color="gray")
+        self.count_label.pack(side='right', padx=5)
+
+        body = tk.Frame(self.frame, bg=bg)
+        body.pack(fill='both', expand=True)
+        self.canvas = tk.Canvas(body, height=height, bg=bg, highlightthickness=0)
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.scrollbar = tk.Scrollbar(body, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.header: List[int] = [self.canvas.create_text(0, self.ROW_HEIGHT / 2, text=heading, anchor=anchor,
+                                                          fill='gray', font=Fonts.small())
+                                  for heading, _, anchor in self.COLUMNS]
+        # (stripe rectangle, [text item per column]) for each visible row
+        self.slots: List[Tuple[int, List[int]]] = []
+        self.width = 1
+
+        self.canvas.bind('<Configure>', self.on_resize)
+        self.canvas.bind('<MouseWheel>', lambda e: self.yview('scroll', -3 if e.delta > 0 else 3, 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self.yview('scroll', -3, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.yview('scroll', 3, 'units'))
+
+    def pack(self, **kwargs) -> None:
+        self.frame.pack(**kwargs)
+
+    @property
+    def visible_rows(self) -> int:
+        return len(self.slots)
+
+    def on_resize(self, event) -> None:
+        """Adds or removes row slots to fit the new height and re-lays out columns."""
+        self.width = event.width
+        wanted = max(1, event.height // self.ROW_HEIGHT - 1)
+        while len(self.slots) < wanted:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, outline='', fill=self.stripe, state='hidden')
+            texts = [self.canvas.create_text(0, 0, anchor=anchor, fill=self.fg, font=Fonts.small())
+                     for _, _, anchor in self.COLUMNS]
+            self.slots.append((rect, texts))
+        while len(self.slots) > wanted:
+            rect, texts = self.slots.pop()
+            self.canvas.delete(rect, *texts)
+
+        for item, (_, fraction, _) in zip(self.header, self.COLUMNS):
+            self.canvas.coords(item, fraction * self.width, self.ROW_HEIGHT / 2)
+        for i, (rect, texts) in enumerate(self.slots):
+            y = (i + 1) * self.ROW_HEIGHT
+            self.canvas.coords(rect, 0, y, self.width, y + self.ROW_HEIGHT)
+            for item, (_, fraction, _) in zip(texts, self.COLUMNS):
+                self.canvas.coords(item, fraction * self.width, y + self.ROW_HEIGHT / 2)
+        self.set_top(self.top)
+
+    def load(self) -> None:
+        """Loads the board the first time it is shown."""
+        if not self.loaded:
+            self.loaded = True
+            self.reload(refresh_difficulties=True)
+
+    def refresh(self) -> None:
+        """Reloads the current filter (e.g. after a game was played)."""
+        if self.loaded:
+            self.reload(refresh_difficulties=True)
+
+    def on_game(self, game: str) -> None:
+        self.game = game
+        self.difficulty = None
+        self.difficulty_menu.set(ALL_DIFFICULTIES)
+        self.reload(refresh_difficulties=True)
+
+    def on_difficulty(self, difficulty: str) -> None:
+        self.difficulty = None if difficulty == ALL_DIFFICULTIES else difficulty
+        self.reload()
+
+    def reload(self, refresh_difficulties: bool = False) -> None:
+        """Drops cached rows and pending fetches, then counts the filtered board."""
+        self.generation += 1
+        self.data.cancel_owner(self)
+        self.cache.clear()
+        self.requested.clear()
+        self.total = 0
+        self.top = 0
+        generation = self.generation
+        if refresh_difficulties:
+            self.data.submit(self.db.get_leaderboard_difficulties, self.game,
+                             on_result=lambda values: self.show_difficulties(generation, values), owner=self)
+        self.data.submit(self.db.count_leaderboard, self.game, self.difficulty,
+                         on_result=lambda total: self.show_total(generation, total), owner=self, loading=self)
+        self.set_top(0)
+
+    def show_difficulties(self, generation: int, values: List[str]) -> None:
+        if generation == self.generation:
+            self.difficulty_menu.configure(values=[ALL_DIFFICULTIES] + values)
+
+    def show_total(self, generation: int, total: int) -> None:
+        if generation != self.generation:
+            return
+        self.total = total
+        self.count_label.configure(text=f"{total:,} scores")
+        self.set_top(0)
+
+    def set_loading(self, loading: bool) -> None:
+        if loading:
+            self.count_label.configure(text="Loading...")
+
+    def yview(self, *args) -> None:
+        """Scrollbar and wheel commands, in rows."""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.set_top(int(float(args[1]) * self.total))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= max(1, self.visible_rows - 1)
+            self.set_top(self.top + step)
+
+    def set_top(self, top: int) -> None:
+        """Shows rows from ``top``, fetching any pages in view that are not cached."""
+        self.top = max(0, min(top, self.total - self.visible_rows))
+        if self.total:
+            self.scrollbar.set(self.top / self.total, min(1.0, (self.top + self.visible_rows) / self.total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.draw_rows()
+        if self.total and self.visible_rows:
+            last = min(self.total, self.top + self.visible_rows) - 1
+            # Fetches for pages scrolled past (e.g. while dragging the scrollbar) are dropped
+            first_page, last_page = self.cache.page_of(self.top), self.cache.page_of(last)
+            for page in [p for p in self.requested if not first_page <= p <= last_page]:
+                self.data.cancel(self.requested.pop(page))
+            for page in self.cache.missing_pages(self.top, last):
+                self.request_page(page)
+
+    def request_page(self, page: int) -> None:
+        if page in self.requested:
+            return
+        size = self.cache.page_size
+        generation = self.generation
+        request = self.data.submit(self.db.get_leaderboard_page, self.game, self.difficulty,
+                                   page * size, size,
+                                   on_result=lambda rows: self.show_page(generation, page, rows),
+                                   key=('leaderboard', self.game, self.difficulty, page), owner=self)
+        self.requested[page] = request
+
+    def show_page(self, generation: int, page: int, rows: List[Dict[str, Any]]) -> None:
+        if generation != self.generation:
+            return
+        self.requested.pop(page, None)
+        self.cache.put(page, rows)
+        size = self.cache.page_size
+        if page * size < self.top + self.visible_rows and (page + 1) * size > self.top:
+            self.draw_rows()
+
+    def draw_rows(self) -> None:
+        """Re-labels every slot with the row now shown in it."""
+        for i, (rect, texts) in enumerate(self.slots):
+            row = self.top + i
+            if row >= self.total:
+                self.canvas.itemconfigure(rect, state='hidden')
+                for item in texts:
+                    self.canvas.itemconfigure(item, state='hidden')
+                continue
+            self.canvas.itemconfigure(rect, state='normal' if row % 2 else 'hidden')
+            values = self.row_values(row, self.cache.get(row))
+            for item, value in zip(texts, values):
+                self.canvas.itemconfigure(item, text=value, state='normal')
+
+    @staticmethod
+    def row_values(row: int, entry: Optional[Dict[str, Any]]) -> Tuple[str, str, str, str, str]:
+        if entry is None:
+            return (f"{row + 1:,}", "...", "", "", "")
+        played_at = str(entry.get('played_at') or "")[:10]
+        return (f"{row + 1:,}", entry['username'], format_score(entry['score']),
+                entry.get('difficulty') or "", played_at)
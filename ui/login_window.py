@@ -6,11 +6,23 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from auth.authentication import get_auth_manager
 from ui.styles import Fonts
+from ui.data_service import get_data_service
 from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, APP_NAME
 
 
+def login_user(username, password):
+    """Runs on the data worker. auth (bcrypt) and the database are loaded on first use."""
+    from auth.authentication import get_auth_manager
+    return get_auth_manager().login_user(username, password)
+
+
+def register_user(username, password, email):
+    """Runs on the data worker, like login_user."""
+    from auth.authentication import get_auth_manager
+    return get_auth_manager().register_user(username, password, email)
+
+
 class LoginWindow:
     """Login and registration window."""
     
@@ -24,7 +36,8 @@ class LoginWindow:
         """
         self.root = root
         self.on_login_success = on_login_success
-        self.auth_manager = get_auth_manager()
+        self.data = get_data_service()
+        self.busy = False
         
         self.setup_window()
         self.create_widgets()
@@ -82,9 +95,9 @@ class LoginWindow:
         self.login_password.pack(pady=(5, 20))
         
         # Login button
-        login_btn = ctk.CTkButton(parent_frame, text="Login", width=250,
-                                 command=self.handle_login, font=Fonts.normal())
-        login_btn.pack(pady=20)
+        self.login_btn = ctk.CTkButton(parent_frame, text="Login", width=250,
+                                      command=self.handle_login, font=Fonts.normal())
+        self.login_btn.pack(pady=20)
         
         # Bind Enter key
         self.login_password.bind('<Return>', lambda e: self.handle_login())
@@ -108,9 +121,9 @@ class LoginWindow:
         self.reg_confirm.pack(pady=5)
         
         # Register button
-        register_btn = ctk.CTkButton(parent_frame, text="Register", width=250,
-                                    command=self.handle_register, fg_color="#2CC985", hover_color="#229954")
-        register_btn.pack(pady=20)
+        self.register_btn = ctk.CTkButton(parent_frame, text="Register", width=250,
+                                         command=self.handle_register, fg_color="#2CC985", hover_color="#229954")
+        self.register_btn.pack(pady=20)
         
         # Bind Enter key
         self.reg_confirm.bind('<Return>', lambda e: self.handle_register())
@@ -120,11 +133,19 @@ class LoginWindow:
         username = self.login_username.get().strip()
         password = self.login_password.get()
         
+        if self.busy:
+            return
         if not username or not password:
             messagebox.showerror("Error", "Please fill in all fields")
             return
 
-        success, message, user_data = self.auth_manager.login_user(username, password)
+        # Password hashing and the user lookup run on the data worker
+        self.data.submit(login_user, username, password,
+                         on_result=self.finish_login, owner=self, loading=self)
+    
+    def finish_login(self, result):
+        """Handle the login result."""
+        success, message, user_data = result
         
         if success:
             # messagebox.showinfo("Success", message) # Optional, maybe just proceed
@@ -139,6 +160,8 @@ class LoginWindow:
         password = self.reg_password.get()
         confirm = self.reg_confirm.get()
         
+        if self.busy:
+            return
         if not username or not password:
              messagebox.showerror("Error", "Username and Password are required")
              return
@@ -148,7 +171,13 @@ class LoginWindow:
             messagebox.showerror("Error", "Passwords do not match")
             return
         
-        success, message = self.auth_manager.register_user(username, password, email)
+        self.data.submit(register_user, username, password, email,
+                         on_result=lambda result: self.finish_register(username, result),
+                         owner=self, loading=self)
+    
+    def finish_register(self, username, result):
+        """Handle the registration result."""
+        success, message = result
         
         if success:
             messagebox.showinfo("Success", message)
@@ -166,4 +195,11 @@ class LoginWindow:
             self.reg_confirm.delete(0, 'end')
             self.reg_email.delete(0, 'end')
         else:
-            messagebox.showerror("Error", message)
\ No newline at end of file
+            messagebox.showerror("Error", message)
+    
+    def set_loading(self, loading):
+        """Disable the form buttons while a login or registration is running."""
+        self.busy = loading
+        state = 'disabled' if loading else 'normal'
+        self.login_btn.configure(state=state)
+        self.register_btn.configure(state=state)
@@ -0,0 +1,117 @@
+# ui/sequence_player.py
+import time
+import tkinter as tk
+from typing import Any, Callable, Optional, Sequence
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.frame_timer import FrameTimeHistogram
+from utils.metrics import get_metrics
+
+LATENESS_SECONDS = get_metrics().histogram(
+    "game_hub_sequence_lateness_seconds", "How late sequence playback events fired.",
+    buckets=(0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.05, 0.1, 0.25))
+
+
+class SequencePlayer:
+    """
+    Plays a sequence of on/off steps from a single Tk timer.
+
+    Step ``i`` turns on at ``start + i * step_ms`` and off ``on_ms`` later.
+    Every deadline is computed from the start time rather than from the
+    previous callback, so a late callback shortens the next wait instead of
+    pushing the rest of the sequence back. Only one ``after`` is pending at
+    a time and steps are derived from their index, so very long sequences
+    cost nothing extra to schedule.
+
+    How late each event fired is recorded in ``jitter`` and in the
+    app-wide metrics registry.
+    """
+
+    def __init__(self, root: tk.Misc, on_step: Callable[[Any, bool], None],
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            root: Widget used for scheduling.
+            on_step: Called as ``on_step(item, True)`` when a step starts and
+                ``on_step(item, False)`` when it ends.
+            clock: Monotonic clock in seconds.
+        """
+        self.root = root
+        self.on_step = on_step
+        self.clock = clock
+        self.jitter = FrameTimeHistogram(max_ms=250)
+
+        self.sequence: Sequence[Any] = ()
+        self.step_s = 0.0
+        self.on_s = 0.0
+        self.start = 0.0
+        self.event = 0
+        self.timer_id: Optional[str] = None
+        self.on_done: Optional[Callable[[], None]] = None
+
+    @property
+    def running(self) -> bool:
+        return self.timer_id is not None
+
+    def play(self, sequence: Sequence[Any], step_ms: float, on_ms: float,
+             on_done: Optional[Callable[[], None]] = None, delay_ms: float = 0) -> None:
+        """
+        Starts playing a sequence, cancelling any playback in progress.
+
+        Args:
+            sequence: Items passed to on_step, in order.
+            step_ms: Time from one step's start to the next.
+            on_ms: How long each step stays on; less than step_ms.
+            on_done: Called once the last step has turned off.
+            delay_ms: Wait before the first step.
+        """
+        self.cancel()
+        self.sequence = sequence
+        self.step_s = step_ms / 1000.0
+        self.on_s = min(on_ms, step_ms) / 1000.0
+        self.on_done = on_done
+        self.start = self.clock() + delay_ms / 1000.0
+        self.event = 0
+        self.schedule()
+
+    def deadline(self, event: int) -> float:
+        """Clock time of an event; even events turn a step on, odd ones off."""
+        step, off = divmod(event, 2)
+        return self.start + step * self.step_s + (self.on_s if off else 0.0)
+
+    def schedule(self) -> None:
+        delay = self.deadline(self.event) - self.clock()
+        self.timer_id = self.root.after(max(0, int(delay * 1000)), self.fire)
+
+    def fire(self) -> None:
+        """Runs the due event and schedules the next one."""
+        self.timer_id = None
+        lateness = self.clock() - self.deadline(self.event)
+        if lateness < 0:
+            # Tk timers round down to whole milliseconds; wait out the rest
+            self.schedule()
+            return
+        self.jitter.record(lateness)
+        LATENESS_SECONDS.observe(lateness)
+
+        step, off = divmod(self.event, 2)
+        self.on_step(self.sequence[step], not off)
+        self.event += 1
+
+        if self.event < 2 * len(self.sequence):
+            self.schedule()
+        elif self.on_done:
+            on_done, self.on_done = self.on_done, None
+            on_done()
+
+    def cancel(self) -> None:
+        """Stops playback. A step left on is turned off."""
+        if self.timer_id is not None:
+            self.root.after_cancel(self.timer_id)
+            self.timer_id = None
+            if self.event % 2:
+                self.on_step(self.sequence[self.event // 2], False)
+        self.on_done = None
@@ -0,0 +1,245 @@
+# ui/stat_cards.py
+import os
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import customtkinter as ctk
+
+from ui.styles import Fonts
+from utils.helpers import format_score
+
+
+class SyncResult(NamedTuple):
+    """Cards added, updated in place, removed and moved by one sync."""
+    added: int
+    updated: int
+    removed: int
+    moved: int
+
+
+class GameStatCard:
+    """Played count and best score for one game."""
+
+    def __init__(self, parent: Any, stat: Dict[str, Any]):
+        self.frame = ctk.CTkFrame(parent)
+
+        self.title = ctk.CTkLabel(self.frame, text=stat['game_name'], font=Fonts.normal())
+        self.title.pack(pady=5)
+
+        grid_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        grid_frame.pack(fill='x', padx=10, pady=5)
+
+        self.played = ctk.CTkLabel(grid_frame, text=self.played_text(stat))
+        self.played.pack(side='left', padx=10)
+        self.best = ctk.CTkLabel(grid_frame, text=self.best_text(stat))
+        self.best.pack(side='right', padx=10)
+        self.value = self.key_values(stat)
+
+    @staticmethod
+    def played_text(stat: Dict[str, Any]) -> str:
+        return f"Played: {stat['games_played']}"
+
+    @staticmethod
+    def best_text(stat: Dict[str, Any]) -> str:
+        return f"Best: {format_score(stat['best_score'])}"
+
+    @staticmethod
+    def key_values(stat: Dict[str, Any]) -> Tuple[Any, Any]:
+        return stat['games_played'], stat['best_score']
+
+    def update(self, stat: Dict[str, Any]) -> bool:
+        """Reconfigures only the labels whose values changed. Returns True if any did."""
+        played, best = self.key_values(stat)
+        if (played, best) == self.value:
+            return False
+        if played != self.value[0]:
+            self.played.configure(text=self.played_text(stat))
+        if best != self.value[1]:
+            self.best.configure(text=self.best_text(stat))
+        self.value = (played, best)
+        return True
+
+
+class TypingInsightsCard:
+    """The player's slowest key pairs, one reusable row per pair."""
+
+    def __init__(self, parent: Any, bigrams: Sequence[Tuple[str, float, int]]):
+        self.frame = ctk.CTkFrame(parent)
+        ctk.CTkLabel(self.frame, text="Typing: Slowest Key Pairs", font=Fonts.normal()).pack(pady=5)
+        self.rows: List[Tuple[Any, Any, Any]] = []
+        self.value: List[Tuple[str, str]] = []
+        self.update(bigrams)
+
+    @staticmethod
+    def row_texts(bigrams: Sequence[Tuple[str, float, int]]) -> List[Tuple[str, str]]:
+        return [(pair.upper(), f"{mean_ms:.0f} ms  ({count}x)") for pair, mean_ms, count in bigrams]
+
+    def update(self, bigrams: Sequence[Tuple[str, float, int]]) -> bool:
+        """Rewrites changed rows, adds missing ones and drops surplus ones."""
+        texts = self.row_texts(bigrams)
+        if texts == self.value:
+            return False
+        for i, (pair_text, time_text) in enumerate(texts):
+            if i < len(self.rows):
+                _, pair_label, time_label = self.rows[i]
+                old_pair, old_time = self.value[i]
+                if pair_text != old_pair:
+                    pair_label.configure(text=pair_text)
+                if time_text != old_time:
+                    time_label.configure(text=time_text)
+            else:
+                row = ctk.CTkFrame(self.frame, fg_color="transparent")
+                row.pack(fill='x', padx=10)
+                pair_label = ctk.CTkLabel(row, text=pair_text, font=("Courier", 14, "bold"))
+                pair_label.pack(side='left', padx=10)
+                time_label = ctk.CTkLabel(row, text=time_text, text_color="gray")
+                time_label.pack(side='right', padx=10)
+                self.rows.append((row, pair_label, time_label))
+        for row, _, _ in self.rows[len(texts):]:
+            row.destroy()
+        del self.rows[len(texts):]
+        self.value = texts
+        return True
+
+
+class ProfileCard:
+    """One captured game session profile and its report files."""
+
+    def __init__(self, parent: Any, profile: Dict[str, Any]):
+        self.frame = ctk.CTkFrame(parent)
+        title = profile['game'] + (f" ({profile['difficulty']})" if profile['difficulty'] else "")
+        ctk.CTkLabel(self.frame, text=title, font=Fonts.normal()).pack(anchor='w', padx=10, pady=(5, 0))
+        ctk.CTkLabel(self.frame, text=self.started_text(profile['started']), font=Fonts.small(),
+                     text_color="gray").pack(anchor='w', padx=10)
+        self.files = ctk.CTkLabel(self.frame, text=self.files_text(profile), font=Fonts.small(), justify='left')
+        self.files.pack(anchor='w', padx=10, pady=(0, 5))
+        self.value = self.files_text(profile)
+
+    @staticmethod
+    def started_text(stamp: str) -> str:
+        # 20240131-142500 -> 2024-01-31 14:25:00
+        if len(stamp) != 15:
+            return stamp
+        return f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:8]} {stamp[9:11]}:{stamp[11:13]}:{stamp[13:]}"
+
+    @staticmethod
+    def files_text(profile: Dict[str, Any]) -> str:
+        return "\n".join(os.path.basename(path) for path in profile['files'])
+
+    def update(self, profile: Dict[str, Any]) -> bool:
+        """A session's files only change while its reports are being written."""
+        text = self.files_text(profile)
+        if text == self.value:
+            return False
+        self.files.configure(text=text)
+        self.value = text
+        return True
+
+
+class KeyedCardList:
+    """
+    Cards in a container, keyed so a refresh only touches what changed.
+
+    ``sync`` takes the full list of (key, factory, value) entries and applies
+    it as a diff: new keys get a card, existing cards are updated in place
+    (and only repacked if their position changed), missing keys are destroyed.
+    """
+
+    def __init__(self, parent: Any, empty_text: str, loading_text: str = "Loading..."):
+        self.parent = parent
+        self.cards: Dict[str, Any] = {}
+        self.order: List[str] = []
+        self.empty_text = empty_text
+        self.loading_text = loading_text
+        self.loaded = False
+        self.empty_label = ctk.CTkLabel(parent, text=loading_text)
+        self.empty_shown = False
+
+    def sync(self, entries: Sequence[Tuple[str, Callable[[Any, Any], Any], Any]]) -> SyncResult:
+        """
+        Args:
+            entries: (key, factory, value) in display order. ``factory(parent, value)``
+                builds a card with a ``frame`` and an ``update(value) -> bool`` method.
+
+        Returns:
+            SyncResult: What the diff did.
+        """
+        keys = [key for key, _, _ in entries]
+        wanted = set(keys)
+        removed = 0
+        for key in [k for k in self.order if k not in wanted]:
+            self.cards.pop(key).frame.destroy()
+            removed += 1
+        survivors = [k for k in self.order if k in wanted]
+
+        added = updated = moved = 0
+        for key, factory, value in entries:
+            card = self.cards.get(key)
+            if card is None:
+                self.cards[key] = factory(self.parent, value)
+                added += 1
+            elif card.update(value):
+                updated += 1
+
+        # Pack new cards and fix the position of moved ones, back to front so
+        # each card can be placed before its already-placed successor
+        next_frame: Optional[Any] = None
+        survivor_positions = {k: i for i, k in enumerate(survivors)}
+        expected = [k for k in keys if k in survivor_positions]
+        in_place = self.stable_keys(expected, survivor_positions)
+        for key in reversed(keys):
+            frame = self.cards[key].frame
+            if key not in survivor_positions or key not in in_place:
+                if key in survivor_positions:
+                    moved += 1
+                    # Tk leaves a packed widget in place when packed again without before=
+                    frame.pack_forget()
+                if next_frame is None:
+                    frame.pack(fill='x', padx=5, pady=5)
+                else:
+                    frame.pack(fill='x', padx=5, pady=5, before=next_frame)
+            next_frame = frame
+        self.order = keys
+
+        if not self.loaded:
+            self.loaded = True
+            self.empty_label.configure(text=self.empty_text)
+        self.show_empty(not keys)
+        return SyncResult(added, updated, removed, moved)
+
+    @staticmethod
+    def stable_keys(keys: List[str], old_positions: Dict[str, int]) -> set:
+        """
+        Keys that can stay where they are: a longest run of ``keys`` whose old
+        positions are increasing. Everything else is repacked.
+        """
+        tails: List[int] = []
+        tail_keys: List[int] = []
+        parents: List[int] = [-1] * len(keys)
+        for i, key in enumerate(keys):
+            pos = old_positions[key]
+            j = bisect_left(tails, pos)
+            if j == len(tails):
+                tails.append(pos)
+                tail_keys.append(i)
+            else:
+                tails[j] = pos
+                tail_keys[j] = i
+            parents[i] = tail_keys[j - 1] if j else -1
+        stable = set()
+        i = tail_keys[-1] if tail_keys else -1
+        while i != -1:
+            stable.add(keys[i])
+            i = parents[i]
+        return stable
+
+    def set_loading(self, loading: bool) -> None:
+        """Shows the loading text until the first sync; later refreshes keep the old cards up."""
+        if not self.loaded:
+            self.show_empty(loading)
+
+    def show_empty(self, show: bool) -> None:
+        if show and not self.empty_shown:
+            self.empty_label.pack(pady=20)
+        elif not show and self.empty_shown:
+            self.empty_label.pack_forget()
+        self.empty_shown = show
@@ -0,0 +1,244 @@
+# utils/audio.py
+"""
+Non-blocking tone playback.
+
+Tones are synthesized once into in-memory WAV buffers and handed to a sink
+on a background thread, so playing one never stalls the Tk mainloop.
+Sinks cover Windows (winsound), Linux (aplay), headless runs (WAV files)
+and silence.
+"""
+import atexit
+import io
+import math
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import wave
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import AUDIO_SINK, AUDIO_WAV_DIR
+
+SAMPLE_RATE = 22050
+FADE_MS = 5
+
+
+def synthesize_tone(frequency, duration_ms, sample_rate=SAMPLE_RATE, volume=0.4):
+    """
+    Renders a sine tone as 16-bit mono PCM.
+
+    The first and last FADE_MS are ramped so the tone starts and stops
+    without a click.
+
+    Args:
+        frequency (float): Pitch in Hz.
+        duration_ms (int): Length in milliseconds.
+        sample_rate (int): Samples per second.
+        volume (float): Peak amplitude, 0..1.
+
+    Returns:
+        bytes: Little-endian signed 16-bit samples.
+    """
+    count = int(sample_rate * duration_ms / 1000)
+    fade = max(1, min(count // 2, int(sample_rate * FADE_MS / 1000)))
+    step = 2 * math.pi * frequency / sample_rate
+    peak = 32767 * volume
+    samples = array('h', bytes(2 * count))
+    for i in range(count):
+        ramp = min(1.0, i / fade, (count - 1 - i) / fade)
+        samples[i] = int(peak * ramp * math.sin(step * i))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def wav_bytes(pcm, sample_rate=SAMPLE_RATE):
+    """Wraps 16-bit mono PCM in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        out.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class NullSink:
+    """Discards tones. Used when no audio device is available."""
+
+    name = "null"
+
+    def play(self, wav, label):
+        pass
+
+
+class WavFileSink:
+    """Writes every played tone to a numbered .wav file, for headless runs."""
+
+    name = "wav"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def play(self, wav, label):
+        self.count += 1
+        path = os.path.join(self.directory, f"{self.count:05d}_{label}.wav")
+        with open(path, 'wb') as f:
+            f.write(wav)
+
+
+class WinsoundSink:
+    """Plays through winsound from memory. Blocks the calling (audio) thread."""
+
+    name = "winsound"
+
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+
+    def play(self, wav, label):
+        self.winsound.PlaySound(wav, self.winsound.SND_MEMORY | self.winsound.SND_NODEFAULT)
+
+
+class AplaySink:
+    """Pipes tones into ALSA's aplay."""
+
+    name = "aplay"
+
+    def __init__(self, command="aplay"):
+        self.command = [command, "-q", "-"]
+
+    def play(self, wav, label):
+        subprocess.run(self.command, input=wav, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+
+
+def default_sink(kind=AUDIO_SINK, wav_dir=AUDIO_WAV_DIR):
+    """
+    Builds the sink named by ``kind``.
+
+    Args:
+        kind (str): "auto", "winsound", "aplay", "wav" or "null". "auto" picks
+            winsound on Windows, aplay when installed, and null otherwise.
+        wav_dir (str): Output directory for the "wav" sink.
+
+    Returns:
+        An object with ``play(wav, label)``.
+    """
+    if kind == "wav":
+        return WavFileSink(wav_dir)
+    if kind in ("auto", "winsound") and sys.platform == "win32":
+        return WinsoundSink()
+    if kind in ("auto", "aplay") and shutil.which("aplay"):
+        return AplaySink()
+    return NullSink()
+
+
+class TonePlayer:
+    """
+    Plays cached tones on a background thread.
+
+    ``play`` only looks up a prebuilt buffer and enqueues it, so callers on
+    the Tk thread return immediately. If tones are requested faster than
+    the sink can play them, the oldest pending ones are dropped rather than
+    letting the queue lag further and further behind the screen.
+    """
+
+    def __init__(self, sink=None, sample_rate=SAMPLE_RATE, max_pending=2):
+        """
+        Args:
+            sink: Object with ``play(wav, label)``; default_sink() when None.
+            sample_rate (int): Sample rate for synthesized tones.
+            max_pending (int): Queued tones kept before older ones are dropped.
+        """
+        self.sink = sink if sink is not None else default_sink()
+        self.sample_rate = sample_rate
+        self.tones = {}
+        self.played = 0
+        self.dropped = 0
+        self.max_synth_ms = 0.0
+        self._queue = queue.Queue(max_pending)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def tone(self, frequency, duration_ms):
+        """WAV buffer for a tone, synthesizing it on first use."""
+        key = (frequency, duration_ms)
+        wav = self.tones.get(key)
+        if wav is None:
+            start = time.perf_counter()
+            wav = wav_bytes(synthesize_tone(frequency, duration_ms, self.sample_rate), self.sample_rate)
+            self.max_synth_ms = max(self.max_synth_ms, (time.perf_counter() - start) * 1000)
+            self.tones[key] = wav
+        return wav
+
+    def preload(self, tones):
+        """Synthesizes (frequency, duration_ms) pairs ahead of time."""
+        for frequency, duration_ms in tones:
+            self.tone(frequency, duration_ms)
+
+    def play(self, frequency, duration_ms):
+        """Queues a tone and returns immediately."""
+        item = (self.tone(frequency, duration_ms), f"{frequency}hz_{duration_ms}ms")
+        self._ensure_thread()
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="tone-player", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            wav, label = item
+            try:
+                self.sink.play(wav, label)
+                self.played += 1
+            except Exception as e:
+                print(f"Audio playback error: {e}")
+
+    def stop(self):
+        """Stops the playback thread after the tone in progress."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            while True:
+                try:
+                    self._queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        self._queue.get_nowait()
+                    except queue.Empty:
+                        pass
+            thread.join(timeout=1.0)
+
+
+_player_instance = None
+
+def get_tone_player():
+    global _player_instance
+    if _player_instance is None:
+        _player_instance = TonePlayer()
+        atexit.register(_player_instance.stop)
+    return _player_instance
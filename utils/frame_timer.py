@@ -0,0 +1,79 @@
+# utils/frame_timer.py
+from typing import Dict
+
+
+class FrameTimeHistogram:
+    """
+    Fixed-bucket histogram of frame costs.
+
+    Samples are counted into 0.1 ms buckets up to ``max_ms``, with one
+    overflow bucket, so recording is O(1) and memory is constant however
+    long the session runs.
+    """
+
+    BUCKET_MS = 0.1
+
+    def __init__(self, max_ms: float = 100.0):
+        """
+        Args:
+            max_ms: Upper bound of the bucketed range in milliseconds.
+        """
+        self.max_ms = max_ms
+        self.buckets = [0] * (int(max_ms / self.BUCKET_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_seen_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Adds one sample, given in seconds."""
+        ms = seconds * 1000.0
+        index = min(int(ms / self.BUCKET_MS), len(self.buckets) - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_seen_ms:
+            self.max_seen_ms = ms
+
+    def percentile(self, p: float) -> float:
+        """
+        Approximate percentile in milliseconds.
+
+        Args:
+            p: Percentile between 0 and 100.
+
+        Returns:
+            Upper edge of the bucket holding the percentile, 0.0 if empty.
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                if i == len(self.buckets) - 1:
+                    return self.max_seen_ms
+                return (i + 1) * self.BUCKET_MS
+        return self.max_seen_ms
+
+    def mean(self) -> float:
+        """Mean sample in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        """Drops all samples."""
+        self.buckets = [0] * len(self.buckets)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_seen_ms = 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """count, mean, p50, p99 and max in milliseconds."""
+        return {
+            'count': self.count,
+            'mean': self.mean(),
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'max': self.max_seen_ms,
+        }
+
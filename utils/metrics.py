@@ -0,0 +1,378 @@
+# utils/metrics.py
+"""
+In-process metrics: counters, gauges and histograms with Prometheus text export.
+
+Updates are cheap enough for hot paths. Counters and histograms keep one
+shard per thread, written only by that thread, so recording a value takes
+no lock; shards are summed when the registry is rendered. Gauges hold one
+value per label set and take a lock only for ``inc``/``dec``.
+
+``MetricsExporter`` renders the registry every few seconds to a text file
+(for node_exporter's textfile collector or any file scraper) and/or serves
+it over HTTP at ``/metrics`` for Prometheus to scrape.
+"""
+import atexit
+import bisect
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from config.settings import (METRICS_FILE, METRICS_PORT, METRICS_HOST, METRICS_INTERVAL_S)
+
+# Seconds; suits anything from a DB statement to a login (bcrypt)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base for the metric types: a name, help text and label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=()):
+        """
+        Args:
+            name (str): Metric name, e.g. ``game_hub_logins_total``.
+            help_text (str): One-line description for the exposition.
+            labelnames (tuple): Label names; values are given per update.
+        """
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self):
+        """Prometheus text lines for this metric."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return lines
+
+    def samples(self):
+        return []
+
+
+class _Sharded(Metric):
+    """A metric whose updates go to a per-thread shard."""
+
+    def __init__(self, name, help_text, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self._local = threading.local()
+        self._shards = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            # Only taken once per thread; shards outlive their threads so counts are kept
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _snapshot(self):
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [list(shard.items()) for shard in shards]
+
+
+class Counter(_Sharded):
+    """A value that only goes up."""
+
+    kind = "counter"
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        shard = self._shard()
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def values(self):
+        """dict: Label values -> total across threads."""
+        totals = {}
+        for items in self._snapshot():
+            for key, value in items:
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def value(self, **labels):
+        return self.values().get(self._key(labels), 0.0)
+
+    def samples(self):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(self.values().items())]
+
+
+class Gauge(Metric):
+    """A value that is set, or moved up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def set(self, value, **labels):
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount=1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(list(self._values.items()))]
+
+
+class Histogram(_Sharded):
+    """Observations counted into fixed buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets (tuple): Upper bounds, ascending; +Inf is implied.
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        shard = self._shard()
+        cell = shard.get(key)
+        if cell is None:
+            # [count per bucket (last is +Inf), sum, count]
+            cell = shard[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        cell[0][bisect.bisect_left(self.buckets, value)] += 1
+        cell[1] += value
+        cell[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes how long the enclosed block took, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def values(self):
+        """dict: Label values -> (bucket counts, sum, count) across threads."""
+        merged = {}
+        for items in self._snapshot():
+            for key, (counts, total, count) in items:
+                entry = merged.get(key)
+                if entry is None:
+                    merged[key] = [list(counts), total, count]
+                else:
+                    entry[0] = [a + b for a, b in zip(entry[0], counts)]
+                    entry[1] += total
+                    entry[2] += count
+        return merged
+
+    def count(self, **labels):
+        entry = self.values().get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def samples(self):
+        lines = []
+        for key, (counts, total, count) in sorted(self.values().items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = ("le", _format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics, created on first use and rendered together."""
+
+    def __init__(self):
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as a different {metric.kind}")
+            return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._get(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._get(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self.metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Writes the rendered metrics to ``path``, replacing it atomically."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+class MetricsExporter:
+    """Publishes a registry to a text file on a timer and/or over HTTP."""
+
+    def __init__(self, registry, path=None, port=None, host="127.0.0.1", interval_s=15.0):
+        """
+        Args:
+            registry (MetricsRegistry): Metrics to publish.
+            path (str): Text file rewritten every ``interval_s``; None for none.
+            port (int): Port to serve ``/metrics`` on; None or 0 for no server.
+            host (str): Interface the server listens on.
+            interval_s (float): Seconds between file writes.
+        """
+        self.registry = registry
+        self.path = path
+        self.port = port
+        self.host = host
+        self.interval_s = interval_s
+        self.server = None
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        if self.path:
+            thread = threading.Thread(target=self._write_loop, name="metrics-file", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if self.port:
+            # Imported here: http.server is slow to load and only needed with a port
+            from http.server import ThreadingHTTPServer
+            try:
+                self.server = ThreadingHTTPServer((self.host, self.port), self._handler())
+            except OSError as e:
+                print(f"Metrics endpoint unavailable on {self.host}:{self.port}: {e}")
+                return
+            self.server.daemon_threads = True
+            thread = threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _handler(self):
+        from http.server import BaseHTTPRequestHandler
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _write_loop(self):
+        while True:
+            self.write_now()
+            if self._stop.wait(self.interval_s):
+                return
+
+    def write_now(self):
+        if not self.path:
+            return
+        try:
+            self.registry.write_textfile(self.path)
+        except OSError as e:
+            print(f"Error writing metrics to {self.path}: {e}")
+
+    def stop(self):
+        """Stops the server and writes the file one last time."""
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        self.write_now()
+
+
+# Singleton instances
+_registry_instance = None
+_exporter_instance = None
+
+def get_metrics():
+    """The app-wide registry."""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = MetricsRegistry()
+    return _registry_instance
+
+
+def start_metrics_export(path=METRICS_FILE, port=METRICS_PORT):
+    """
+    Starts exporting the app-wide registry if a file or port is configured.
+
+    Returns:
+        MetricsExporter or None: The running exporter, or None when neither is set.
+    """
+    global _exporter_instance
+    if _exporter_instance is None and (path or port):
+        _exporter_instance = MetricsExporter(get_metrics(), path=path, port=port,
+                                             host=METRICS_HOST, interval_s=METRICS_INTERVAL_S)
+        _exporter_instance.start()
+        atexit.register(_exporter_instance.stop)
+    return _exporter_instance
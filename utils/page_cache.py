@@ -0,0 +1,57 @@
+# utils/page_cache.py
+from collections import OrderedDict
+
+
+class PageCache:
+    """
+    Rows of a long result set, held as a bounded number of fixed-size pages.
+
+    Pages are evicted least recently used first, so memory depends on
+    ``page_size * max_pages`` and not on how many rows the result has.
+    """
+
+    def __init__(self, page_size=200, max_pages=6):
+        """
+        Args:
+            page_size (int): Rows per page.
+            max_pages (int): Pages kept before the least recently used is dropped.
+        """
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = OrderedDict()
+
+    def __len__(self):
+        return len(self.pages)
+
+    def page_of(self, row):
+        return row // self.page_size
+
+    def get(self, row):
+        """The cached row, or None if its page is not loaded."""
+        page = self.pages.get(row // self.page_size)
+        if page is None:
+            return None
+        self.pages.move_to_end(row // self.page_size)
+        offset = row % self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def has_page(self, page):
+        return page in self.pages
+
+    def put(self, page, rows):
+        """Stores one page of rows, evicting the least recently used page if full."""
+        self.pages[page] = rows
+        self.pages.move_to_end(page)
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+
+    def missing_pages(self, first_row, last_row):
+        """
+        Pages needed to show rows ``first_row`` to ``last_row`` (inclusive)
+        that are not cached.
+        """
+        first, last = first_row // self.page_size, last_row // self.page_size
+        return [p for p in range(first, last + 1) if p not in self.pages]
+
+    def clear(self):
+        self.pages.clear()
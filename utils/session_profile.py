@@ -0,0 +1,208 @@
+# utils/session_profile.py
+"""
+Opt-in profiling of game sessions.
+
+With ``GAME_HUB_PROFILE`` set (see config.settings), every game session is
+run under cProfile and/or tracemalloc from the moment the game is created
+until it closes. Each session leaves a ``.pstats`` file (open it with
+``python -m pstats``) and a ``.allocs.txt`` report of the lines that
+allocated the most memory, named after the game, difficulty and start time.
+
+When profiling is off ``start_session_profile`` returns None and games do
+no profiling work at all.
+"""
+import cProfile
+import os
+import re
+import time
+import tracemalloc
+
+from config.settings import (SESSION_PROFILE, SESSION_PROFILE_DIR, SESSION_PROFILE_TOP,
+                             SESSION_PROFILE_FRAMES)
+
+PSTATS_SUFFIX = ".pstats"
+ALLOCS_SUFFIX = ".allocs.txt"
+
+
+def profile_modes(value):
+    """
+    Parses a profiling setting.
+
+    Args:
+        value (str): "cpu", "mem", both comma-separated, "all"/"1", or empty.
+
+    Returns:
+        frozenset: The enabled modes out of {"cpu", "mem"}.
+    """
+    modes = set()
+    for part in (value or "").lower().replace(" ", "").split(","):
+        if part in ("1", "all", "true", "on"):
+            modes.update(("cpu", "mem"))
+        elif part in ("cpu", "mem"):
+            modes.add(part)
+    return frozenset(modes)
+
+
+def slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "-", str(text)).strip("-") or "none"
+
+
+class SessionProfiler:
+    """cProfile and/or tracemalloc around one game session."""
+
+    def __init__(self, game_name, modes, out_dir=SESSION_PROFILE_DIR, top=SESSION_PROFILE_TOP):
+        """
+        Args:
+            game_name (str): Game being profiled; used in the report names.
+            modes (frozenset): "cpu" for cProfile, "mem" for tracemalloc.
+            out_dir (str): Directory the reports are written to.
+            top (int): Allocation sites listed in the memory report.
+        """
+        self.game_name = game_name
+        self.modes = modes
+        self.out_dir = out_dir
+        self.top = top
+        self.started_at = time.time()
+        self.profile = None
+        self.started_tracing = False
+        self.first_snapshot = None
+        self.last_snapshot = None
+        self.peak_bytes = 0
+        self.duration = 0.0
+        self._start = 0.0
+
+    def start(self):
+        """Starts collecting. A mode that cannot start is reported and skipped."""
+        self._start = time.perf_counter()
+        if "mem" in self.modes:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(SESSION_PROFILE_FRAMES)
+                self.started_tracing = True
+            # reset_peak is 3.9+; on 3.8 the peak counts from when tracing started
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            self.first_snapshot = tracemalloc.take_snapshot()
+        if "cpu" in self.modes:
+            self.profile = cProfile.Profile()
+            try:
+                self.profile.enable()
+            except ValueError as e:
+                # Another profiler is already active on this interpreter
+                print(f"CPU profiling unavailable for {self.game_name}: {e}")
+                self.profile = None
+
+    def stop(self):
+        """
+        Stops collecting. Cheap enough for the Tk thread; the reports are
+        built by ``write``, which can run elsewhere.
+        """
+        self.duration = time.perf_counter() - self._start
+        if self.profile:
+            self.profile.disable()
+        if self.first_snapshot is not None:
+            self.last_snapshot = tracemalloc.take_snapshot()
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if self.started_tracing:
+                tracemalloc.stop()
+
+    def base_name(self, difficulty=None):
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        return f"{slug(self.game_name)}_{slug(difficulty)}_{stamp}"
+
+    def write(self, difficulty=None):
+        """
+        Writes the reports for a stopped session.
+
+        Args:
+            difficulty (str): Difficulty played, if the game has one.
+
+        Returns:
+            list: Paths of the files written.
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, self.base_name(difficulty))
+        paths = []
+        if self.profile:
+            self.profile.dump_stats(base + PSTATS_SUFFIX)
+            paths.append(base + PSTATS_SUFFIX)
+        if self.last_snapshot is not None:
+            with open(base + ALLOCS_SUFFIX, "w", encoding="utf-8") as f:
+                f.write(self.format_allocations(difficulty))
+            paths.append(base + ALLOCS_SUFFIX)
+        if paths:
+            print(f"Profiled {self.game_name} ({self.duration:.1f}s): " + ", ".join(paths))
+        return paths
+
+    def format_allocations(self, difficulty=None):
+        """Allocation sites that grew most during the session, then the largest live ones."""
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        first = self.first_snapshot.filter_traces(ignore)
+        last = self.last_snapshot.filter_traces(ignore)
+        lines = [
+            f"Game: {self.game_name}",
+            f"Difficulty: {difficulty or '-'}",
+            f"Started: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at))}",
+            f"Duration: {self.duration:.1f}s",
+            f"Peak traced memory: {self.peak_bytes / 1024:.1f} KiB",
+            "",
+            f"Top {self.top} allocation sites by growth during the session:",
+        ]
+        for stat in last.compare_to(first, "lineno")[:self.top]:
+            lines.append(f"  {stat}")
+        lines.append("")
+        lines.append(f"Top {self.top} allocation sites alive at close:")
+        for stat in last.statistics("lineno")[:self.top]:
+            lines.append(f"  {stat}")
+        return "\n".join(lines) + "\n"
+
+
+def start_session_profile(game_name, setting=None):
+    """
+    Starts profiling a game session if profiling is enabled.
+
+    Args:
+        game_name (str): Game being started.
+        setting (str): Overrides SESSION_PROFILE.
+
+    Returns:
+        SessionProfiler or None: The running profiler, or None when off.
+    """
+    modes = profile_modes(SESSION_PROFILE if setting is None else setting)
+    if not modes:
+        return None
+    profiler = SessionProfiler(game_name, modes)
+    profiler.start()
+    return profiler
+
+
+def list_profiles(out_dir=SESSION_PROFILE_DIR, limit=50):
+    """
+    Captured sessions, newest first.
+
+    Returns:
+        list: Dicts with 'name', 'game', 'difficulty', 'started' and 'files'
+        (report paths).
+    """
+    if not os.path.isdir(out_dir):
+        return []
+    sessions = {}
+    for filename in os.listdir(out_dir):
+        for suffix in (PSTATS_SUFFIX, ALLOCS_SUFFIX):
+            if filename.endswith(suffix):
+                stem = filename[:-len(suffix)]
+                sessions.setdefault(stem, []).append(os.path.join(out_dir, filename))
+    profiles = []
+    for stem, files in sessions.items():
+        parts = stem.rsplit("_", 2)
+        if len(parts) != 3:
+            continue
+        game, difficulty, stamp = parts
+        profiles.append({
+            'name': stem,
+            'game': game.replace("-", " "),
+            'difficulty': None if difficulty == "none" else difficulty,
+            'started': stamp,
+            'files': sorted(files),
+        })
+    profiles.sort(key=lambda p: p['started'], reverse=True)
+    return profiles[:limit]
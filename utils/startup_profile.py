@@ -0,0 +1,145 @@
+# utils/startup_profile.py
+"""
+Startup profiling for ``main.py --profile-startup``.
+
+Records named phases (imports, window creation, first paint, database
+initialization) against the time the profiler was created, and optionally
+times every module imported while it is active, so a report can show which
+imports dominate startup.
+"""
+import builtins
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ImportTimer:
+    """
+    Times imports made through ``import`` statements while installed.
+
+    Each module imported for the first time gets its cumulative time and its
+    self time (cumulative minus the first-time imports it triggered), like
+    ``python -X importtime`` but collected in-process. Only imports on the
+    thread that installed the timer are timed.
+    """
+
+    def __init__(self):
+        self.cumulative_ms = {}
+        self.self_ms = {}
+        self.parents = {}
+        self._stack = []
+        self._original = None
+        self._thread_id = None
+
+    def install(self):
+        if self._original is None:
+            self._thread_id = threading.get_ident()
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Relative and already-loaded imports are not timed
+        if level or name in sys.modules or threading.get_ident() != self._thread_id:
+            return self._original(name, globals, locals, fromlist, level)
+        self.parents.setdefault(name, self._stack[-1][0] if self._stack else None)
+        self._stack.append([name, 0.0])
+        start = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            _, children = self._stack.pop()
+            self.cumulative_ms[name] = self.cumulative_ms.get(name, 0.0) + elapsed
+            self.self_ms[name] = self.self_ms.get(name, 0.0) + elapsed - children
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def top_level(self):
+        """Modules imported directly by the profiled code, slowest first."""
+        roots = [name for name, parent in self.parents.items() if parent is None]
+        return sorted(((name, self.cumulative_ms[name]) for name in roots), key=lambda x: -x[1])
+
+    def slowest(self, count=10):
+        """(module, self ms) for the modules that cost the most themselves."""
+        return sorted(self.self_ms.items(), key=lambda x: -x[1])[:count]
+
+
+class StartupProfiler:
+    """Phase timings relative to the profiler's creation."""
+
+    def __init__(self, time_imports=True):
+        """
+        Args:
+            time_imports (bool): Install an ImportTimer until finish() is called.
+        """
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.marks = {}
+        self.imports = ImportTimer() if time_imports else None
+        if self.imports:
+            self.imports.install()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """Times the enclosed block as one phase."""
+        start = self.elapsed_ms()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, self.elapsed_ms() - start))
+
+    def record(self, name, start_ms, duration_ms):
+        """Adds a phase measured elsewhere (e.g. on another thread)."""
+        self.phases.append((name, start_ms, duration_ms))
+
+    def mark(self, name):
+        """Records the time a milestone was reached, e.g. first paint."""
+        self.marks[name] = self.elapsed_ms()
+
+    def finish(self):
+        """Stops timing imports."""
+        if self.imports:
+            self.imports.uninstall()
+
+    def report(self):
+        """
+        Returns:
+            dict: Phases, marks and import breakdown, all in milliseconds.
+        """
+        data = {
+            'phases': [{'name': n, 'start_ms': round(s, 2), 'ms': round(d, 2)} for n, s, d in self.phases],
+            'marks': {k: round(v, 2) for k, v in self.marks.items()},
+        }
+        if self.imports:
+            data['imports'] = [{'module': m, 'ms': round(ms, 2)} for m, ms in self.imports.top_level()]
+            data['slowest_imports'] = [{'module': m, 'self_ms': round(ms, 2)} for m, ms in self.imports.slowest()]
+        return data
+
+    def format_report(self):
+        """Human-readable report, followed by one ``startup-json:`` line for scripts."""
+        data = self.report()
+        lines = ["Startup profile", "=" * 50]
+        for phase in sorted(data['phases'], key=lambda p: p['start_ms']):
+            lines.append(f"{phase['name']:<28} {phase['start_ms']:9.1f} ms  +{phase['ms']:8.1f} ms")
+        for name, at in sorted(data['marks'].items(), key=lambda x: x[1]):
+            lines.append(f"{name:<28} {at:9.1f} ms")
+        if self.imports:
+            lines.append("-" * 50)
+            lines.append("Imports (cumulative):")
+            for entry in data['imports']:
+                lines.append(f"  {entry['module']:<30} {entry['ms']:8.1f} ms")
+            lines.append("Slowest modules (self):")
+            for entry in data['slowest_imports']:
+                lines.append(f"  {entry['module']:<30} {entry['self_ms']:8.1f} ms")
+        lines.append("startup-json: " + json.dumps(data))
+        return "\n".join(lines)
@@ -0,0 +1,160 @@
+"""
+Per-keystroke timing capture and compact typing analytics.
+
+A session records every keystroke into preallocated arrays, then folds them
+into per-letter and per-bigram latency totals that are stored as a single
+zlib-compressed blob, so a session costs one row however long it runs.
+"""
+import json
+import time
+import zlib
+from array import array
+
+BACKSPACE = 0
+
+# Gaps longer than this are pauses, not typing latency
+MAX_INTERVAL_S = 2.0
+
+BLOB_VERSION = 1
+
+
+class KeystrokeLog:
+    """Append-only keystroke buffer backed by preallocated typed arrays."""
+
+    def __init__(self, capacity=4096):
+        """
+        Args:
+            capacity (int): Initial number of keystroke slots; doubles when full.
+        """
+        self.times = array('d', bytes(8 * capacity))
+        self.codes = array('B', bytes(capacity))   # ASCII code, BACKSPACE for backspace
+        self.errors = array('B', bytes(capacity))  # 1 if the key made the input invalid
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        extra = len(self.codes)
+        self.times.extend(array('d', bytes(8 * extra)))
+        self.codes.extend(bytes(extra))
+        self.errors.extend(bytes(extra))
+
+    def record(self, char, error=False, timestamp=None):
+        """
+        Records one keystroke.
+
+        Args:
+            char (str): Lowercase letter typed, or None for backspace.
+            error (bool): True if the key produced an invalid input.
+            timestamp (float): perf_counter() value; taken now when omitted.
+        """
+        if self.size == len(self.codes):
+            self._grow()
+        i = self.size
+        self.times[i] = time.perf_counter() if timestamp is None else timestamp
+        self.codes[i] = ord(char) if char else BACKSPACE
+        self.errors[i] = 1 if error else 0
+        self.size += 1
+
+    def clear(self):
+        """Forgets all keystrokes, keeping the allocated arrays."""
+        self.size = 0
+
+    def summarize(self):
+        """
+        Folds the keystrokes into aggregate statistics.
+
+        Returns:
+            dict: Totals plus "letters" (letter -> [count, total_ms, errors])
+            and "bigrams" (two letters -> [count, total_ms]).
+        """
+        letters = {}
+        bigrams = {}
+        keystrokes = errors = backspaces = 0
+        interval_total = 0.0
+        intervals = 0
+        prev_code = None
+        prev_time = None
+
+        for i in range(self.size):
+            code = self.codes[i]
+            t = self.times[i]
+            keystrokes += 1
+            errors += self.errors[i]
+            interval = None if prev_time is None else t - prev_time
+            if interval is not None and interval > MAX_INTERVAL_S:
+                interval = None
+
+            if code == BACKSPACE:
+                backspaces += 1
+            else:
+                ch = chr(code)
+                entry = letters.setdefault(ch, [0, 0.0, 0])
+                entry[2] += self.errors[i]
+                if interval is not None:
+                    ms = interval * 1000
+                    entry[0] += 1
+                    entry[1] += ms
+                    interval_total += ms
+                    intervals += 1
+                    if prev_code not in (None, BACKSPACE):
+                        pair = bigrams.setdefault(chr(prev_code) + ch, [0, 0.0])
+                        pair[0] += 1
+                        pair[1] += ms
+
+            prev_code = code
+            prev_time = t
+
+        return {
+            'keystrokes': keystrokes,
+            'errors': errors,
+            'backspaces': backspaces,
+            'avg_interval_ms': interval_total / intervals if intervals else 0.0,
+            'letters': {k: [v[0], round(v[1], 1), v[2]] for k, v in letters.items()},
+            'bigrams': {k: [v[0], round(v[1], 1)] for k, v in bigrams.items()},
+        }
+
+
+def encode_summary(summary):
+    """Compresses a summary into a storable blob."""
+    payload = json.dumps({'v': BLOB_VERSION, 'letters': summary['letters'],
+                          'bigrams': summary['bigrams']}, separators=(',', ':'))
+    return zlib.compress(payload.encode('ascii'), 9)
+
+
+def decode_summary(blob):
+    """Inverse of encode_summary; returns the letters/bigrams dict."""
+    data = json.loads(zlib.decompress(blob).decode('ascii'))
+    if data.get('v') != BLOB_VERSION:
+        raise ValueError(f"Unsupported typing stats version: {data.get('v')}")
+    return data
+
+
+def slowest_bigrams(blobs, limit=5, min_count=3):
+    """
+    Merges session blobs and ranks bigrams by mean latency.
+
+    Args:
+        blobs (iterable): Encoded session summaries.
+        limit (int): Number of bigrams to return.
+        min_count (int): Ignore bigrams seen fewer times than this.
+
+    Returns:
+        list: (bigram, mean_ms, count) tuples, slowest first.
+    """
+    totals = {}
+    for blob in blobs:
+        try:
+            bigrams = decode_summary(blob)['bigrams']
+        except (ValueError, zlib.error) as e:
+            print(f"Skipping unreadable typing stats: {e}")
+            continue
+        for pair, (count, total_ms) in bigrams.items():
+            entry = totals.setdefault(pair, [0, 0.0])
+            entry[0] += count
+            entry[1] += total_ms
+
+    ranked = [(pair, total / count, count) for pair, (count, total) in totals.items() if count >= min_count]
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    return ranked[:limit]
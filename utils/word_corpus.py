@@ -0,0 +1,286 @@
+# utils/word_corpus.py
+"""
+Indexed word corpus shared by the word games.
+
+Word lists (a JSON list, or a JSON object of category -> list) are compiled
+once into a binary index next to the source file and memory-mapped on load.
+Words are bucketed by (category, length, tier); inside a bucket every word
+has the same length, so the i-th word is a fixed-stride slice and sampling
+never scans or parses the list.
+
+Index layout (little-endian):
+    header   magic, version, bucket count, names length, source size, source mtime
+    names    JSON list of category names
+    buckets  (category, length, tier, count, data offset) per bucket
+    data     ASCII words, bucket after bucket
+"""
+import bisect
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import WORDS_FILE, HANGMAN_WORDS_FILE, HANGMAN_CATEGORIES
+
+MAGIC = b'WCX1'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHHIQQ')
+_BUCKET = struct.Struct('<HBBII')
+
+TIER_COUNT = 3
+DIFFICULTY_TIERS = {"Easy": 0, "Medium": 1, "Hard": 2}
+
+# English letters from most to least frequent
+LETTER_FREQUENCY_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+LETTER_RARITY = {ch: i / 25 for i, ch in enumerate(LETTER_FREQUENCY_ORDER)}
+
+DEFAULT_CATEGORY = ""
+
+
+def word_difficulty(word):
+    """
+    Difficulty score of a word: its length plus a letter-rarity term.
+
+    Args:
+        word (str): Lowercase ASCII word.
+
+    Returns:
+        float: Higher is harder.
+    """
+    rarity = sum(LETTER_RARITY[ch] for ch in word) / len(word)
+    return len(word) + 4 * rarity
+
+
+def _normalize(words):
+    seen = set()
+    for word in words:
+        word = str(word).strip().lower()
+        if word and len(word) < 256 and word.isascii() and word.isalpha() and word not in seen:
+            seen.add(word)
+            yield word
+
+
+def build_index(groups, source_size=0, source_mtime=0):
+    """
+    Compiles category -> words into the binary index format.
+
+    Args:
+        groups (dict): Category name -> iterable of words.
+        source_size (int): Size of the source file, used for staleness checks.
+        source_mtime (int): Source modification time in nanoseconds.
+
+    Returns:
+        bytes: The encoded index.
+    """
+    names = list(groups)
+    cleaned = {name: list(_normalize(words)) for name, words in groups.items()}
+
+    # Tiers are corpus terciles of the difficulty score
+    scores = sorted(word_difficulty(w) for words in cleaned.values() for w in words)
+    cuts = [scores[len(scores) * t // TIER_COUNT] for t in range(1, TIER_COUNT)] if scores else []
+
+    buckets = {}
+    for cat, name in enumerate(names):
+        for word in cleaned[name]:
+            tier = bisect.bisect_right(cuts, word_difficulty(word))
+            buckets.setdefault((cat, len(word), tier), []).append(word)
+
+    names_blob = json.dumps(names).encode('utf-8')
+    offset = _HEADER.size + len(names_blob) + _BUCKET.size * len(buckets)
+    table, data = [], []
+    for (cat, length, tier), words in sorted(buckets.items()):
+        table.append(_BUCKET.pack(cat, length, tier, len(words), offset))
+        data.append(''.join(words).encode('ascii'))
+        offset += length * len(words)
+
+    header = _HEADER.pack(MAGIC, VERSION, len(buckets), len(names_blob), source_size, source_mtime)
+    return b''.join([header, names_blob] + table + data)
+
+
+class WordCorpus:
+    """Read-only view over an encoded index (bytes or a memory map)."""
+
+    def __init__(self, buffer, source_path=None):
+        """
+        Args:
+            buffer (bytes | mmap.mmap): Encoded index.
+            source_path (str): Source file the index was built from, if any.
+        """
+        magic, version, bucket_count, names_len, _, _ = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a word corpus index")
+
+        self.buffer = buffer
+        self.source_path = source_path
+        pos = _HEADER.size
+        self.categories = json.loads(bytes(buffer[pos:pos + names_len]).decode('utf-8'))
+        self._category_ids = {name: i for i, name in enumerate(self.categories)}
+        pos += names_len
+
+        self.buckets = [_BUCKET.unpack_from(buffer, pos + i * _BUCKET.size) for i in range(bucket_count)]
+
+        # Cumulative counts per (category, tier) selection; None means "any"
+        keys = set()
+        for cat_index, _, tier, _, _ in self.buckets:
+            keys.update(((None, None), (cat_index, None), (None, tier), (cat_index, tier)))
+        self._cumulative = {}
+        for key in keys:
+            total, cumulative, members = 0, [], []
+            for bucket in self.buckets:
+                if (key[0] is None or bucket[0] == key[0]) and (key[1] is None or bucket[2] == key[1]):
+                    total += bucket[3]
+                    cumulative.append(total)
+                    members.append(bucket)
+            self._cumulative[key] = (cumulative, members)
+
+    def __len__(self):
+        cumulative, _ = self._cumulative.get((None, None), ([], []))
+        return cumulative[-1] if cumulative else 0
+
+    def _category_index(self, category):
+        if category is None:
+            return None
+        try:
+            return self._category_ids[category]
+        except KeyError:
+            raise KeyError(f"Unknown word category: {category}") from None
+
+    def count(self, category=None, tier=None):
+        """Number of words in a category and/or tier."""
+        cumulative, _ = self._cumulative.get((self._category_index(category), tier), ([], []))
+        return cumulative[-1] if cumulative else 0
+
+    def _word_at(self, bucket, index):
+        _, length, _, _, offset = bucket
+        start = offset + index * length
+        return bytes(self.buffer[start:start + length]).decode('ascii')
+
+    def sample(self, tier=None, category=None, rng=random):
+        """
+        Picks a uniformly random word, optionally from one tier and/or category.
+
+        Args:
+            tier (int): 0 (easiest) to TIER_COUNT - 1, or None for any.
+            category (str): Category name, or None for any.
+            rng (random.Random): Random source.
+
+        Returns:
+            str: The word.
+
+        Raises:
+            LookupError: If the selection is empty.
+        """
+        key = (self._category_index(category), tier)
+        cumulative, members = self._cumulative.get(key, ([], []))
+        if not cumulative:
+            raise LookupError(f"No words for category={category!r} tier={tier!r}")
+        r = rng.randrange(cumulative[-1])
+        i = bisect.bisect_right(cumulative, r)
+        return self._word_at(members[i], r - (cumulative[i - 1] if i else 0))
+
+    def words(self, category=None, tier=None, length=None):
+        """Iterates over words, optionally filtered by category, tier and length."""
+        cat_index = self._category_index(category)
+        for bucket in self.buckets:
+            if ((cat_index is None or bucket[0] == cat_index) and (tier is None or bucket[2] == tier)
+                    and (length is None or bucket[1] == length)):
+                for i in range(bucket[3]):
+                    yield self._word_at(bucket, i)
+
+    def category_words(self):
+        """
+        Returns:
+            dict: Category name -> list of words (like HANGMAN_CATEGORIES).
+        """
+        return {name: list(self.words(category=name)) for name in self.categories}
+
+
+def _read_source(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return data
+    return {DEFAULT_CATEGORY: data}
+
+
+def _index_is_fresh(index_path, stat):
+    try:
+        with open(index_path, 'rb') as f:
+            header = f.read(_HEADER.size)
+        magic, version, _, _, size, mtime = _HEADER.unpack(header)
+    except (OSError, struct.error):
+        return False
+    return magic == MAGIC and version == VERSION and size == stat.st_size and mtime == stat.st_mtime_ns
+
+
+def load_corpus(source_path, index_path=None):
+    """
+    Loads a corpus, (re)building its index file if missing or stale.
+
+    Args:
+        source_path (str): JSON word list or category -> words object.
+        index_path (str): Index location; defaults to the source with an .idx suffix.
+
+    Returns:
+        WordCorpus: Memory-mapped when the index file is usable, in-memory otherwise.
+    """
+    index_path = index_path or os.path.splitext(source_path)[0] + '.idx'
+    stat = os.stat(source_path)
+
+    if not _index_is_fresh(index_path, stat):
+        blob = build_index(_read_source(source_path), stat.st_size, stat.st_mtime_ns)
+        try:
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            print(f"Could not write word index {index_path}: {e}")
+            return WordCorpus(blob, source_path)
+
+    with open(index_path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return WordCorpus(buffer, source_path)
+
+
+_corpus_cache = {}
+_corpus_lock = threading.Lock()
+
+
+def get_corpus(source_path):
+    """Process-wide shared corpus for a source file (loaded on first use)."""
+    key = os.path.abspath(source_path)
+    with _corpus_lock:
+        if key not in _corpus_cache:
+            _corpus_cache[key] = load_corpus(key)
+        return _corpus_cache[key]
+
+
+def get_corpus_from_groups(name, groups):
+    """Process-wide shared in-memory corpus built from a category -> words dict."""
+    key = ('groups', name)
+    with _corpus_lock:
+        if key not in _corpus_cache:
+            _corpus_cache[key] = WordCorpus(build_index(groups))
+        return _corpus_cache[key]
+
+
+def get_typing_corpus():
+    """Shared corpus of Typing Defense words (WORDS_FILE)."""
+    return get_corpus(WORDS_FILE)
+
+
+def get_hangman_corpus():
+    """
+    Shared corpus of Hangman categories: HANGMAN_WORDS_FILE when configured,
+    otherwise the built-in HANGMAN_CATEGORIES.
+    """
+    if HANGMAN_WORDS_FILE:
+        return get_corpus(HANGMAN_WORDS_FILE)
+    return get_corpus_from_groups('hangman', HANGMAN_CATEGORIES)
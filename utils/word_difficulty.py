@@ -0,0 +1,413 @@
+# utils/word_difficulty.py
+"""
+Hangman difficulty ratings for every word of a corpus.
+
+Each word is played by a simulated guesser that always picks the letter
+found in the most remaining candidates (the words of the same length that
+fit everything revealed so far). Its wrong guesses, plus a small
+letter-entropy term for words made of rare letters, give the score.
+
+The simulation walks the guesser's decision tree for all words of a length
+at once: every level picks one letter per tree node and splits the nodes by
+where that letter occurs. With NumPy each level is a few array operations
+over per-word position bitmasks; without it the same tree is walked in
+plain Python.
+
+Scores are cached in a sidecar file next to the corpus source. Results are
+stored per word length with a checksum, so after the source changes only
+the lengths whose words changed are simulated again.
+
+Sidecar layout (little-endian):
+    header   magic, version, group count, source size, source mtime
+    groups   (length, word count, crc32 of the words) per length
+    data     per group: float32 score and uint8 misses per word, in sorted word order
+"""
+import math
+import os
+import random
+import struct
+import sys
+import threading
+import zlib
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.word_corpus import LETTER_FREQUENCY_ORDER, get_hangman_corpus
+
+MAGIC = b'WDX1'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHIQQ')
+_GROUP = struct.Struct('<HII')
+
+# Weight of the letter-entropy term next to the simulated wrong guesses
+ENTROPY_WEIGHT = 0.25
+
+# Difficulty bands as (low, high) fractions of a category's words ranked easiest first
+DIFFICULTY_BANDS = {
+    "Easy": (0.0, 1 / 3),
+    "Medium": (1 / 3, 2 / 3),
+    "Hard": (2 / 3, 1.0),
+}
+
+# Words longer than this use the pure-Python simulation (position masks are 64-bit)
+NUMPY_MAX_LENGTH = 63
+
+# Tie-break between equally common letters: the generally more frequent one
+_LETTER_RANK = [LETTER_FREQUENCY_ORDER.index(ch) for ch in "abcdefghijklmnopqrstuvwxyz"]
+
+
+def _simulate_python(words):
+    """Wrong guesses per word (same order as ``words``) for the greedy guesser."""
+    n = len(words)
+    positions = []
+    for word in words:
+        where = {}
+        for pos, ch in enumerate(word):
+            where[ord(ch) - 97] = where.get(ord(ch) - 97, 0) | (1 << pos)
+        positions.append(where)
+
+    misses = [0] * n
+    stack = [(list(range(n)), 0)]
+    while stack:
+        ids, guessed = stack.pop()
+        if len(ids) == 1:
+            continue
+        counts = [0] * 26
+        for i in ids:
+            for letter in positions[i]:
+                counts[letter] += 1
+        letter = max((l for l in range(26) if not guessed >> l & 1),
+                     key=lambda l: (counts[l], -_LETTER_RANK[l]))
+        children = {}
+        for i in ids:
+            key = positions[i].get(letter, 0)
+            if not key:
+                misses[i] += 1
+            children.setdefault(key, []).append(i)
+        for child in children.values():
+            stack.append((child, guessed | 1 << letter))
+    return misses
+
+
+def _simulate_numpy(words):
+    """Vectorized _simulate_python: one pass per tree level over all words."""
+    n, length = len(words), len(words[0])
+    letters = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(n, length) - 97
+    rows = np.arange(n)
+    posmask = np.zeros((n, 26), dtype=np.uint64)
+    for pos in range(length):
+        posmask[rows, letters[:, pos]] |= np.uint64(1 << pos)
+    present = posmask != 0
+
+    tie_break = 25 - np.asarray(_LETTER_RANK)
+    misses = np.zeros(n, dtype=np.int32)
+    active = rows
+    node = np.zeros(n, dtype=np.intp)
+    guessed = np.zeros((1, 26), dtype=bool)
+
+    while active.size:
+        # Drop words alone in their node: the guesser knows them
+        sizes = np.bincount(node, minlength=len(guessed))
+        keep = sizes[node] > 1
+        if not keep.all():
+            active, node = active[keep], node[keep]
+            if not active.size:
+                break
+            used, node = np.unique(node, return_inverse=True)
+            guessed = guessed[used]
+
+        # Words containing each letter, per node
+        word_idx, letter_idx = np.nonzero(present[active])
+        counts = np.bincount(node[word_idx] * 26 + letter_idx, minlength=guessed.size).reshape(guessed.shape)
+        score = counts * 32 + tie_break
+        score[guessed] = -1
+        choice = score.argmax(axis=1)
+
+        key = posmask[active, choice[node]]
+        misses[active[key == 0]] += 1
+
+        # Split every node by where its letter occurs
+        guessed[np.arange(len(guessed)), choice] = True
+        if length <= 32:
+            children, node = np.unique(node.astype(np.uint64) << np.uint64(32) | key, return_inverse=True)
+            parents = children >> np.uint64(32)
+        else:
+            children, node = np.unique(np.stack([node.astype(np.uint64), key], axis=1), axis=0, return_inverse=True)
+            parents = children[:, 0]
+        node = node.ravel()
+        guessed = guessed[parents.astype(np.intp)]
+
+    return misses.tolist()
+
+
+def _entropy_terms(words):
+    """Mean surprise (bits) of each word's distinct letters among words of its length."""
+    n = len(words)
+    letter_sets = [set(w) for w in words]
+    counts = {}
+    for letters in letter_sets:
+        for ch in letters:
+            counts[ch] = counts.get(ch, 0) + 1
+    surprise = {ch: math.log2(n / c) for ch, c in counts.items()}
+    return [sum(surprise[ch] for ch in letters) / len(letters) for letters in letter_sets]
+
+
+def score_words(words, use_numpy=None):
+    """
+    Rates words of one length.
+
+    Args:
+        words (list): Distinct lowercase words, all the same length.
+        use_numpy (bool): Force (True) or disable (False) the NumPy path.
+            Defaults to using NumPy when it is installed.
+
+    Returns:
+        tuple: (scores, misses) lists aligned with ``words``.
+    """
+    if not words:
+        return [], []
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and len(words[0]) <= NUMPY_MAX_LENGTH:
+        misses = _simulate_numpy(words)
+    else:
+        misses = _simulate_python(words)
+    entropy = _entropy_terms(words)
+    scores = [m + ENTROPY_WEIGHT * e for m, e in zip(misses, entropy)]
+    return scores, misses
+
+
+def _group_words(corpus):
+    """Length -> sorted distinct words of the corpus."""
+    groups = {}
+    for word in corpus.words():
+        groups.setdefault(len(word), set()).add(word)
+    return {length: sorted(words) for length, words in sorted(groups.items())}
+
+
+def _checksum(words):
+    return zlib.crc32('\n'.join(words).encode('ascii'))
+
+
+def _read_sidecar(path):
+    """Length -> (crc, scores, misses) from a sidecar file; empty if unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+        magic, version, group_count, _, _ = _HEADER.unpack_from(blob, 0)
+        if magic != MAGIC or version != VERSION:
+            return {}
+        groups, pos = [], _HEADER.size
+        for _ in range(group_count):
+            groups.append(_GROUP.unpack_from(blob, pos))
+            pos += _GROUP.size
+        cached = {}
+        for length, count, crc in groups:
+            scores = array('f')
+            scores.frombytes(blob[pos:pos + 4 * count])
+            misses = blob[pos + 4 * count:pos + 5 * count]
+            if sys.byteorder == 'big':
+                scores.byteswap()
+            cached[length] = (crc, scores, misses)
+            pos += 5 * count
+        return cached
+    except (OSError, struct.error):
+        return {}
+
+
+def _encode_sidecar(results, source_size, source_mtime):
+    table, data = [], []
+    for length, (crc, scores, misses) in sorted(results.items()):
+        table.append(_GROUP.pack(length, len(scores), crc))
+        scores = array('f', scores)
+        if sys.byteorder == 'big':
+            scores.byteswap()
+        data.append(scores.tobytes())
+        data.append(bytes(min(255, m) for m in misses))
+    header = _HEADER.pack(MAGIC, VERSION, len(results), source_size, source_mtime)
+    return b''.join([header] + table + data)
+
+
+def compute_difficulty(corpus, cached=None, use_numpy=None):
+    """
+    Scores every word of a corpus, reusing cached lengths whose words are unchanged.
+
+    Args:
+        corpus (WordCorpus): Words to rate.
+        cached (dict): Length -> (crc, scores, misses) from a previous run.
+        use_numpy (bool): See score_words.
+
+    Returns:
+        tuple: (results, rescored) where results maps length -> (crc, scores,
+        misses) and rescored is the number of lengths that were simulated.
+    """
+    cached = cached or {}
+    results, rescored = {}, 0
+    for length, words in _group_words(corpus).items():
+        crc = _checksum(words)
+        old = cached.get(length)
+        if old is not None and old[0] == crc and len(old[1]) == len(words):
+            results[length] = old
+            continue
+        scores, misses = score_words(words, use_numpy)
+        results[length] = (crc, array('f', scores), bytes(min(255, m) for m in misses))
+        rescored += 1
+    return results, rescored
+
+
+class WordDifficulty:
+    """
+    Per-word difficulty over a corpus, ranked per category.
+
+    Every category keeps its word ids sorted from easiest to hardest, so a
+    word from any band is one ``randrange`` and an index away.
+    """
+
+    def __init__(self, corpus, results):
+        """
+        Args:
+            corpus (WordCorpus): The rated corpus.
+            results (dict): Length -> (crc, scores, misses), as from compute_difficulty.
+        """
+        self.corpus = corpus
+        by_word = {}
+        for length, words in _group_words(corpus).items():
+            _, scores, misses = results[length]
+            for word, score, miss in zip(words, scores, misses):
+                by_word[word] = (score, miss)
+
+        self.words = []
+        self.scores = array('f')
+        self.misses = bytearray()
+        members = {}
+        for category in corpus.categories:
+            ids = members.setdefault(category, array('I'))
+            for word in corpus.words(category=category):
+                score, miss = by_word[word]
+                ids.append(len(self.words))
+                self.words.append(word)
+                self.scores.append(score)
+                self.misses.append(miss)
+
+        key = lambda i: (self.scores[i], i)
+        self._ranked = {category: array('I', sorted(ids, key=key)) for category, ids in members.items()}
+        self._ranked[None] = array('I', sorted(range(len(self.words)), key=key))
+
+    def __len__(self):
+        return len(self.words)
+
+    def ranked(self, category=None):
+        """Word ids of a category (or all) from easiest to hardest."""
+        try:
+            return self._ranked[category]
+        except KeyError:
+            raise KeyError(f"Unknown word category: {category}") from None
+
+    def band_range(self, band, category=None):
+        """(start, stop) positions of a band in ranked(category)."""
+        low, high = DIFFICULTY_BANDS[band]
+        count = len(self.ranked(category))
+        start = min(int(low * count), max(0, count - 1))
+        return start, max(start + 1, int(high * count))
+
+    def sample(self, band=None, category=None, rng=random):
+        """
+        Draws a word from a difficulty band in O(1).
+
+        Args:
+            band (str): Key of DIFFICULTY_BANDS, or None for any difficulty.
+            category (str): Category name, or None for any.
+            rng (random.Random): Random source.
+
+        Returns:
+            str: The word.
+
+        Raises:
+            LookupError: If the category has no words.
+        """
+        ranked = self.ranked(category)
+        if not ranked:
+            raise LookupError(f"No words for category={category!r}")
+        start, stop = self.band_range(band, category) if band else (0, len(ranked))
+        return self.words[ranked[rng.randrange(start, stop)]]
+
+
+def sidecar_path_for(source_path):
+    return os.path.splitext(source_path)[0] + '.wdx'
+
+
+def load_difficulty(corpus, sidecar_path=None, use_numpy=None):
+    """
+    Loads word difficulty for a corpus, (re)computing it as needed.
+
+    File-backed corpora are cached in a sidecar next to their source; only
+    lengths whose words changed since it was written are simulated again.
+    In-memory corpora are scored directly.
+
+    Args:
+        corpus (WordCorpus): Corpus to rate.
+        sidecar_path (str): Cache location; defaults to the source with a .wdx suffix.
+        use_numpy (bool): See score_words.
+
+    Returns:
+        WordDifficulty: The ratings.
+    """
+    if corpus.source_path is None:
+        results, _ = compute_difficulty(corpus, use_numpy=use_numpy)
+        return WordDifficulty(corpus, results)
+
+    sidecar_path = sidecar_path or sidecar_path_for(corpus.source_path)
+    stat = os.stat(corpus.source_path)
+    cached = _read_sidecar(sidecar_path)
+    results, rescored = compute_difficulty(corpus, cached, use_numpy)
+    if rescored or set(results) != set(cached):
+        try:
+            tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_encode_sidecar(results, stat.st_size, stat.st_mtime_ns))
+            os.replace(tmp_path, sidecar_path)
+        except OSError as e:
+            print(f"Could not write word difficulty cache {sidecar_path}: {e}")
+    return WordDifficulty(corpus, results)
+
+
+_difficulty_cache = {}
+_difficulty_lock = threading.Lock()
+
+
+def get_difficulty(corpus):
+    """Process-wide shared ratings for a corpus (computed on first use)."""
+    with _difficulty_lock:
+        if id(corpus) not in _difficulty_cache:
+            _difficulty_cache[id(corpus)] = load_difficulty(corpus)
+        return _difficulty_cache[id(corpus)]
+
+
+def get_hangman_difficulty():
+    """Shared ratings for the Hangman corpus."""
+    return get_difficulty(get_hangman_corpus())
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from utils.word_corpus import load_corpus
+
+    parser = argparse.ArgumentParser(description="Precompute the word difficulty sidecar for a corpus")
+    parser.add_argument("source", help="JSON word list or category -> words object")
+    parser.add_argument("--no-numpy", action="store_true", help="use the pure-Python simulation")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.source)
+    start = time.perf_counter()
+    ratings = load_difficulty(corpus, use_numpy=False if args.no_numpy else None)
+    print(f"Rated {len(ratings)} words in {time.perf_counter() - start:.2f}s "
+          f"-> {sidecar_path_for(args.source)}")